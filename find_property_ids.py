@@ -6,99 +6,185 @@ This script helps you find the property IDs for your Notion databases.
 
 import os
 import sys
-from notion_client import Client
-from dotenv import load_dotenv
+import json
+import time
+import random
+import argparse
+from concurrent.futures import ThreadPoolExecutor
 
-# Load environment variables
-load_dotenv()
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None
 
-def find_property_ids(database_id: str, database_name: str):
-    """Find and display property IDs for a Notion database."""
+# Schemas are cached on disk so repeated runs while filling in
+# property_config.py don't hit the Notion API every time
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'notion-music-sync')
+CACHE_TTL = 3600  # seconds
+
+# Retries for rate-limited (429) or failed (5xx) retrieves
+MAX_RETRIES = 5
+
+SEPARATOR = "-" * 40
+
+DATABASES = (
+    ("Artists", 'NOTION_ARTISTS_DATABASE_ID'),
+    ("Albums", 'NOTION_ALBUMS_DATABASE_ID'),
+    ("Songs", 'NOTION_SONGS_DATABASE_ID'),
+    ("Labels", 'NOTION_LABELS_DATABASE_ID'),
+)
+
+def _retrieve_with_retry(client, database_id: str) -> dict:
+    """Call databases.retrieve, backing off on rate limits and server errors."""
+    from notion_client.errors import HTTPResponseError, RequestTimeoutError
     
-    notion_token = os.getenv('NOTION_TOKEN')
+    for attempt in range(MAX_RETRIES + 1):
+        try:
+            return client.databases.retrieve(database_id)
+        except (HTTPResponseError, RequestTimeoutError) as e:
+            status = getattr(e, 'status', None)
+            if attempt == MAX_RETRIES or (status is not None and status != 429 and status < 500):
+                raise
+            if status == 429:
+                # Notion tells us how long to wait
+                try:
+                    wait_time = float(e.headers.get('retry-after', 1))
+                except ValueError:
+                    wait_time = 1.0
+            else:
+                wait_time = min(2 ** attempt + random.random(), 32)
+            time.sleep(wait_time)
+
+def retrieve_database(client, database_id: str, refresh: bool = False) -> dict:
+    """Retrieve a database schema, using the on-disk cache when it is fresh."""
+    cache_path = os.path.join(CACHE_DIR, f"db_{database_id}.json")
     
-    if not notion_token:
-        print(f"❌ NOTION_TOKEN not found in environment variables")
-        print("Please add NOTION_TOKEN to your .env file")
-        return False
+    if not refresh:
+        try:
+            if time.time() - os.path.getmtime(cache_path) < CACHE_TTL:
+                with open(cache_path, 'rb') as f:
+                    data = f.read()
+                return orjson.loads(data) if orjson else json.loads(data)
+        except (OSError, ValueError):
+            pass  # Missing, unreadable or corrupt cache file; fetch and rewrite it
     
-    if not database_id:
-        print(f"❌ {database_name} database ID not found")
-        return False
+    database = _retrieve_with_retry(client, database_id)
     
     try:
-        # Initialize Notion client
-        client = Client(auth=notion_token)
-        
-        # Get database information
-        print(f"\n🔍 Fetching {database_name} database information...")
-        database = client.databases.retrieve(database_id)
-        
-        print(f"\n📊 Database: {database.get('title', [{}])[0].get('plain_text', 'Untitled')}")
-        print(f"🆔 Database ID: {database_id}")
-        
-        # Get properties
-        properties = database.get('properties', {})
-        
-        print(f"\n📋 Found {len(properties)} properties:")
-        print("=" * 80)
-        
-        # Display properties with their IDs
-        for prop_key, prop_data in properties.items():
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(cache_path, 'wb') as f:
+            f.write(orjson.dumps(database) if orjson else json.dumps(database).encode('utf-8'))
+    except OSError:
+        pass  # Caching is best-effort
+    
+    return database
+
+def find_property_ids(database: dict, database_id: str, database_name: str):
+    """Display property IDs for a retrieved Notion database."""
+    # A successful retrieve always includes the properties map
+    properties = database['properties']
+    title_arr = database.get('title') or ()
+    title = title_arr[0]['plain_text'] if title_arr else 'Untitled'
+    
+    lines = [
+        f"\n🔍 Fetched {database_name} database information",
+        f"\n📊 Database: {title}",
+        f"🆔 Database ID: {database_id}",
+        f"\n📋 Found {len(properties)} properties:",
+        "=" * 80,
+    ]
+    
+    # Display properties with their IDs
+    for prop_key, prop_data in properties.items():
+        # Notion always returns name/type/id for schema properties
+        try:
+            prop_name = prop_data['name']
+            prop_type = prop_data['type']
+            prop_id = prop_data['id']
+        except KeyError:
             prop_name = prop_data.get('name', 'Unnamed')
             prop_type = prop_data.get('type', 'unknown')
             prop_id = prop_data.get('id', 'No ID')
-            
-            print(f"Property: {prop_name}")
-            print(f"  Type: {prop_type}")
-            print(f"  Key: {prop_key}")
-            print(f"  ID: {prop_id}")
-            print("-" * 40)
         
-        return True
-        
-    except Exception as e:
-        print(f"❌ Error fetching {database_name}: {e}")
-        return False
+        lines.append(f"Property: {prop_name}\n  Type: {prop_type}\n  Key: {prop_key}\n  ID: {prop_id}\n{SEPARATOR}")
+    
+    # Emit the whole block in one write
+    sys.stdout.write("\n".join(lines) + "\n")
+
+def property_summary(database: dict) -> dict:
+    """Map each property key to its ID, type and name."""
+    return {
+        prop_key: {'id': prop_data['id'], 'type': prop_data['type'], 'name': prop_data['name']}
+        for prop_key, prop_data in database['properties'].items()
+    }
 
 def main():
     """Main function."""
-    print("🎵 Notion MusicBrainz Sync - Property ID Finder")
-    print("=" * 50)
+    parser = argparse.ArgumentParser(description='Find property IDs for your Notion databases')
+    parser.add_argument('--refresh', action='store_true',
+                       help='Ignore cached schemas and fetch fresh ones from Notion')
+    parser.add_argument('--json', action='store_true',
+                       help='Print property IDs as JSON instead of the readable listing')
+    args = parser.parse_args()
     
-    # Get environment variables
-    artists_db = os.getenv('NOTION_ARTISTS_DATABASE_ID')
-    albums_db = os.getenv('NOTION_ALBUMS_DATABASE_ID')
-    songs_db = os.getenv('NOTION_SONGS_DATABASE_ID')
-    labels_db = os.getenv('NOTION_LABELS_DATABASE_ID')
+    # In JSON mode stdout carries only the document; messages go to stderr
+    out = sys.stderr if args.json else sys.stdout
     
-    success = True
+    if not args.json:
+        print("🎵 Notion MusicBrainz Sync - Property ID Finder")
+        print("=" * 50)
     
-    if artists_db:
-        if not find_property_ids(artists_db, "Artists"):
-            success = False
-    else:
-        print("\n⚠️  NOTION_ARTISTS_DATABASE_ID not set, skipping Artists database")
+    # Load environment variables
+    from dotenv import load_dotenv
+    load_dotenv()
     
-    if albums_db:
-        if not find_property_ids(albums_db, "Albums"):
-            success = False
-    else:
-        print("\n⚠️  NOTION_ALBUMS_DATABASE_ID not set, skipping Albums database")
+    notion_token = os.environ.get('NOTION_TOKEN')
+    if not notion_token:
+        print(f"❌ NOTION_TOKEN not found in environment variables", file=out)
+        print("Please add NOTION_TOKEN to your .env file", file=out)
+        sys.exit(1)
     
-    if songs_db:
-        if not find_property_ids(songs_db, "Songs"):
-            success = False
-    else:
-        print("\n⚠️  NOTION_SONGS_DATABASE_ID not set, skipping Songs database")
+    # Imported only once we know we'll talk to Notion; the SDK pulls in httpx
+    from notion_client import Client
     
-    if labels_db:
-        if not find_property_ids(labels_db, "Labels"):
-            success = False
-    else:
-        print("\n⚠️  NOTION_LABELS_DATABASE_ID not set, skipping Labels database")
+    # One client for all retrieves so its connection pool is shared
+    client = Client(auth=notion_token)
+    
+    jobs = []
+    for database_name, env_var in DATABASES:
+        database_id = os.environ.get(env_var)
+        if database_id:
+            jobs.append((database_id, database_name))
+        else:
+            print(f"\n⚠️  {env_var} not set, skipping {database_name} database", file=out)
+    
+    success = True
+    result = {}
+    
+    # Retrieve databases concurrently; print serially so output isn't interleaved.
+    # Three workers keeps us within Notion's ~3 requests/second per integration.
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [executor.submit(retrieve_database, client, database_id, args.refresh) for database_id, _ in jobs]
+        for (database_id, database_name), future in zip(jobs, futures):
+            try:
+                database = future.result()
+            except Exception as e:
+                print(f"❌ Error fetching {database_name}: {e}", file=out)
+                success = False
+                continue
+            if args.json:
+                result[database_name] = property_summary(database)
+            else:
+                find_property_ids(database, database_id, database_name)
     
-    if success:
+    if args.json:
+        if orjson:
+            sys.stdout.buffer.write(orjson.dumps(result, option=orjson.OPT_INDENT_2) + b"\n")
+        else:
+            sys.stdout.write(json.dumps(result, indent=2) + "\n")
+        if not success:
+            sys.exit(1)
+    elif success:
         print("\n📝 Copy the property IDs above to your property_config.py file")
         print("💡 Property IDs are stable and won't change when you rename properties")
         print("\n✅ Property IDs found successfully!")
@@ -7,87 +7,317 @@ Supports three databases: Artists, Albums, and Songs.
 
 import os
 import sys
+import atexit
+import queue
 import logging
 import time
 import argparse
 import re
-from typing import Dict, List, Optional, Union
-from datetime import datetime
+import json
+import functools
+import heapq
+import sqlite3
+import threading
+from itertools import chain, islice
+from collections import OrderedDict
+from logging.handlers import QueueHandler, QueueListener
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Dict, Iterator, List, Optional, Tuple
+from datetime import datetime, timedelta, timezone
+from urllib.parse import urlsplit
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
 from notion_client import Client
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None
+
+try:
+    import h2  # noqa: F401 - enables HTTP/2 in httpx
+    HTTP2_AVAILABLE = True
+except ImportError:  # h2 is optional; Notion requests fall back to HTTP/1.1
+    HTTP2_AVAILABLE = False
+
 # Load environment variables first
 load_dotenv()
 
-# Configure logging
+# Configure logging; records are written to the file and stdout from a background
+# thread so worker threads never block on log I/O
 log_level = os.getenv('LOG_LEVEL', 'INFO').upper()
+log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+log_handlers = [
+    logging.FileHandler('notion_musicbrainz_sync.log'),
+    logging.StreamHandler(sys.stdout)
+]
+for log_handler in log_handlers:
+    log_handler.setFormatter(log_formatter)
+log_queue = queue.Queue(-1)
+log_listener = QueueListener(log_queue, *log_handlers)
+log_listener.start()
+atexit.register(log_listener.stop)
 logging.basicConfig(
     level=getattr(logging, log_level, logging.INFO),
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('notion_musicbrainz_sync.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
+    format='%(message)s',  # Full formatting happens in the listener's handlers
+    handlers=[QueueHandler(log_queue)]
 )
 logger = logging.getLogger(__name__)
 
+class _TitleCharTable(dict):
+    """str.translate table that maps everything but ASCII alphanumerics and whitespace to a space."""
+    
+    def __missing__(self, codepoint: int):
+        # Filled in lazily, so each character is classified once per run
+        char = chr(codepoint)
+        value = codepoint if char.isspace() or (char.isascii() and char.isalnum()) else ' '
+        self[codepoint] = value
+        return value
+
+
+# Characters stripped when comparing titles word-for-word
+TITLE_CHAR_TABLE = _TitleCharTable()
+
+# Classifies an artist's URL relation by host; YouTube Music links match no kind
+ARTIST_LINK_RE = re.compile(
+    r'(?P<youtube_music>music\.youtube\.com)|(?P<instagram>instagram)|(?P<youtube>youtube|youtu\.be)'
+    r'|(?P<bandcamp>bandcamp)|(?P<spotify>spotify)'
+)
+OFFICIAL_WEBSITE_RELATION_TYPES = frozenset(('official homepage', 'official website'))
+LABEL_WEBSITE_RELATION_TYPES = OFFICIAL_WEBSITE_RELATION_TYPES | {'official site'}
+STREAMING_RELATION_TYPES = frozenset(('streaming', 'free streaming'))
+
+# MusicBrainz dates: YYYY, YYYY-MM or YYYY-MM-DD
+PARTIAL_DATE_RE = re.compile(r'(\d{4})(?:-(\d{2}))?(?:-(\d{2}))?')
+
+# Last day of each month, used to sort year-month dates after full dates in that month
+MONTH_END_DAY = {
+    '01': '31', '02': '28', '03': '31', '04': '30', '05': '31', '06': '30',
+    '07': '31', '08': '31', '09': '30', '10': '31', '11': '30', '12': '31',
+}
+
+# Most releases browsed per artist when looking for an album (100 per request)
+MAX_ARTIST_RELEASES = 500
+
+# MusicBrainz responses worth retrying, and the longest Retry-After we will wait out
+RETRY_STATUS_CODES = frozenset((429, 500, 502, 503, 504))
+MAX_RETRY_AFTER = 60.0
+
+# Notion gives every database's title property this fixed ID
+TITLE_PROPERTY_ID = 'title'
+
+# Log sync progress every this many pages (and after the last page)
+PROGRESS_LOG_INTERVAL = 25
+
+# Page icon payloads, built once and shared by every page create/update
+ARTIST_ICON = {'type': 'emoji', 'emoji': '🎤'}  # Microphone
+ALBUM_ICON = {'type': 'emoji', 'emoji': '💿'}  # CD
+SONG_ICON = {'type': 'emoji', 'emoji': '🎵'}  # Musical note
+LABEL_ICON = {'type': 'emoji', 'emoji': '🏷️'}  # Label
+LOCATION_ICON = {'type': 'emoji', 'emoji': '📍'}  # Location pin
+
 # Try to import custom property configuration
 try:
-    from property_config import (
-        # Artists
-        ARTISTS_TITLE_PROPERTY_ID, ARTISTS_MUSICBRAINZ_ID_PROPERTY_ID,
-        ARTISTS_SORT_NAME_PROPERTY_ID, ARTISTS_TYPE_PROPERTY_ID,
-        ARTISTS_GENDER_PROPERTY_ID, ARTISTS_AREA_PROPERTY_ID, ARTISTS_BORN_IN_PROPERTY_ID,
-        ARTISTS_IG_LINK_PROPERTY_ID, ARTISTS_WEBSITE_LINK_PROPERTY_ID,
-        ARTISTS_YOUTUBE_LINK_PROPERTY_ID, ARTISTS_BANDCAMP_LINK_PROPERTY_ID,
-        ARTISTS_STREAMING_LINK_PROPERTY_ID,
-        ARTISTS_COUNTRY_PROPERTY_ID, ARTISTS_BEGIN_DATE_PROPERTY_ID,
-        ARTISTS_END_DATE_PROPERTY_ID, ARTISTS_DISAMBIGUATION_PROPERTY_ID,
-        ARTISTS_DESCRIPTION_PROPERTY_ID, ARTISTS_GENRES_PROPERTY_ID, ARTISTS_TAGS_PROPERTY_ID,
-        ARTISTS_RATING_PROPERTY_ID, ARTISTS_LAST_UPDATED_PROPERTY_ID,
-        ARTISTS_MUSICBRAINZ_URL_PROPERTY_ID, ARTISTS_ALBUMS_PROPERTY_ID,
-        ARTISTS_SONGS_PROPERTY_ID,
-        # Albums
-        ALBUMS_TITLE_PROPERTY_ID, ALBUMS_MUSICBRAINZ_ID_PROPERTY_ID,
-        ALBUMS_ARTIST_PROPERTY_ID, ALBUMS_RELEASE_DATE_PROPERTY_ID,
-        ALBUMS_COUNTRY_PROPERTY_ID, ALBUMS_LABEL_PROPERTY_ID,
-        ALBUMS_TYPE_PROPERTY_ID, ALBUMS_LISTEN_PROPERTY_ID,
-        ALBUMS_STATUS_PROPERTY_ID, ALBUMS_PACKAGING_PROPERTY_ID,
-        ALBUMS_BARCODE_PROPERTY_ID, ALBUMS_FORMAT_PROPERTY_ID,
-        ALBUMS_TRACK_COUNT_PROPERTY_ID, ALBUMS_DESCRIPTION_PROPERTY_ID,
-        ALBUMS_GENRES_PROPERTY_ID, ALBUMS_TAGS_PROPERTY_ID, ALBUMS_RATING_PROPERTY_ID,
-        ALBUMS_COVER_IMAGE_PROPERTY_ID, ALBUMS_MUSICBRAINZ_URL_PROPERTY_ID,
-        ALBUMS_LAST_UPDATED_PROPERTY_ID, ALBUMS_SONGS_PROPERTY_ID,
-        # Songs
-        SONGS_TITLE_PROPERTY_ID, SONGS_MUSICBRAINZ_ID_PROPERTY_ID,
-        SONGS_ARTIST_PROPERTY_ID, SONGS_ALBUM_PROPERTY_ID,
-        SONGS_TRACK_NUMBER_PROPERTY_ID, SONGS_LENGTH_PROPERTY_ID,
-        SONGS_ISRC_PROPERTY_ID, SONGS_DISAMBIGUATION_PROPERTY_ID,
-        SONGS_DESCRIPTION_PROPERTY_ID, SONGS_GENRES_PROPERTY_ID,
-        SONGS_TAGS_PROPERTY_ID, SONGS_LISTEN_PROPERTY_ID,
-        SONGS_RATING_PROPERTY_ID, SONGS_MUSICBRAINZ_URL_PROPERTY_ID,
-        SONGS_LAST_UPDATED_PROPERTY_ID,
-        # Labels
-        LABELS_TITLE_PROPERTY_ID, LABELS_MUSICBRAINZ_ID_PROPERTY_ID,
-        LABELS_TYPE_PROPERTY_ID, LABELS_COUNTRY_PROPERTY_ID,
-        LABELS_BEGIN_DATE_PROPERTY_ID, LABELS_END_DATE_PROPERTY_ID,
-        LABELS_DISAMBIGUATION_PROPERTY_ID, LABELS_DESCRIPTION_PROPERTY_ID,
-        LABELS_GENRES_PROPERTY_ID, LABELS_TAGS_PROPERTY_ID, LABELS_RATING_PROPERTY_ID,
-        LABELS_MUSICBRAINZ_URL_PROPERTY_ID, LABELS_OFFICIAL_WEBSITE_PROPERTY_ID,
-        LABELS_IG_PROPERTY_ID, LABELS_BANDCAMP_PROPERTY_ID, LABELS_FOUNDED_PROPERTY_ID,
-        LABELS_LAST_UPDATED_PROPERTY_ID, LABELS_ALBUMS_PROPERTY_ID, LABELS_AREA_PROPERTY_ID
-    )
+    import property_config
 except ImportError:
     logger.error("property_config.py not found. Please create this file with your property IDs.")
     logger.error("Copy property_config.example.py to property_config.py and update with your property IDs.")
     sys.exit(1)
 
 
+# Logical field names for each database; each maps to <DATABASE>_<FIELD>_PROPERTY_ID in property_config
+ARTISTS_FIELDS = (
+    'title', 'musicbrainz_id', 'sort_name', 'type', 'gender', 'area', 'born_in',
+    'ig_link', 'website_link', 'youtube_link', 'bandcamp_link', 'streaming_link',
+    'country', 'begin_date', 'end_date', 'disambiguation', 'description', 'genres',
+    'tags', 'rating', 'last_updated', 'musicbrainz_url',
+)
+ALBUMS_FIELDS = (
+    'title', 'musicbrainz_id', 'artist', 'release_date', 'country', 'label', 'type',
+    'listen', 'status', 'packaging', 'barcode', 'format', 'track_count', 'description',
+    'genres', 'tags', 'rating', 'cover_image', 'musicbrainz_url', 'last_updated',
+    'songs',
+)
+SONGS_FIELDS = (
+    'title', 'musicbrainz_id', 'artist', 'album', 'track_number', 'length', 'isrc',
+    'disambiguation', 'description', 'genres', 'tags', 'listen', 'rating',
+    'musicbrainz_url', 'last_updated',
+)
+LABELS_FIELDS = (
+    'title', 'musicbrainz_id', 'type', 'country', 'begin_date', 'end_date',
+    'disambiguation', 'description', 'genres', 'tags', 'rating', 'last_updated',
+    'musicbrainz_url', 'official_website', 'ig', 'bandcamp', 'founded', 'albums', 'area',
+)
+
+DATABASE_FIELDS = {
+    'artists': ARTISTS_FIELDS,
+    'albums': ALBUMS_FIELDS,
+    'songs': SONGS_FIELDS,
+    'labels': LABELS_FIELDS,
+}
+
+
+
+def _json_loads(data):
+    """Parse JSON bytes or text, using orjson when it is installed."""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def _json_dumps(value) -> str:
+    """Serialise a value to JSON text, using orjson when it is installed."""
+    return orjson.dumps(value).decode('utf-8') if orjson else json.dumps(value)
+
+
+def _property_ids(prefix: str, fields: tuple) -> Dict[str, Optional[str]]:
+    """Look up the configured property ID for each field, treating missing entries as unset."""
+    return {field: getattr(property_config, f'{prefix}_{field.upper()}_PROPERTY_ID', None) for field in fields}
+
+
+@functools.lru_cache(maxsize=8192)
+def _release_sort_date(date_str: str) -> str:
+    """Expand a MusicBrainz date to YYYY-MM-DD, placing partial dates at the end of their year or month."""
+    parts = date_str.split('-')
+    if len(parts) == 1:
+        # Just year - sorts after all full dates in that year
+        return f"{parts[0]}-12-31"
+    month = parts[1].zfill(2)
+    # Year and month - sorts after all full dates in that month
+    day = parts[2] if len(parts) > 2 else MONTH_END_DAY.get(month, '28')
+    return f"{parts[0]}-{month}-{day.zfill(2)}"
+
+
+def _property_value(prop: Optional[Dict]):
+    """Reduce a property value (from a page or an update payload) to a comparable plain value."""
+    if not prop:
+        return None
+    for kind in ('title', 'rich_text'):
+        if kind in prop:
+            return ''.join(text.get('plain_text') or (text.get('text') or {}).get('content', '') for text in prop[kind])
+    if 'select' in prop:
+        return (prop['select'] or {}).get('name')
+    if 'multi_select' in prop:
+        return tuple(option.get('name') for option in prop['multi_select'])
+    if 'relation' in prop:
+        return tuple(relation.get('id') for relation in prop['relation'])
+    if 'date' in prop:
+        return (prop['date'] or {}).get('start')
+    for kind in ('url', 'number', 'checkbox'):
+        if kind in prop:
+            return prop[kind]
+    return prop
+
+
+def _first_plain_text(properties: Dict, key: Optional[str], kind: str = 'title') -> Optional[str]:
+    """Return the plain text of the first title/rich_text segment of a page property, if any."""
+    prop = properties.get(key) if key else None
+    items = prop.get(kind) if prop else None
+    return items[0]['plain_text'] if items else None
+
+
+def _has_full_track_list(release: Dict) -> bool:
+    """Check whether a release lists every track on every medium (browse results do, searches don't)."""
+    media = release.get('media')
+    return bool(media) and all(
+        'tracks' in medium and len(medium['tracks']) == medium.get('track-count', len(medium['tracks']))
+        for medium in media
+    )
+
+
+def _spotify_url_from_relations(relations) -> Optional[str]:
+    """Return the first Spotify URL among "streaming" / "free streaming" url-rels, if any."""
+    for relation in relations or ():
+        if relation.get('type', '').lower() not in STREAMING_RELATION_TYPES:
+            continue
+        url_resource = relation.get('url') or {}
+        url_str = url_resource.get('resource', '') if isinstance(url_resource, dict) else str(url_resource)
+        if url_str and 'spotify.com' in url_str.lower():
+            return url_str
+    return None
+
+
+def _genre_names(genres) -> frozenset:
+    """Collect the casefolded names of MusicBrainz genres so matching tags can be skipped."""
+    return frozenset(genre['name'].casefold() for genre in genres or () if genre.get('name'))
+
+
+def _multi_select(items, exclude: frozenset = frozenset(), limit: int = 10) -> List[Dict]:
+    """Build multi_select options from the first named genres/tags, stopping once the limit is reached.
+    
+    exclude holds casefolded names (see _genre_names), so tags differing from a genre only in case are skipped.
+    """
+    names = (item['name'] for item in items if item.get('name') and item['name'].casefold() not in exclude)
+    return [{'name': name} for name in islice(names, limit)]
+
+
+
+def _holding_create_lock(method):
+    """Run a find-or-create method under a lock for the name it looks up.
+    
+    Different names resolve concurrently; the same name never gets created twice.
+    """
+    @functools.wraps(method)
+    def wrapper(self, name, *args, **kwargs):
+        key = (method.__name__, name.lower())
+        with self._create_locks.setdefault(key, threading.Lock()):
+            return method(self, name, *args, **kwargs)
+    return wrapper
+
+
+class BoundedCache(OrderedDict):
+    """Dict that evicts its least recently used entry once it holds maxsize items."""
+    
+    def __init__(self, maxsize: int):
+        super().__init__()
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+    
+    def __getitem__(self, key):
+        with self._lock:
+            value = super().__getitem__(key)
+            self.move_to_end(key)
+            return value
+    
+    def __setitem__(self, key, value):
+        with self._lock:
+            super().__setitem__(key, value)
+            self.move_to_end(key)
+            if len(self) > self.maxsize:
+                self.popitem(last=False)
+
+
+class DiskCache:
+    """Persistent cache of MusicBrainz responses stored in SQLite."""
+    
+    def __init__(self, path: str, ttl: float = 7 * 24 * 3600):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT, expires REAL)')
+        self._conn.commit()
+    
+    def get(self, key: str):
+        """Return (hit, value) for a key, treating expired entries as misses."""
+        with self._lock:
+            row = self._conn.execute('SELECT value, expires FROM cache WHERE key = ?', (key,)).fetchone()
+        if row is None or row[1] < time.time():
+            return False, None
+        return True, _json_loads(row[0])
+    
+    def set(self, key: str, value, ttl: Optional[float] = None):
+        """Store a JSON-serialisable value, expiring after ttl seconds (default: the cache's ttl)."""
+        expires = time.time() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._conn.execute('INSERT OR REPLACE INTO cache (key, value, expires) VALUES (?, ?, ?)',
+                               (key, _json_dumps(value), expires))
+            self._conn.commit()
+
+
 class MusicBrainzAPI:
     """MusicBrainz API client for fetching music data."""
     
-    def __init__(self, user_agent: str):
+    def __init__(self, user_agent: str, cache_path: Optional[str] = None, cache_ttl_days: float = 7):
         self.user_agent = user_agent
         self.base_url = "https://musicbrainz.org/ws/2"
         self.session = requests.Session()
@@ -96,93 +326,205 @@ class MusicBrainzAPI:
             'Accept': 'application/json'
         })
         
-        # Rate limiting - MusicBrainz allows 1 request per second
-        self.request_delay = 1.0
-        self.last_request_time = 0
+        # One pooled session for MusicBrainz, Cover Art Archive and Spotify. The adapter
+        # doesn't retry: _make_api_request does, so every attempt takes a rate-limit token
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=0)
+        self.session.mount('https://', adapter)
+        
+        # Rate limiting uses a token bucket per host so Cover Art Archive requests
+        # don't wait on MusicBrainz's 1 request per second budget
+        self.request_rate = 1.0  # requests per second
+        self.host_request_rates = {
+            'musicbrainz.org': self.request_rate,
+            'coverartarchive.org': 5.0,
+        }
+        self._buckets = {}  # host -> (tokens, last refill time)
+        self._host_locks = {}  # host -> lock guarding its bucket
+        
+        # Lookups currently in progress, so concurrent requests for one MBID share a fetch
+        self._inflight = {}  # (kind, mbid) -> Future
+        self._inflight_lock = threading.Lock()
+        
+        # Background threads for lookups that can overlap other work (e.g. cover art)
+        self._executor = ThreadPoolExecutor(max_workers=4)
         
-        # Caching to reduce API calls
+        # Caching to reduce API calls; bounded so long syncs don't grow without limit
         self._cache = {
-            'artists': {},
-            'releases': {},
-            'recordings': {},
-            'labels': {},
-            'cover_art': {}
+            'artists': BoundedCache(maxsize=5000),
+            'releases': BoundedCache(maxsize=5000),
+            'recordings': BoundedCache(maxsize=5000),
+            'labels': BoundedCache(maxsize=5000),
+            'artist_release_dates': BoundedCache(maxsize=5000),
+            'searches': BoundedCache(maxsize=2000),  # search/browse results; memory only, expire after search_cache_ttl
+            'cover_art': BoundedCache(maxsize=20000),
+            'spotify': BoundedCache(maxsize=20000)
         }
+        
+        self.search_cache_ttl = 3600  # seconds
+        
+        # Optional on-disk cache so re-runs skip MusicBrainz for entities already fetched
+        self._disk_cache = DiskCache(cache_path, ttl=cache_ttl_days * 24 * 3600) if cache_path else None
+        
+        # Spotify client-credentials token, reused until it expires
+        self._spotify_token = None
+        self._spotify_token_expiry = 0.0
+        
+        # Open connections in the background while the Notion schemas load
+        self._executor.submit(self._warm_up_connections)
     
-    def _rate_limit(self):
-        """Apply rate limiting between requests."""
-        current_time = time.time()
-        time_since_last_request = current_time - self.last_request_time
+    def _warm_up_connections(self):
+        """Open pooled connections to each API host so the first real request skips the TLS handshake."""
+        for url in (f"{self.base_url}/", "https://coverartarchive.org/"):
+            try:
+                self._rate_limit(url)
+                self.session.head(url, timeout=5)
+            except Exception as e:
+                logger.debug("Connection warm-up to %s failed: %s", url, e)
         
-        if time_since_last_request < self.request_delay:
-            sleep_time = self.request_delay - time_since_last_request
-            logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
-            time.sleep(sleep_time)
+        # Fetching the token also opens a connection to Spotify
+        self._get_spotify_access_token()
+    
+    def _rate_limit(self, url: str):
+        """Wait for a token from the host's bucket before making a request."""
+        host = urlsplit(url).hostname
+        rate = self.host_request_rates.get(host, self.request_rate)
+        
+        # Requests to the same host from other threads queue behind this lock
+        with self._host_locks.setdefault(host, threading.Lock()):
+            now = time.monotonic()
+            tokens, last_refill = self._buckets.get(host, (1.0, now))
+            
+            # Refill for the time elapsed since the last request, up to a capacity of one
+            tokens = min(1.0, tokens + (now - last_refill) * rate)
+            if tokens < 1.0:
+                sleep_time = (1.0 - tokens) / rate
+                logger.debug("Rate limiting %s: sleeping for %.2f seconds", host, sleep_time)
+                time.sleep(sleep_time)
+                now = time.monotonic()
+                tokens = 1.0
+            
+            self._buckets[host] = (tokens - 1.0, now)
+    
+    def _drain_bucket(self, url: str):
+        """Empty the host's bucket after the server throttled us."""
+        self._buckets[urlsplit(url).hostname] = (0.0, time.monotonic())
+    
+    def _get_cached(self, kind: str, key: str):
+        """Return (hit, value) from the memory cache, falling back to the disk cache."""
+        try:
+            return True, self._cache[kind][key]
+        except KeyError:
+            pass
+        if self._disk_cache:
+            hit, value = self._disk_cache.get(f"{kind}:{key}")
+            if hit:
+                self._cache[kind][key] = value
+                return True, value
+        return False, None
+    
+    def _set_cached(self, kind: str, key: str, value, ttl: Optional[float] = None):
+        """Store a value in the memory cache and, if enabled, the disk cache."""
+        self._cache[kind][key] = value
+        if self._disk_cache:
+            self._disk_cache.set(f"{kind}:{key}", value, ttl)
+    
+    def _singleflight(self, key: tuple, fetch):
+        """Run fetch() for a key, letting concurrent callers with the same key wait for its result."""
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._inflight[key] = future
+        
+        if not is_owner:
+            return future.result()
         
-        self.last_request_time = time.time()
+        try:
+            result = fetch()
+            future.set_result(result)
+            return result
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+    
+    def _retry_wait(self, response: Optional[requests.Response], attempt: int) -> float:
+        """Seconds to wait before retrying: the server's Retry-After (capped), else exponential backoff."""
+        retry_after = response.headers.get('Retry-After') if response is not None else None
+        if retry_after:
+            try:
+                return min(max(float(retry_after), 0.0), MAX_RETRY_AFTER)
+            except ValueError:
+                pass  # HTTP-date form; fall back to backoff
+        return 2 ** attempt
     
     def _make_api_request(self, url: str, params: Dict = None, max_retries: int = 3) -> requests.Response:
         """Make an API request with rate limiting and retry logic."""
-        if params is None:
-            params = {}
-        
         for attempt in range(max_retries + 1):
+            # Apply rate limiting before each attempt, retries included
+            self._rate_limit(url)
+            
             try:
-                # Apply rate limiting before each request
-                self._rate_limit()
-                
-                # Make the request
                 response = self.session.get(url, params=params)
-                
-                # Check for rate limiting (429)
-                if response.status_code == 429:
-                    if attempt < max_retries:
-                        wait_time = (2 ** attempt) + 1  # Exponential backoff
-                        logger.warning(f"Rate limited (429). Waiting {wait_time} seconds before retry {attempt + 1}/{max_retries}")
-                        time.sleep(wait_time)
-                        continue
-                    else:
-                        logger.error(f"Rate limit exceeded after {max_retries} retries")
-                        response.raise_for_status()
-                
-                # Check for other HTTP errors
-                if response.status_code >= 400:
-                    if attempt < max_retries:
-                        wait_time = 1 + (attempt * 0.5)
-                        logger.warning(f"HTTP {response.status_code} error. Waiting {wait_time:.1f} seconds before retry {attempt + 1}/{max_retries}")
-                        time.sleep(wait_time)
-                        continue
-                    else:
-                        response.raise_for_status()
-                
-                return response
-                
             except requests.exceptions.RequestException as e:
-                if attempt < max_retries:
-                    wait_time = 1 + (attempt * 0.5)
-                    logger.warning(f"Request failed: {e}. Waiting {wait_time:.1f} seconds before retry {attempt + 1}/{max_retries}")
-                    time.sleep(wait_time)
-                    continue
-                else:
+                if attempt == max_retries:
                     logger.error(f"Request failed after {max_retries} retries: {e}")
                     raise
-        
-        raise Exception("Max retries exceeded")
+                wait_time = self._retry_wait(None, attempt)
+                logger.warning(f"Request failed: {e}. Waiting {wait_time:.1f} seconds before retry {attempt + 1}/{max_retries}")
+                time.sleep(wait_time)
+                continue
+            
+            if response.status_code in RETRY_STATUS_CODES and attempt < max_retries:
+                # The server asked us to slow down; start the next request from an empty bucket
+                self._drain_bucket(url)
+                wait_time = self._retry_wait(response, attempt)
+                logger.warning(f"HTTP {response.status_code} error. Waiting {wait_time:.1f} seconds before retry {attempt + 1}/{max_retries}")
+                time.sleep(wait_time)
+                continue
+            
+            response.raise_for_status()
+            return response
+    
+    def _search(self, entity: str, query: str, limit: int) -> List[Dict]:
+        """Run a MusicBrainz search, reusing the results of identical recent searches."""
+        return self._list_entities(entity, {'query': query, 'limit': limit})
+    
+    def _list_entities(self, entity: str, params: Dict) -> List[Dict]:
+        """Run a MusicBrainz search or browse request, reusing identical recent results."""
+        return self._list_entities_page(entity, params)[0]
+    
+    def _list_entities_page(self, entity: str, params: Dict) -> Tuple[List[Dict], int]:
+        """Run a MusicBrainz search or browse request, returning its results and total match count."""
+        key = f"{entity}?" + '&'.join(f"{name}={value}" for name, value in sorted(params.items()))
+        try:
+            expires, results, count = self._cache['searches'][key]
+            if expires > time.monotonic():
+                logger.debug("Using cached results for %s", key)
+                return results, count
+        except KeyError:
+            pass
+        
+        url = f"{self.base_url}/{entity}"
+        params = dict(params, fmt='json')
+        
+        def fetch():
+            data = _json_loads(self._make_api_request(url, params).content)
+            results = data.get(f'{entity}s', [])
+            return results, data.get(f'{entity}-count', data.get('count', len(results)))
+        
+        # Concurrent identical requests share a single fetch
+        results, count = self._singleflight(('searches', key), fetch)
+        self._cache['searches'][key] = (time.monotonic() + self.search_cache_ttl, results, count)
+        return results, count
     
     def search_artists(self, name: str, limit: int = 5) -> List[Dict]:
         """Search for artists by name."""
         try:
-            url = f"{self.base_url}/artist"
-            params = {
-                'query': name,
-                'limit': limit,
-                'fmt': 'json'
-            }
-            
-            response = self._make_api_request(url, params)
-            data = response.json()
-            
-            return data.get('artists', [])
+            return self._search('artist', name, limit)
             
         except Exception as e:
             logger.error(f"Error searching for artist '{name}': {e}")
@@ -192,9 +534,10 @@ class MusicBrainzAPI:
         """Get detailed artist information by MBID."""
         try:
             # Check cache first
-            if mbid in self._cache['artists']:
-                logger.debug(f"Using cached artist data for MBID {mbid}")
-                return self._cache['artists'][mbid]
+            hit, cached = self._get_cached('artists', mbid)
+            if hit:
+                logger.debug("Using cached artist data for MBID %s", mbid)
+                return cached
             
             url = f"{self.base_url}/artist/{mbid}"
             params = {
@@ -203,11 +546,11 @@ class MusicBrainzAPI:
             }
             # Note: 'genres' in inc will include genres on both artist and release-groups
             
-            response = self._make_api_request(url, params)
-            artist = response.json()
+            # Concurrent lookups of the same MBID share a single request
+            artist = self._singleflight(('artists', mbid), lambda: _json_loads(self._make_api_request(url, params).content))
             
             # Cache the result
-            self._cache['artists'][mbid] = artist
+            self._set_cached('artists', mbid, artist)
             return artist
             
         except Exception as e:
@@ -217,56 +560,73 @@ class MusicBrainzAPI:
     def search_releases(self, title: str, artist: str = None, limit: int = 5) -> List[Dict]:
         """Search for releases (albums) by title and optionally artist."""
         try:
-            url = f"{self.base_url}/release"
-            
             # Build query
             query_parts = [f'release:"{title}"']
             if artist:
                 query_parts.append(f'artist:"{artist}"')
             
-            params = {
-                'query': ' AND '.join(query_parts),
-                'limit': limit,
-                'fmt': 'json'
-            }
-            
-            response = self._make_api_request(url, params)
-            data = response.json()
-            
-            return data.get('releases', [])
+            return self._search('release', ' AND '.join(query_parts), limit)
             
         except Exception as e:
             logger.error(f"Error searching for release '{title}': {e}")
             return []
     
-    def search_releases_by_recording(self, recording_id: str, limit: int = 50) -> List[Dict]:
-        """Search for releases that contain a specific recording."""
+    def browse_releases_by_artist(self, artist_mbid: str, max_results: int = MAX_ARTIST_RELEASES) -> List[Dict]:
+        """Browse an artist's releases with the same detail get_release fetches.
+        
+        Pages through the browse (100 releases per request) until release-count is
+        reached, stopping at max_results for artists with very large catalogues.
+        """
+        releases = []
         try:
-            url = f"{self.base_url}/release"
-            
-            # Search for releases containing this recording
-            params = {
-                'query': f'reid:{recording_id}',
-                'limit': limit,
-                'fmt': 'json'
-            }
-            
-            response = self._make_api_request(url, params)
-            data = response.json()
-            
-            return data.get('releases', [])
-            
+            # Browsing is an indexed lookup (unlike an arid: search), and it honours inc,
+            # so candidates can be checked and scored without fetching each one
+            while len(releases) < max_results:
+                page, count = self._list_entities_page('release', {
+                    'artist': artist_mbid,
+                    'inc': 'artist-credits+labels+recordings+release-groups+media+tags+ratings+genres+url-rels',
+                    'limit': 100,
+                    'offset': len(releases)
+                })
+                releases.extend(page)
+                if not page or len(releases) >= count:
+                    break
+            if len(releases) > max_results:
+                del releases[max_results:]
+            return releases
+        except Exception as e:
+            logger.error(f"Error browsing releases for artist {artist_mbid}: {e}")
+            return releases
+    
+    def browse_releases_by_release_group(self, release_group_mbid: str, limit: int = 100) -> List[Dict]:
+        """Browse a release group's releases with the same detail get_release fetches."""
+        try:
+            return self._list_entities('release', {
+                'release-group': release_group_mbid,
+                'inc': 'artist-credits+labels+recordings+release-groups+media+tags+ratings+genres+url-rels',
+                'limit': limit
+            })
         except Exception as e:
-            logger.debug(f"Error searching for releases by recording {recording_id}: {e}")
+            logger.error(f"Error browsing releases for release group {release_group_mbid}: {e}")
             return []
     
+    def get_releases_for_recording(self, recording_id: str, limit: int = 50) -> List[Dict]:
+        """Get the releases that contain a specific recording."""
+        # The recording lookup already includes its releases (and is cached), so
+        # there's no need for a separate release search
+        recording = self.get_recording(recording_id)
+        if not recording:
+            return []
+        return recording.get('releases', [])[:limit]
+    
     def get_release(self, mbid: str) -> Optional[Dict]:
         """Get detailed release information by MBID."""
         try:
             # Check cache first
-            if mbid in self._cache['releases']:
-                logger.debug(f"Using cached release data for MBID {mbid}")
-                return self._cache['releases'][mbid]
+            hit, cached = self._get_cached('releases', mbid)
+            if hit:
+                logger.debug("Using cached release data for MBID %s", mbid)
+                return cached
             
             url = f"{self.base_url}/release/{mbid}"
             params = {
@@ -274,22 +634,31 @@ class MusicBrainzAPI:
                 'fmt': 'json'
             }
             
-            response = self._make_api_request(url, params)
-            release = response.json()
+            # Concurrent lookups of the same MBID share a single request
+            release = self._singleflight(('releases', mbid), lambda: _json_loads(self._make_api_request(url, params).content))
             
             # Cache the result
-            self._cache['releases'][mbid] = release
+            self._set_cached('releases', mbid, release)
             return release
             
         except Exception as e:
             logger.error(f"Error getting release {mbid}: {e}")
             return None
     
+    def get_releases(self, mbids: List[str], max_workers: int = 10) -> Dict[str, Optional[Dict]]:
+        """Get several releases concurrently, keyed by MBID (None for releases that could not be fetched).
+        
+        Requests still go out at the per-host rate limit; the overlap saves the round-trip time.
+        """
+        unique_mbids = list(dict.fromkeys(mbids))
+        if len(unique_mbids) <= 1:
+            return {mbid: self.get_release(mbid) for mbid in unique_mbids}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(unique_mbids))) as executor:
+            return dict(zip(unique_mbids, executor.map(self.get_release, unique_mbids)))
+    
     def search_recordings(self, title: str, artist: str = None, album: str = None, limit: int = 5) -> List[Dict]:
         """Search for recordings (songs) by title and optionally artist and album."""
         try:
-            url = f"{self.base_url}/recording"
-            
             # Build query
             query_parts = [f'recording:"{title}"']
             if artist:
@@ -297,16 +666,7 @@ class MusicBrainzAPI:
             if album:
                 query_parts.append(f'release:"{album}"')
             
-            params = {
-                'query': ' AND '.join(query_parts),
-                'limit': limit,
-                'fmt': 'json'
-            }
-            
-            response = self._make_api_request(url, params)
-            data = response.json()
-            
-            return data.get('recordings', [])
+            return self._search('recording', ' AND '.join(query_parts), limit)
             
         except Exception as e:
             logger.error(f"Error searching for recording '{title}': {e}")
@@ -316,9 +676,10 @@ class MusicBrainzAPI:
         """Get detailed recording information by MBID."""
         try:
             # Check cache first
-            if mbid in self._cache['recordings']:
-                logger.debug(f"Using cached recording data for MBID {mbid}")
-                return self._cache['recordings'][mbid]
+            hit, cached = self._get_cached('recordings', mbid)
+            if hit:
+                logger.debug("Using cached recording data for MBID %s", mbid)
+                return cached
             
             url = f"{self.base_url}/recording/{mbid}"
             params = {
@@ -326,11 +687,11 @@ class MusicBrainzAPI:
                 'fmt': 'json'
             }
             
-            response = self._make_api_request(url, params)
-            recording = response.json()
+            # Concurrent lookups of the same MBID share a single request
+            recording = self._singleflight(('recordings', mbid), lambda: _json_loads(self._make_api_request(url, params).content))
             
             # Cache the result
-            self._cache['recordings'][mbid] = recording
+            self._set_cached('recordings', mbid, recording)
             return recording
             
         except Exception as e:
@@ -341,35 +702,48 @@ class MusicBrainzAPI:
         """Get cover art URL from Cover Art Archive."""
         try:
             # Check cache first
-            if release_mbid in self._cache['cover_art']:
-                logger.debug(f"Using cached cover art URL for release {release_mbid}")
-                return self._cache['cover_art'][release_mbid]
-            
-            # Cover Art Archive API
-            url = f"https://coverartarchive.org/release/{release_mbid}"
-            
-            response = self._make_api_request(url)
-            data = response.json()
-            
-            # Get front cover image
-            images = data.get('images', [])
-            front_cover = next((img for img in images if img.get('front', False)), None)
+            hit, cached = self._get_cached('cover_art', release_mbid)
+            if hit:
+                logger.debug("Using cached cover art URL for release %s", release_mbid)
+                return cached
             
-            if front_cover:
-                cover_url = front_cover.get('image')
-                # Cache the result
-                self._cache['cover_art'][release_mbid] = cover_url
-                return cover_url
-            
-            return None
+            return self._singleflight(('cover_art', release_mbid), lambda: self._fetch_cover_art_url(release_mbid))
             
         except Exception as e:
-            logger.debug(f"No cover art found for release {release_mbid}: {e}")
+            logger.debug("No cover art found for release %s: %s", release_mbid, e)
+            return None
+    
+    def _fetch_cover_art_url(self, release_mbid: str) -> Optional[str]:
+        """Look up a release's front cover URL on Cover Art Archive and cache it."""
+        # The /front endpoint redirects straight to the front cover image, so a
+        # HEAD request gives us its URL without downloading the release's image list
+        url = f"https://coverartarchive.org/release/{release_mbid}/front"
+        self._rate_limit(url)
+        response = self.session.head(url, allow_redirects=False, timeout=10)
+        
+        if response.is_redirect:
+            cover_url = response.headers['Location']
+        elif response.status_code == 404:
+            # No artwork or no front cover; remember that so we don't ask again
+            cover_url = None
+        else:
+            response.raise_for_status()
             return None
+        
+        self._set_cached('cover_art', release_mbid, cover_url)
+        return cover_url
+    
+    def prefetch_cover_art_url(self, release_mbid: str) -> Future:
+        """Start a cover art lookup in the background and return its future."""
+        return self._executor.submit(self.get_cover_art_url, release_mbid)
     
     def _get_spotify_access_token(self) -> Optional[str]:
-        """Get Spotify access token using client credentials flow."""
+        """Get Spotify access token using client credentials flow, reusing it until it expires."""
         try:
+            # Reuse the cached token until 30 seconds before it expires
+            if self._spotify_token and time.monotonic() < self._spotify_token_expiry - 30:
+                return self._spotify_token
+            
             client_id = os.getenv('SPOTIFY_CLIENT_ID')
             client_secret = os.getenv('SPOTIFY_CLIENT_SECRET')
             
@@ -386,7 +760,7 @@ class MusicBrainzAPI:
                 'grant_type': 'client_credentials'
             }
             
-            response = requests.post(
+            response = self.session.post(
                 url, 
                 headers=headers, 
                 data=data,
@@ -395,18 +769,28 @@ class MusicBrainzAPI:
             )
             
             if response.status_code == 200:
-                token_data = response.json()
-                return token_data.get('access_token')
+                token_data = _json_loads(response.content)
+                self._spotify_token = token_data.get('access_token')
+                self._spotify_token_expiry = time.monotonic() + token_data.get('expires_in', 3600)
+                return self._spotify_token
             else:
-                logger.debug(f"Spotify token request failed with status {response.status_code}")
+                logger.debug("Spotify token request failed with status %s", response.status_code)
                 return None
                 
         except Exception as e:
-            logger.debug(f"Error getting Spotify access token: {e}")
+            logger.debug("Error getting Spotify access token: %s", e)
             return None
     
-    def _get_spotify_album_url(self, album_title: str, artist_name: str = None) -> Optional[str]:
-        """Get Spotify album URL by searching Spotify API."""
+    def _spotify_search(self, search_type: str, query: str) -> Optional[Dict]:
+        """Search Spotify and return the top album, track or artist result."""
+        cache_key = (search_type, query)
+        try:
+            result = self._cache['spotify'][cache_key]
+            logger.debug("Using cached Spotify %s result for %s", search_type, query)
+            return result
+        except KeyError:
+            pass
+        
         try:
             # Get access token
             access_token = self._get_spotify_access_token()
@@ -416,230 +800,109 @@ class MusicBrainzAPI:
             # Rate limit: Spotify allows many requests, but we'll be conservative
             time.sleep(0.1)  # 100ms delay
             
-            # Search for album
             url = "https://api.spotify.com/v1/search"
             headers = {
-                'Authorization': f'Bearer {access_token}',
-                'Content-Type': 'application/json'
+                'Authorization': f'Bearer {access_token}'
             }
-            
-            # Build query: album title and optionally artist name
-            if artist_name:
-                query = f'album:"{album_title}" artist:"{artist_name}"'
-            else:
-                query = f'album:"{album_title}"'
-            
             params = {
                 'q': query,
-                'type': 'album',
+                'type': search_type,
                 'limit': 1
             }
             
-            response = requests.get(url, headers=headers, params=params, timeout=10)
+            response = self.session.get(url, headers=headers, params=params, timeout=10)
             
             if response.status_code == 200:
-                data = response.json()
-                if (data.get('albums') and 
-                    data['albums'].get('items') and 
-                    len(data['albums']['items']) > 0):
-                    album = data['albums']['items'][0]
-                    
-                    # Get the Spotify external URL
-                    if album.get('external_urls') and album['external_urls'].get('spotify'):
-                        return album['external_urls']['spotify']
-                    else:
-                        logger.debug(f"Spotify album {album_title} has no external URL")
-                else:
-                    logger.debug(f"Spotify search returned no results for album {album_title}")
+                items = _json_loads(response.content).get(f'{search_type}s', {}).get('items')
+                result = items[0] if items else None
+                if not result:
+                    logger.debug("Spotify search returned no results for %s", query)
+                # Cache hits and misses alike; the URL and image lookups share results
+                self._cache['spotify'][cache_key] = result
+                return result
             elif response.status_code == 401:
                 logger.debug("Spotify access token expired or invalid")
+                self._spotify_token = None
+            elif response.status_code == 429:
+                # Give up rather than stall a page worker for Spotify's Retry-After
+                logger.debug("Spotify rate limited the %s search for %s; skipping", search_type, query)
             else:
-                logger.debug(f"Spotify API returned status {response.status_code} for album {album_title}")
+                logger.debug("Spotify API returned status %s for %s %s", response.status_code, search_type, query)
             
             return None
             
         except Exception as e:
-            logger.debug(f"Error fetching Spotify album URL: {e}")
+            logger.debug("Error searching Spotify for %s %s: %s", search_type, query, e)
+            return None
+    
+    def _get_spotify_album_url(self, album_title: str, artist_name: str = None) -> Optional[str]:
+        """Get Spotify album URL by searching Spotify API."""
+        # Build query: album title and optionally artist name
+        if artist_name:
+            query = f'album:"{album_title}" artist:"{artist_name}"'
+        else:
+            query = f'album:"{album_title}"'
+        
+        album = self._spotify_search('album', query)
+        if not album:
             return None
+        
+        # Get the Spotify external URL
+        spotify_url = album.get('external_urls', {}).get('spotify')
+        if not spotify_url:
+            logger.debug("Spotify album %s has no external URL", album_title)
+        return spotify_url
     
     def _get_spotify_album_image(self, album_title: str, artist_name: str = None) -> Optional[str]:
         """Get album cover image URL from Spotify API."""
-        try:
-            # Get access token
-            access_token = self._get_spotify_access_token()
-            if not access_token:
-                return None
-            
-            # Rate limit: Spotify allows many requests, but we'll be conservative
-            time.sleep(0.1)  # 100ms delay
-            
-            # Search for album
-            url = "https://api.spotify.com/v1/search"
-            headers = {
-                'Authorization': f'Bearer {access_token}',
-                'Content-Type': 'application/json'
-            }
-            
-            # Build query: album title and optionally artist name
-            if artist_name:
-                query = f'album:"{album_title}" artist:"{artist_name}"'
-            else:
-                query = f'album:"{album_title}"'
-            
-            params = {
-                'q': query,
-                'type': 'album',
-                'limit': 1
-            }
-            
-            response = requests.get(url, headers=headers, params=params, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                if (data.get('albums') and 
-                    data['albums'].get('items') and 
-                    len(data['albums']['items']) > 0):
-                    album = data['albums']['items'][0]
-                    
-                    # Spotify returns images in an array, sorted by size (largest first)
-                    if album.get('images') and len(album['images']) > 0:
-                        # Get the first (largest) image
-                        image = album['images'][0]
-                        if image.get('url'):
-                            return image['url']
-                    else:
-                        logger.debug(f"Spotify album {album_title} has no images")
-                else:
-                    logger.debug(f"Spotify search returned no results for album {album_title}")
-            elif response.status_code == 401:
-                logger.debug("Spotify access token expired or invalid")
-            else:
-                logger.debug(f"Spotify API returned status {response.status_code} for album {album_title}")
-            
+        # Build query: album title and optionally artist name
+        if artist_name:
+            query = f'album:"{album_title}" artist:"{artist_name}"'
+        else:
+            query = f'album:"{album_title}"'
+        
+        album = self._spotify_search('album', query)
+        if not album:
             return None
-            
-        except Exception as e:
-            logger.debug(f"Error fetching Spotify album image: {e}")
+        
+        # Spotify returns images sorted by size (largest first)
+        images = album.get('images')
+        if not images:
+            logger.debug("Spotify album %s has no images", album_title)
             return None
+        return images[0].get('url')
     
     def _get_spotify_track_url(self, track_title: str, artist_name: str = None) -> Optional[str]:
         """Get Spotify track URL by searching Spotify API."""
-        try:
-            # Get access token
-            access_token = self._get_spotify_access_token()
-            if not access_token:
-                return None
-            
-            # Rate limit: Spotify allows many requests, but we'll be conservative
-            time.sleep(0.1)  # 100ms delay
-            
-            # Search for track
-            url = "https://api.spotify.com/v1/search"
-            headers = {
-                'Authorization': f'Bearer {access_token}',
-                'Content-Type': 'application/json'
-            }
-            
-            # Build query: track title and optionally artist name
-            if artist_name:
-                query = f'track:"{track_title}" artist:"{artist_name}"'
-            else:
-                query = f'track:"{track_title}"'
-            
-            params = {
-                'q': query,
-                'type': 'track',
-                'limit': 1
-            }
-            
-            response = requests.get(url, headers=headers, params=params, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                if (data.get('tracks') and 
-                    data['tracks'].get('items') and 
-                    len(data['tracks']['items']) > 0):
-                    track = data['tracks']['items'][0]
-                    
-                    # Get the Spotify external URL
-                    if track.get('external_urls') and track['external_urls'].get('spotify'):
-                        return track['external_urls']['spotify']
-                    else:
-                        logger.debug(f"Spotify track {track_title} has no external URL")
-                else:
-                    logger.debug(f"Spotify search returned no results for track {track_title}")
-            elif response.status_code == 401:
-                logger.debug("Spotify access token expired or invalid")
-            else:
-                logger.debug(f"Spotify API returned status {response.status_code} for track {track_title}")
-            
-            return None
-            
-        except Exception as e:
-            logger.debug(f"Error fetching Spotify track URL: {e}")
+        # Build query: track title and optionally artist name
+        if artist_name:
+            query = f'track:"{track_title}" artist:"{artist_name}"'
+        else:
+            query = f'track:"{track_title}"'
+        
+        track = self._spotify_search('track', query)
+        if not track:
             return None
+        
+        # Get the Spotify external URL
+        spotify_url = track.get('external_urls', {}).get('spotify')
+        if not spotify_url:
+            logger.debug("Spotify track %s has no external URL", track_title)
+        return spotify_url
     
     def _get_spotify_artist_image(self, artist_name: str, artist_mbid: str = None) -> Optional[str]:
         """Get artist image URL from Spotify API."""
-        try:
-            # Get access token
-            access_token = self._get_spotify_access_token()
-            if not access_token:
-                return None
-            
-            # Rate limit: Spotify allows many requests, but we'll be conservative
-            time.sleep(0.1)  # 100ms delay
-            
-            # Search for artist
-            url = "https://api.spotify.com/v1/search"
-            headers = {
-                'Authorization': f'Bearer {access_token}',
-                'Content-Type': 'application/json'
-            }
-            
-            # Use MBID if available for more accurate results, otherwise use artist name
-            if artist_mbid:
-                # Spotify doesn't directly support MBID, so we'll search by name
-                # but we could potentially use external_ids in the future
-                query = f'artist:"{artist_name}"'
-            else:
-                query = f'artist:"{artist_name}"'
-            
-            params = {
-                'q': query,
-                'type': 'artist',
-                'limit': 1
-            }
-            
-            response = requests.get(url, headers=headers, params=params, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                if (data.get('artists') and 
-                    data['artists'].get('items') and 
-                    len(data['artists']['items']) > 0):
-                    artist = data['artists']['items'][0]
-                    
-                    # Spotify returns images in an array, sorted by size (largest first)
-                    if artist.get('images') and len(artist['images']) > 0:
-                        # Get the first (largest) image
-                        image = artist['images'][0]
-                        if image.get('url'):
-                            return image['url']
-                    else:
-                        logger.debug(f"Spotify artist {artist_name} has no images")
-                else:
-                    logger.debug(f"Spotify search returned no results for {artist_name}")
-            elif response.status_code == 401:
-                logger.debug("Spotify access token expired or invalid")
-            else:
-                logger.debug(f"Spotify API returned status {response.status_code} for artist {artist_name}")
-            
+        # Spotify doesn't support MBIDs, so search by name
+        artist = self._spotify_search('artist', f'artist:"{artist_name}"')
+        if not artist:
             return None
-            
-        except Exception as e:
-            logger.debug(f"Error fetching Spotify image: {e}")
+        
+        # Spotify returns images sorted by size (largest first)
+        images = artist.get('images')
+        if not images:
+            logger.debug("Spotify artist %s has no images", artist_name)
             return None
+        return images[0].get('url')
     
     def get_artist_image_url(self, artist_mbid: str, artist_name: str = None, artist_data: Dict = None) -> Optional[str]:
         """Get artist image URL from Spotify API."""
@@ -650,29 +913,19 @@ class MusicBrainzAPI:
             # Get image from Spotify
             spotify_image = self._get_spotify_artist_image(artist_name, artist_mbid)
             if spotify_image:
-                logger.debug(f"Found Spotify image for {artist_name}")
+                logger.debug("Found Spotify image for %s", artist_name)
                 return spotify_image
             
             return None
             
         except Exception as e:
-            logger.debug(f"No artist image found for {artist_mbid}: {e}")
+            logger.debug("No artist image found for %s: %s", artist_mbid, e)
             return None
     
     def search_labels(self, name: str, limit: int = 5) -> List[Dict]:
         """Search for labels by name."""
         try:
-            url = f"{self.base_url}/label"
-            params = {
-                'query': name,
-                'limit': limit,
-                'fmt': 'json'
-            }
-            
-            response = self._make_api_request(url, params)
-            data = response.json()
-            
-            return data.get('labels', [])
+            return self._search('label', name, limit)
             
         except Exception as e:
             logger.error(f"Error searching for label '{name}': {e}")
@@ -682,9 +935,10 @@ class MusicBrainzAPI:
         """Get detailed label information by MBID."""
         try:
             # Check cache first
-            if mbid in self._cache['labels']:
-                logger.debug(f"Using cached label data for MBID {mbid}")
-                return self._cache['labels'][mbid]
+            hit, cached = self._get_cached('labels', mbid)
+            if hit:
+                logger.debug("Using cached label data for MBID %s", mbid)
+                return cached
             
             url = f"{self.base_url}/label/{mbid}"
             params = {
@@ -692,11 +946,11 @@ class MusicBrainzAPI:
                 'fmt': 'json'
             }
             
-            response = self._make_api_request(url, params)
-            label = response.json()
+            # Concurrent lookups of the same MBID share a single request
+            label = self._singleflight(('labels', mbid), lambda: _json_loads(self._make_api_request(url, params).content))
             
             # Cache the result
-            self._cache['labels'][mbid] = label
+            self._set_cached('labels', mbid, label)
             return label
             
         except Exception as e:
@@ -708,36 +962,79 @@ class NotionAPI:
     """Notion API client for database operations."""
     
     def __init__(self, token: str):
-        self.client = Client(auth=token)
+        # One pooled connection set shared by every sync worker, multiplexed over
+        # HTTP/2 when h2 is installed, so bulk updates don't pay repeated TLS handshakes
+        self._http = httpx.Client(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=16, max_keepalive_connections=16)
+        )
+        self.client = Client(auth=token, client=self._http)
+        
+        # Rate limiting - Notion allows an average of 3 requests per second per integration
+        self.request_interval = 1.0 / 3
+        self._next_request_time = 0.0
+        self._rate_lock = threading.Lock()
+        
+        # Database schemas by ID
+        self._database_cache = {}
+    
+    def _rate_limit(self):
+        """Space requests out so concurrent page syncs stay within Notion's rate limit."""
+        with self._rate_lock:
+            now = time.monotonic()
+            if self._next_request_time > now:
+                time.sleep(self._next_request_time - now)
+                now = self._next_request_time
+            self._next_request_time = now + self.request_interval
     
     def get_database(self, database_id: str) -> Optional[Dict]:
-        """Get database information."""
+        """Get database information, cached since schemas rarely change."""
+        if database_id in self._database_cache:
+            return self._database_cache[database_id]
+        
         try:
-            return self.client.databases.retrieve(database_id)
+            self._rate_limit()
+            database = self.client.databases.retrieve(database_id)
+            self._database_cache[database_id] = database
+            return database
         except Exception as e:
             logger.error(f"Error retrieving database {database_id}: {e}")
             return None
     
-    def query_database(self, database_id: str, filter_params: Optional[Dict] = None) -> List[Dict]:
-        """Query database for pages."""
+    def iter_database(self, database_id: str, filter_params: Optional[Dict] = None,
+                      page_size: int = 100, sorts: Optional[List[Dict]] = None,
+                      filter_properties: Optional[List[str]] = None) -> Iterator[Dict]:
+        """Yield database pages one at a time, fetching results a batch at a time.
+        
+        filter_properties limits the returned page properties to the given property IDs.
+        A failed query raises, so callers can tell a short read from the end of the data.
+        """
+        start_cursor = None
+        
+        while True:
+            # 100 is the largest page size Notion allows
+            params = {'page_size': page_size}
+            if start_cursor:
+                params['start_cursor'] = start_cursor
+            if filter_params:
+                params['filter'] = filter_params
+            if sorts:
+                params['sorts'] = sorts
+            if filter_properties:
+                params['filter_properties'] = filter_properties
+            
+            self._rate_limit()
+            response = self.client.databases.query(database_id, **params)
+            yield from response['results']
+            if not response['has_more']:
+                break
+            start_cursor = response.get('next_cursor')
+    
+    def query_database(self, database_id: str, filter_params: Optional[Dict] = None,
+                       filter_properties: Optional[List[str]] = None) -> List[Dict]:
+        """Query database for pages; returns [] rather than a partial list if any query fails."""
         try:
-            pages = []
-            has_more = True
-            start_cursor = None
-            
-            while has_more:
-                params = {}
-                if start_cursor:
-                    params['start_cursor'] = start_cursor
-                if filter_params:
-                    params['filter'] = filter_params
-                
-                response = self.client.databases.query(database_id, **params)
-                pages.extend(response['results'])
-                has_more = response['has_more']
-                start_cursor = response.get('next_cursor')
-            
-            return pages
+            return list(self.iter_database(database_id, filter_params, filter_properties=filter_properties))
         except Exception as e:
             logger.error(f"Error querying database {database_id}: {e}")
             return []
@@ -745,12 +1042,21 @@ class NotionAPI:
     def get_page(self, page_id: str) -> Optional[Dict]:
         """Get a single page by ID."""
         try:
+            self._rate_limit()
             return self.client.pages.retrieve(page_id)
         except Exception as e:
             logger.error(f"Error retrieving page {page_id}: {e}")
             return None
     
-    def create_page(self, database_id: str, properties: Dict, cover_url: Optional[str] = None, icon: Optional[Union[str, Dict]] = None) -> Optional[str]:
+    def get_pages(self, page_ids: List[str], max_workers: int = 8) -> Dict[str, Optional[Dict]]:
+        """Get several pages concurrently, keyed by page ID (None for pages that could not be fetched)."""
+        unique_ids = list(dict.fromkeys(page_ids))
+        if len(unique_ids) <= 1:
+            return {page_id: self.get_page(page_id) for page_id in unique_ids}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(unique_ids))) as executor:
+            return dict(zip(unique_ids, executor.map(self.get_page, unique_ids)))
+    
+    def create_page(self, database_id: str, properties: Dict, cover_url: Optional[str] = None, icon: Optional[Dict] = None) -> Optional[str]:
         """Create a new page in a database."""
         try:
             page_data = {
@@ -765,18 +1071,16 @@ class NotionAPI:
                 }
             
             if icon:
-                if isinstance(icon, str):
-                    page_data['icon'] = {'type': 'emoji', 'emoji': icon}
-                elif isinstance(icon, dict):
-                    page_data['icon'] = icon
+                page_data['icon'] = icon
             
+            self._rate_limit()
             page = self.client.pages.create(**page_data)
             return page['id']
         except Exception as e:
             logger.error(f"Error creating page: {e}")
             return None
     
-    def update_page(self, page_id: str, properties: Dict, cover_url: Optional[str] = None, icon: Optional[Union[str, Dict]] = None) -> bool:
+    def update_page(self, page_id: str, properties: Dict, cover_url: Optional[str] = None, icon: Optional[Dict] = None) -> bool:
         """Update a page with new properties and optionally set the cover image and icon."""
         try:
             update_data = {'properties': properties}
@@ -788,11 +1092,9 @@ class NotionAPI:
                 }
             
             if icon:
-                if isinstance(icon, str):
-                    update_data['icon'] = {'type': 'emoji', 'emoji': icon}
-                elif isinstance(icon, dict):
-                    update_data['icon'] = icon
+                update_data['icon'] = icon
             
+            self._rate_limit()
             self.client.pages.update(page_id, **update_data)
             return True
         except Exception as e:
@@ -809,7 +1111,11 @@ class NotionMusicBrainzSync:
                  songs_db_id: Optional[str] = None,
                  labels_db_id: Optional[str] = None):
         self.notion = NotionAPI(notion_token)
-        self.mb = MusicBrainzAPI(musicbrainz_user_agent)
+        self.mb = MusicBrainzAPI(
+            musicbrainz_user_agent,
+            cache_path=os.getenv('MUSICBRAINZ_CACHE_PATH'),
+            cache_ttl_days=float(os.getenv('MUSICBRAINZ_CACHE_TTL_DAYS', '7'))
+        )
         
         self.artists_db_id = artists_db_id
         self.albums_db_id = albums_db_id
@@ -817,224 +1123,79 @@ class NotionMusicBrainzSync:
         self.labels_db_id = labels_db_id
         self.locations_db_id = os.getenv('NOTION_LOCATIONS_DATABASE_ID')
         
-        # Property mappings for each database
-        self.artists_properties = {}
-        self.albums_properties = {}
-        self.songs_properties = {}
-        self.labels_properties = {}
-        
-        # Property ID to key mappings
-        self.artists_property_id_to_key = {}
-        self.albums_property_id_to_key = {}
-        self.songs_property_id_to_key = {}
-        self.labels_property_id_to_key = {}
+        # Field name to property key mappings (only fields present in the schema)
+        self.artists_keys = {}
+        self.albums_keys = {}
+        self.songs_keys = {}
+        self.labels_keys = {}
         
         # Caches for performance optimization
-        self._location_cache = None  # Cache location name -> page_id (None = not loaded, {} = loaded empty)
+        self._location_cache = None  # Cache location name -> page_id (None = not loaded yet, or the last load failed)
         self._locations_title_key = None  # Cache title property key for locations
+        self._location_lock = threading.RLock()  # Guards location cache loading
+        # Per-name locks guarding artist/album/label lookup-or-create. Albums can create
+        # artists and labels while holding their own lock, never the reverse.
+        self._create_locks = {}
         self._database_pages_cache = {}  # Cache full database queries
-        
-        # Load database schemas
-        if self.artists_db_id:
-            self._load_artists_schema()
-        if self.albums_db_id:
-            self._load_albums_schema()
-        if self.songs_db_id:
-            self._load_songs_schema()
-        if self.labels_db_id:
-            self._load_labels_schema()
-    
-    def _load_artists_schema(self):
-        """Load and analyze the Artists database schema."""
-        try:
-            database = self.notion.get_database(self.artists_db_id)
-            if not database:
-                logger.error("Could not retrieve Artists database schema")
-                return
-            
-            properties = database.get('properties', {})
-            
-            # Create property ID to key mapping
-            for prop_key, prop_data in properties.items():
-                prop_id = prop_data.get('id')
-                if prop_id:
-                    self.artists_property_id_to_key[prop_id] = prop_key
-            
-            # Map property IDs
-            self.artists_properties = {
-                'title': ARTISTS_TITLE_PROPERTY_ID,
-                'musicbrainz_id': ARTISTS_MUSICBRAINZ_ID_PROPERTY_ID,
-                'sort_name': ARTISTS_SORT_NAME_PROPERTY_ID,
-                'type': ARTISTS_TYPE_PROPERTY_ID,
-                'gender': ARTISTS_GENDER_PROPERTY_ID,
-                'area': ARTISTS_AREA_PROPERTY_ID,
-                'born_in': ARTISTS_BORN_IN_PROPERTY_ID,
-                'ig_link': ARTISTS_IG_LINK_PROPERTY_ID,
-                'website_link': ARTISTS_WEBSITE_LINK_PROPERTY_ID,
-                'youtube_link': ARTISTS_YOUTUBE_LINK_PROPERTY_ID,
-                'bandcamp_link': ARTISTS_BANDCAMP_LINK_PROPERTY_ID,
-                'streaming_link': ARTISTS_STREAMING_LINK_PROPERTY_ID,
-                'country': ARTISTS_COUNTRY_PROPERTY_ID,
-                'begin_date': ARTISTS_BEGIN_DATE_PROPERTY_ID,
-                'end_date': ARTISTS_END_DATE_PROPERTY_ID,
-                'disambiguation': ARTISTS_DISAMBIGUATION_PROPERTY_ID,
-                'description': ARTISTS_DESCRIPTION_PROPERTY_ID,
-                'genres': ARTISTS_GENRES_PROPERTY_ID,
-                'tags': ARTISTS_TAGS_PROPERTY_ID,
-                'rating': ARTISTS_RATING_PROPERTY_ID,
-                'last_updated': ARTISTS_LAST_UPDATED_PROPERTY_ID,
-                'musicbrainz_url': ARTISTS_MUSICBRAINZ_URL_PROPERTY_ID,
-            }
-            
-            logger.info("✓ Artists database schema loaded")
-            
-        except Exception as e:
-            logger.error(f"Error loading Artists database schema: {e}")
+        self._sync_timestamp = None  # Set once per run_sync for Last Updated properties
+        self._related_page_cache = BoundedCache(maxsize=5000)  # Related page ID -> page, reused across pages
+        self._release_track_positions = BoundedCache(maxsize=2000)  # Release MBID -> {recording MBID: track position}
+        self._page_id_cache = {}  # 'artists'/'albums'/'labels' -> {lowercase title: page_id}
+        
+        # Load database schemas in parallel; each load only sets its own database's attributes
+        databases = [database for database in DATABASE_FIELDS if getattr(self, f'{database}_db_id')]
+        if databases:
+            with ThreadPoolExecutor(max_workers=len(databases)) as executor:
+                list(executor.map(self._load_schema, databases))
     
-    def _load_albums_schema(self):
-        """Load and analyze the Albums database schema."""
+    def _load_schema(self, database: str):
+        """Load and analyze a database schema ('artists', 'albums', 'songs' or 'labels')."""
+        name = database.capitalize()
         try:
-            database = self.notion.get_database(self.albums_db_id)
-            if not database:
-                logger.error("Could not retrieve Albums database schema")
+            schema = self.notion.get_database(getattr(self, f'{database}_db_id'))
+            if not schema:
+                logger.error(f"Could not retrieve {name} database schema")
                 return
             
-            properties = database.get('properties', {})
-            
             # Create property ID to key mapping
-            for prop_key, prop_data in properties.items():
-                prop_id = prop_data.get('id')
-                if prop_id:
-                    self.albums_property_id_to_key[prop_id] = prop_key
-            
-            # Map property IDs
-            self.albums_properties = {
-                'title': ALBUMS_TITLE_PROPERTY_ID,
-                'musicbrainz_id': ALBUMS_MUSICBRAINZ_ID_PROPERTY_ID,
-                'artist': ALBUMS_ARTIST_PROPERTY_ID,
-                'release_date': ALBUMS_RELEASE_DATE_PROPERTY_ID,
-                'country': ALBUMS_COUNTRY_PROPERTY_ID,
-                'label': ALBUMS_LABEL_PROPERTY_ID,
-                'type': ALBUMS_TYPE_PROPERTY_ID,
-                'listen': ALBUMS_LISTEN_PROPERTY_ID,
-                'status': ALBUMS_STATUS_PROPERTY_ID,
-                'packaging': ALBUMS_PACKAGING_PROPERTY_ID,
-                'barcode': ALBUMS_BARCODE_PROPERTY_ID,
-                'format': ALBUMS_FORMAT_PROPERTY_ID,
-                'track_count': ALBUMS_TRACK_COUNT_PROPERTY_ID,
-                'description': ALBUMS_DESCRIPTION_PROPERTY_ID,
-                'genres': ALBUMS_GENRES_PROPERTY_ID,
-                'tags': ALBUMS_TAGS_PROPERTY_ID,
-                'rating': ALBUMS_RATING_PROPERTY_ID,
-                'cover_image': ALBUMS_COVER_IMAGE_PROPERTY_ID,
-                'musicbrainz_url': ALBUMS_MUSICBRAINZ_URL_PROPERTY_ID,
-                'last_updated': ALBUMS_LAST_UPDATED_PROPERTY_ID,
-                'songs': ALBUMS_SONGS_PROPERTY_ID,
+            id_to_key = {
+                prop_data['id']: prop_key
+                for prop_key, prop_data in schema.get('properties', {}).items()
+                if prop_data.get('id')
             }
             
-            logger.info("✓ Albums database schema loaded")
-            
-        except Exception as e:
-            logger.error(f"Error loading Albums database schema: {e}")
-    
-    def _load_songs_schema(self):
-        """Load and analyze the Songs database schema."""
-        try:
-            database = self.notion.get_database(self.songs_db_id)
-            if not database:
-                logger.error("Could not retrieve Songs database schema")
-                return
-            
-            properties = database.get('properties', {})
-            
-            # Create property ID to key mapping
-            for prop_key, prop_data in properties.items():
-                prop_id = prop_data.get('id')
-                if prop_id:
-                    self.songs_property_id_to_key[prop_id] = prop_key
-            
             # Map property IDs
-            self.songs_properties = {
-                'title': SONGS_TITLE_PROPERTY_ID,
-                'musicbrainz_id': SONGS_MUSICBRAINZ_ID_PROPERTY_ID,
-                'artist': SONGS_ARTIST_PROPERTY_ID,
-                'album': SONGS_ALBUM_PROPERTY_ID,
-                'track_number': SONGS_TRACK_NUMBER_PROPERTY_ID,
-                'length': SONGS_LENGTH_PROPERTY_ID,
-                'isrc': SONGS_ISRC_PROPERTY_ID,
-                'disambiguation': SONGS_DISAMBIGUATION_PROPERTY_ID,
-                'description': SONGS_DESCRIPTION_PROPERTY_ID,
-                'genres': SONGS_GENRES_PROPERTY_ID,
-                'tags': SONGS_TAGS_PROPERTY_ID,
-                'listen': SONGS_LISTEN_PROPERTY_ID,
-                'rating': SONGS_RATING_PROPERTY_ID,
-                'musicbrainz_url': SONGS_MUSICBRAINZ_URL_PROPERTY_ID,
-                'last_updated': SONGS_LAST_UPDATED_PROPERTY_ID,
-            }
+            property_ids = _property_ids(database.upper(), DATABASE_FIELDS[database])
             
-            logger.info("✓ Songs database schema loaded")
+            # Resolve each field straight to its property key so formatters need a single lookup
+            keys = {field: id_to_key[prop_id] for field, prop_id in property_ids.items() if prop_id in id_to_key}
             
-        except Exception as e:
-            logger.error(f"Error loading Songs database schema: {e}")
-    
-    def _load_labels_schema(self):
-        """Load and analyze the Labels database schema."""
-        try:
-            database = self.notion.get_database(self.labels_db_id)
-            if not database:
-                logger.error("Could not retrieve Labels database schema")
-                return
+            setattr(self, f'{database}_keys', keys)
             
-            properties = database.get('properties', {})
-            
-            # Create property ID to key mapping
-            for prop_key, prop_data in properties.items():
-                prop_id = prop_data.get('id')
-                if prop_id:
-                    self.labels_property_id_to_key[prop_id] = prop_key
-            
-            # Map property IDs
-            self.labels_properties = {
-                'title': LABELS_TITLE_PROPERTY_ID,
-                'musicbrainz_id': LABELS_MUSICBRAINZ_ID_PROPERTY_ID,
-                'type': LABELS_TYPE_PROPERTY_ID,
-                'country': LABELS_COUNTRY_PROPERTY_ID,
-                'begin_date': LABELS_BEGIN_DATE_PROPERTY_ID,
-                'end_date': LABELS_END_DATE_PROPERTY_ID,
-                'disambiguation': LABELS_DISAMBIGUATION_PROPERTY_ID,
-                'description': LABELS_DESCRIPTION_PROPERTY_ID,
-                'genres': LABELS_GENRES_PROPERTY_ID,
-                'tags': LABELS_TAGS_PROPERTY_ID,
-                'rating': LABELS_RATING_PROPERTY_ID,
-                'last_updated': LABELS_LAST_UPDATED_PROPERTY_ID,
-                'musicbrainz_url': LABELS_MUSICBRAINZ_URL_PROPERTY_ID,
-                'official_website': LABELS_OFFICIAL_WEBSITE_PROPERTY_ID,
-                'ig': LABELS_IG_PROPERTY_ID,
-                'bandcamp': LABELS_BANDCAMP_PROPERTY_ID,
-                'founded': LABELS_FOUNDED_PROPERTY_ID,
-                'albums': LABELS_ALBUMS_PROPERTY_ID,
-                'area': LABELS_AREA_PROPERTY_ID,
-            }
-            
-            logger.info("✓ Labels database schema loaded")
+            logger.info(f"✓ {name} database schema loaded")
             
         except Exception as e:
-            logger.error(f"Error loading Labels database schema: {e}")
+            logger.error(f"Error loading {name} database schema: {e}")
     
-    def _get_property_key(self, property_id: Optional[str], database: str) -> Optional[str]:
-        """Get the property key for a given property ID in a specific database."""
-        if not property_id:
-            return None
-        
-        if database == 'artists':
-            return self.artists_property_id_to_key.get(property_id)
-        elif database == 'albums':
-            return self.albums_property_id_to_key.get(property_id)
-        elif database == 'songs':
-            return self.songs_property_id_to_key.get(property_id)
-        elif database == 'labels':
-            return self.labels_property_id_to_key.get(property_id)
-        return None
+    def _last_updated_timestamp(self) -> str:
+        """Timestamp for Last Updated properties, shared by every page in a sync run."""
+        return self._sync_timestamp or datetime.now(timezone.utc).isoformat(timespec='seconds')
+    
+    def _update_synced_page(self, page: Dict, properties: Dict, cover_url: Optional[str] = None,
+                            icon: Optional[Dict] = None) -> bool:
+        """Update a synced page, sending only the properties, cover and icon it doesn't already have."""
+        current = page.get('properties', {})
+        changed = {key: value for key, value in properties.items()
+                   if _property_value(value) != _property_value(current.get(key))}
+        logger.debug("Updating %d of %d properties on page %s", len(changed), len(properties), page['id'])
+        
+        current_cover = ((page.get('cover') or {}).get('external') or {}).get('url')
+        return self.notion.update_page(
+            page['id'],
+            changed,
+            cover_url if cover_url != current_cover else None,
+            icon if icon != page.get('icon') else None
+        )
     
     def sync_artist_page(self, page: Dict, force_all: bool = False) -> Optional[bool]:
         """Sync a single artist page with MusicBrainz data."""
@@ -1043,46 +1204,33 @@ class NotionMusicBrainzSync:
             properties = page.get('properties', {})
             
             # Extract title
-            title_prop_id = self.artists_properties.get('title')
-            if not title_prop_id:
-                logger.warning(f"Missing title property for Artists database")
-                return None
-            
-            title_key = self._get_property_key(title_prop_id, 'artists')
+            title_key = self.artists_keys.get('title')
             if not title_key:
-                logger.warning(f"Could not find title property key")
+                logger.warning(f"Missing title property for Artists database")
                 return None
             
-            title_prop = properties.get(title_key, {})
-            if title_prop.get('type') != 'title' or not title_prop.get('title'):
+            title = _first_plain_text(properties, title_key)
+            if not title:
                 logger.warning(f"Missing title for page {page_id}")
                 return None
             
-            title = title_prop['title'][0]['plain_text']
             logger.info(f"Processing artist: {title}")
             
             # Check for existing MBID
-            mb_id_prop_id = self.artists_properties.get('musicbrainz_id')
-            existing_mbid = None
-            if mb_id_prop_id:
-                mb_id_key = self._get_property_key(mb_id_prop_id, 'artists')
-                if mb_id_key:
-                    mb_id_prop = properties.get(mb_id_key, {})
-                    # MBID is stored as rich_text (UUID string)
-                    if mb_id_prop.get('rich_text') and mb_id_prop['rich_text']:
-                        existing_mbid = mb_id_prop['rich_text'][0]['plain_text']
+            existing_mbid = self._get_mbid_from_page(page, 'artists')
             
             # Search or get artist data
             artist_data = None
+            if existing_mbid and not force_all:
+                # Skip pages with existing MBIDs unless force_all is True, before any MusicBrainz request
+                logger.info(f"Skipping artist '{title}' - already has MBID {existing_mbid} (use --force-all to update)")
+                return None
+            
             if existing_mbid:
                 artist_data = self.mb.get_artist(existing_mbid)
                 if not artist_data:
                     logger.warning(f"Could not find artist with MBID {existing_mbid}, searching by name")
                     existing_mbid = None
-                elif not force_all:
-                    # Skip pages with existing MBIDs unless force_all is True
-                    logger.info(f"Skipping artist '{title}' - already has MBID {existing_mbid} (use --force-all to update)")
-                    return None
             
             if not artist_data:
                 search_results = self.mb.search_artists(title, limit=5)
@@ -1090,8 +1238,15 @@ class NotionMusicBrainzSync:
                     logger.warning(f"Could not find artist: {title}")
                     return False
                 
-                # Select best match (first result for now)
-                best_match = search_results[0]
+                # Prefer an exact name match among the candidates (results are already ordered
+                # by score), falling back to the top-scoring result. Search results lack genres
+                # and relations, so the chosen artist is still looked up (a cached call on repeats).
+                title_words = self._normalize_title_for_matching(title)
+                best_match = next(
+                    (result for result in search_results
+                     if self._normalize_title_for_matching(result.get('name', '')) == title_words),
+                    search_results[0]
+                )
                 artist_data = self.mb.get_artist(best_match['id'])
             
             if not artist_data:
@@ -1115,10 +1270,10 @@ class NotionMusicBrainzSync:
                     logger.debug(f"No artist image found for {title}")
             
             # Set icon (use emoji if no image, otherwise image will be cover)
-            icon = '🎤'  # Microphone emoji for artists
+            icon = ARTIST_ICON
             
             # Update the page (use artist image as cover if available)
-            if self.notion.update_page(page_id, notion_props, artist_image_url, icon):
+            if self._update_synced_page(page, notion_props, artist_image_url, icon):
                 logger.info(f"Successfully updated artist: {title}")
                 return True
             else:
@@ -1131,338 +1286,334 @@ class NotionMusicBrainzSync:
     
     def _format_artist_properties(self, artist_data: Dict) -> Dict:
         """Format MusicBrainz artist data for Notion properties."""
+        if not artist_data:
+            return {}
+        
         properties = {}
+        keys = self.artists_keys
         
         try:
+            # Area section, read by both the Area and Country properties
+            area = artist_data.get('area') or {}
+            
             # Title (name)
-            if artist_data.get('name') and self.artists_properties.get('title'):
-                prop_key = self._get_property_key(self.artists_properties['title'], 'artists')
-                if prop_key:
-                    properties[prop_key] = {
-                        'title': [{'text': {'content': artist_data['name']}}]
-                    }
+            prop_key = keys.get('title')
+            if prop_key and artist_data.get('name'):
+                properties[prop_key] = {
+                    'title': [{'text': {'content': artist_data['name']}}]
+                }
             
             # MusicBrainz ID (store as string in rich_text since MBIDs are UUIDs)
-            if artist_data.get('id') and self.artists_properties.get('musicbrainz_id'):
-                prop_key = self._get_property_key(self.artists_properties['musicbrainz_id'], 'artists')
-                if prop_key:
-                    # Store MBID as string - it's a UUID, not a number
-                    properties[prop_key] = {
-                        'rich_text': [{'text': {'content': artist_data['id']}}]
-                    }
+            prop_key = keys.get('musicbrainz_id')
+            if prop_key and artist_data.get('id'):
+                # Store MBID as string - it's a UUID, not a number
+                properties[prop_key] = {
+                    'rich_text': [{'text': {'content': artist_data['id']}}]
+                }
             
             # Sort name
-            if artist_data.get('sort-name') and self.artists_properties.get('sort_name'):
-                prop_key = self._get_property_key(self.artists_properties['sort_name'], 'artists')
-                if prop_key:
-                    properties[prop_key] = {
-                        'rich_text': [{'text': {'content': artist_data['sort-name']}}]
-                    }
+            prop_key = keys.get('sort_name')
+            if prop_key and artist_data.get('sort-name'):
+                properties[prop_key] = {
+                    'rich_text': [{'text': {'content': artist_data['sort-name']}}]
+                }
             
             # Type
-            if artist_data.get('type') and self.artists_properties.get('type'):
-                prop_key = self._get_property_key(self.artists_properties['type'], 'artists')
-                if prop_key:
-                    properties[prop_key] = {'select': {'name': artist_data['type']}}
+            prop_key = keys.get('type')
+            if prop_key and artist_data.get('type'):
+                properties[prop_key] = {'select': {'name': artist_data['type']}}
             
             # Gender
-            if artist_data.get('gender') and self.artists_properties.get('gender'):
-                prop_key = self._get_property_key(self.artists_properties['gender'], 'artists')
-                if prop_key:
-                    properties[prop_key] = {'select': {'name': artist_data['gender']}}
+            prop_key = keys.get('gender')
+            if prop_key and artist_data.get('gender'):
+                properties[prop_key] = {'select': {'name': artist_data['gender']}}
             
             # Area (relation to Locations database)
-            if artist_data.get('area') and artist_data['area'].get('name') and self.artists_properties.get('area') and self.locations_db_id:
-                area_name = artist_data['area']['name']
-                location_page_id = self._find_or_create_location_page(area_name)
+            prop_key = keys.get('area')
+            if prop_key and self.locations_db_id and area.get('name'):
+                location_page_id = self._find_or_create_location_page(area['name'])
                 if location_page_id:
-                    prop_key = self._get_property_key(self.artists_properties['area'], 'artists')
-                    if prop_key:
-                        properties[prop_key] = {
-                            'relation': [{'id': location_page_id}]
-                        }
+                    properties[prop_key] = {
+                        'relation': [{'id': location_page_id}]
+                    }
             
             # Born In (relation to Locations database)
-            if self.artists_properties.get('born_in') and self.locations_db_id:
-                born_in_location = None
+            prop_key = keys.get('born_in')
+            if prop_key and self.locations_db_id:
                 # Try to get from begin-area
-                if artist_data.get('begin-area') and artist_data['begin-area'].get('name'):
-                    born_in_location = artist_data['begin-area']['name']
+                born_in_location = (artist_data.get('begin-area') or {}).get('name')
                 
-                prop_key = self._get_property_key(self.artists_properties['born_in'], 'artists')
-                if prop_key:
-                    if born_in_location:
-                        # Only set relation if we have data from MusicBrainz
-                        location_page_id = self._find_or_create_location_page(born_in_location)
-                        if location_page_id:
-                            properties[prop_key] = {
-                                'relation': [{'id': location_page_id}]
-                            }
-                    # If no data from MusicBrainz, explicitly clear the relation
-                    else:
+                if born_in_location:
+                    # Only set relation if we have data from MusicBrainz
+                    location_page_id = self._find_or_create_location_page(born_in_location)
+                    if location_page_id:
                         properties[prop_key] = {
-                            'relation': []
+                            'relation': [{'id': location_page_id}]
                         }
+                # If no data from MusicBrainz, explicitly clear the relation
+                else:
+                    properties[prop_key] = {
+                        'relation': []
+                    }
             
-            # Extract URLs from relationships
-            ig_url = None
-            website_url = None
-            youtube_url = None
-            bandcamp_url = None
-            spotify_url = None
-            
-            if artist_data.get('relations'):
-                for relation in artist_data['relations']:
-                    relation_type = relation.get('type', '').lower()
-                    url_resource = relation.get('url', {}).get('resource', '').lower()
-                    
-                    # Instagram
-                    if relation_type == 'instagram' or (relation_type == 'social network' and 'instagram' in url_resource):
-                        ig_url = relation.get('url', {}).get('resource')
-                    # Official homepage/website
-                    elif relation_type == 'official homepage' or relation_type == 'official website':
-                        website_url = relation.get('url', {}).get('resource')
-                    # YouTube (exclude YouTube Music)
-                    elif ('youtube' in url_resource or 'youtu.be' in url_resource) and 'music.youtube.com' not in url_resource:
-                        youtube_url = relation.get('url', {}).get('resource')
-                    # Bandcamp
-                    elif 'bandcamp' in url_resource:
-                        bandcamp_url = relation.get('url', {}).get('resource')
-                    # Spotify
-                    elif 'spotify' in url_resource:
-                        spotify_url = relation.get('url', {}).get('resource')
+            # Extract URLs from relationships, keyed by link kind
+            relation_urls = {}
+            
+            for relation in artist_data.get('relations') or ():
+                relation_type = relation.get('type', '').lower()
+                url_resource = relation.get('url', {}).get('resource', '')
+                
+                # Official homepage/website and explicit Instagram relations are identified by type
+                if relation_type == 'instagram':
+                    link_kind = 'instagram'
+                elif relation_type in OFFICIAL_WEBSITE_RELATION_TYPES:
+                    link_kind = 'website'
+                else:
+                    match = ARTIST_LINK_RE.search(url_resource.lower())
+                    link_kind = match.lastgroup if match else None
+                    if link_kind == 'youtube_music':
+                        link_kind = None
+                    # Instagram URLs only count under a social network relation
+                    if link_kind == 'instagram' and relation_type != 'social network':
+                        link_kind = None
+                
+                if link_kind and url_resource:
+                    relation_urls[link_kind] = url_resource
+            
+            ig_url = relation_urls.get('instagram')
+            website_url = relation_urls.get('website')
+            youtube_url = relation_urls.get('youtube')
+            bandcamp_url = relation_urls.get('bandcamp')
+            spotify_url = relation_urls.get('spotify')
             
             # IG Link
-            if ig_url and self.artists_properties.get('ig_link'):
-                prop_key = self._get_property_key(self.artists_properties['ig_link'], 'artists')
-                if prop_key:
-                    properties[prop_key] = {'url': ig_url}
+            prop_key = keys.get('ig_link')
+            if prop_key and ig_url:
+                properties[prop_key] = {'url': ig_url}
             
             # Official Website Link
-            if website_url and self.artists_properties.get('website_link'):
-                prop_key = self._get_property_key(self.artists_properties['website_link'], 'artists')
-                if prop_key:
-                    properties[prop_key] = {'url': website_url}
+            prop_key = keys.get('website_link')
+            if prop_key and website_url:
+                properties[prop_key] = {'url': website_url}
             
             # YouTube Link
-            if youtube_url and self.artists_properties.get('youtube_link'):
-                prop_key = self._get_property_key(self.artists_properties['youtube_link'], 'artists')
-                if prop_key:
-                    properties[prop_key] = {'url': youtube_url}
+            prop_key = keys.get('youtube_link')
+            if prop_key and youtube_url:
+                properties[prop_key] = {'url': youtube_url}
             
             # Bandcamp Link
-            if bandcamp_url and self.artists_properties.get('bandcamp_link'):
-                prop_key = self._get_property_key(self.artists_properties['bandcamp_link'], 'artists')
-                if prop_key:
-                    properties[prop_key] = {'url': bandcamp_url}
+            prop_key = keys.get('bandcamp_link')
+            if prop_key and bandcamp_url:
+                properties[prop_key] = {'url': bandcamp_url}
             
             # Streaming Link (Spotify)
-            if spotify_url and self.artists_properties.get('streaming_link'):
-                prop_key = self._get_property_key(self.artists_properties['streaming_link'], 'artists')
-                if prop_key:
-                    properties[prop_key] = {'url': spotify_url}
+            prop_key = keys.get('streaming_link')
+            if prop_key and spotify_url:
+                properties[prop_key] = {'url': spotify_url}
             
             # Country
-            if artist_data.get('area') and artist_data['area'].get('iso-3166-1-code-list'):
-                country_code = artist_data['area']['iso-3166-1-code-list'][0]
-                if self.artists_properties.get('country'):
-                    prop_key = self._get_property_key(self.artists_properties['country'], 'artists')
-                    if prop_key:
-                        properties[prop_key] = {'select': {'name': country_code}}
+            prop_key = keys.get('country')
+            if prop_key and area.get('iso-3166-1-code-list'):
+                properties[prop_key] = {'select': {'name': area['iso-3166-1-code-list'][0]}}
             
             # Begin date and End date - based on first and latest release dates
             # Using a single date property with start (first release) and end (latest release)
-            if artist_data.get('id'):
+            prop_key = keys.get('begin_date')
+            if prop_key and artist_data.get('id'):
                 # Fetch releases for this artist to get release dates
-                release_dates = self._get_artist_release_dates(artist_data['id'])
+                release_date_range = self._get_artist_release_dates(artist_data['id'])
                 
-                if release_dates:
-                    # Begin date = earliest release date (start of range)
-                    earliest_date = min(release_dates)
-                    # End date = latest release date (end of range)
-                    latest_date = max(release_dates)
+                if release_date_range:
+                    # Begin date = earliest release date, End date = latest release date
+                    earliest_date, latest_date = release_date_range
                     
-                    if self.artists_properties.get('begin_date'):
-                        prop_key = self._get_property_key(self.artists_properties['begin_date'], 'artists')
-                        if prop_key:
-                            # Set both start and end dates in the same date property
-                            properties[prop_key] = {
-                                'date': {
-                                    'start': earliest_date[:10],  # First release date
-                                    'end': latest_date[:10]       # Latest release date
-                                }
-                            }
-            
-            # Disambiguation
-            if artist_data.get('disambiguation') and self.artists_properties.get('disambiguation'):
-                prop_key = self._get_property_key(self.artists_properties['disambiguation'], 'artists')
-                if prop_key:
+                    # Set both start and end dates in the same date property
                     properties[prop_key] = {
-                        'rich_text': [{'text': {'content': artist_data['disambiguation']}}]
+                        'date': {
+                            'start': earliest_date[:10],  # First release date
+                            'end': latest_date[:10]       # Latest release date
+                        }
                     }
             
+            # Disambiguation
+            prop_key = keys.get('disambiguation')
+            if prop_key and artist_data.get('disambiguation'):
+                properties[prop_key] = {
+                    'rich_text': [{'text': {'content': artist_data['disambiguation']}}]
+                }
+            
             # Genres - use only genres directly from the artist (not from release-groups)
             # This matches what MusicBrainz shows on the artist page
-            if artist_data.get('genres') and self.artists_properties.get('genres'):
-                genres = [genre['name'] for genre in artist_data['genres'] if genre.get('name')]
-                if genres:
-                    prop_key = self._get_property_key(self.artists_properties['genres'], 'artists')
-                    if prop_key:
-                        properties[prop_key] = {
-                            'multi_select': [{'name': genre} for genre in genres[:10]]  # Limit to 10 genres
-                        }
+            # One pass collects the names for both the payload and the tag filter below
+            genre_list = [genre['name'] for genre in artist_data.get('genres') or () if genre.get('name')]
+            genre_names = frozenset(genre.casefold() for genre in genre_list)
+            prop_key = keys.get('genres')
+            if prop_key and genre_list:
+                properties[prop_key] = {
+                    'multi_select': [{'name': genre} for genre in genre_list[:10]]  # Limit to 10 genres
+                }
             
             # Tags - these are separate from genres and come directly from the artist
             # Only include tags that are different from genres (genres have priority)
-            if artist_data.get('tags') and self.artists_properties.get('tags'):
-                # Get genre names for comparison
-                genre_names = set()
-                if artist_data.get('genres'):
-                    genre_names = {genre['name'] for genre in artist_data['genres'] if genre.get('name')}
-                
-                # Filter tags: exclude tags that match genres (genres have priority)
-                tags = []
-                for tag in artist_data['tags']:
-                    tag_name = tag.get('name')
-                    # Only include tags that:
-                    # 1. Have a name
-                    # 2. Are different from genres (genres take priority)
-                    if tag_name and tag_name not in genre_names:
-                        tags.append(tag_name)
-                
+            prop_key = keys.get('tags')
+            if prop_key and artist_data.get('tags'):
+                tags = _multi_select(artist_data['tags'], exclude=genre_names)  # Limit to 10 tags
                 if tags:
-                    prop_key = self._get_property_key(self.artists_properties['tags'], 'artists')
-                    if prop_key:
-                        properties[prop_key] = {
-                            'multi_select': [{'name': tag} for tag in tags[:10]]  # Limit to 10 tags
-                        }
+                    properties[prop_key] = {'multi_select': tags}
             
             # MusicBrainz URL
-            if artist_data.get('id') and self.artists_properties.get('musicbrainz_url'):
-                mb_url = f"https://musicbrainz.org/artist/{artist_data['id']}"
-                prop_key = self._get_property_key(self.artists_properties['musicbrainz_url'], 'artists')
-                if prop_key:
-                    properties[prop_key] = {'url': mb_url}
+            prop_key = keys.get('musicbrainz_url')
+            if prop_key and artist_data.get('id'):
+                properties[prop_key] = {'url': f"https://musicbrainz.org/artist/{artist_data['id']}"}
             
             # Last updated
-            if self.artists_properties.get('last_updated'):
-                prop_key = self._get_property_key(self.artists_properties['last_updated'], 'artists')
-                if prop_key:
-                    properties[prop_key] = {'date': {'start': datetime.now().isoformat()}}
+            prop_key = keys.get('last_updated')
+            if prop_key:
+                properties[prop_key] = {'date': {'start': self._last_updated_timestamp()}}
             
         except Exception as e:
             logger.error(f"Error formatting artist properties: {e}")
         
         return properties
     
-    def _get_artist_release_dates(self, artist_mbid: str) -> List[str]:
-        """Get all release dates for an artist from MusicBrainz."""
-        release_dates = []
+    def _get_artist_release_dates(self, artist_mbid: str) -> Optional[Tuple[str, str]]:
+        """Get the earliest and latest release dates for an artist from MusicBrainz."""
+        # Cached alongside MusicBrainz lookups (and on disk for a day when enabled)
+        hit, date_range = self.mb._get_cached('artist_release_dates', artist_mbid)
+        if hit:
+            return tuple(date_range) if date_range else None
+        
+        date_range = None
         
         try:
-            # Search for releases by this artist
+            # Browse the artist's releases (an indexed lookup, unlike a search query)
             url = f"{self.mb.base_url}/release"
             params = {
-                'query': f'arid:{artist_mbid}',
+                'artist': artist_mbid,
                 'limit': 100,  # Get up to 100 releases
                 'fmt': 'json'
             }
             
             response = self.mb._make_api_request(url, params)
-            data = response.json()
-            
-            releases = data.get('releases', [])
+            releases = _json_loads(response.content).get('releases', [])
             
+            # Keep only a running min/max; normalized YYYY-MM-DD strings compare correctly as text
+            earliest_date = latest_date = None
+            date_count = 0
             for release in releases:
-                if release.get('date'):
-                    release_date = release['date']
-                    # Only add valid dates (YYYY-MM-DD format or partial)
-                    # Normalize partial dates: YYYY -> YYYY-01-01, YYYY-MM -> YYYY-MM-01
-                    if release_date and len(release_date) >= 4:  # At least YYYY
-                        # Normalize to YYYY-MM-DD format for proper comparison
-                        normalized_date = self._normalize_date(release_date)
-                        if normalized_date:
-                            release_dates.append(normalized_date)
-            
-            logger.debug(f"Found {len(release_dates)} release dates for artist {artist_mbid}")
+                release_date = release.get('date')
+                # Only use valid dates (YYYY-MM-DD format or partial, at least YYYY)
+                if not release_date or len(release_date) < 4:
+                    continue
+                # Normalize partial dates: YYYY -> YYYY-01-01, YYYY-MM -> YYYY-MM-01
+                normalized_date = self._normalize_date(release_date)
+                if not normalized_date:
+                    continue
+                date_count += 1
+                if earliest_date is None or normalized_date < earliest_date:
+                    earliest_date = normalized_date
+                if latest_date is None or normalized_date > latest_date:
+                    latest_date = normalized_date
+            
+            if earliest_date:
+                date_range = (earliest_date, latest_date)
+            
+            logger.debug(f"Found {date_count} release dates for artist {artist_mbid}")
+            self.mb._set_cached('artist_release_dates', artist_mbid, date_range, ttl=24 * 3600)
             
         except Exception as e:
             logger.warning(f"Error fetching release dates for artist {artist_mbid}: {e}")
         
-        return release_dates
+        return date_range
+    
+    def _get_related_page(self, page_id: str) -> Optional[Dict]:
+        """Get a related page, reusing it if another page already fetched it during this sync."""
+        return self._get_related_pages([page_id]).get(page_id)
+    
+    def _get_related_pages(self, page_ids: List[str]) -> Dict[str, Optional[Dict]]:
+        """Get several related pages, fetching only those not already cached (concurrently)."""
+        pages = {}
+        for page_id in page_ids:
+            try:
+                pages[page_id] = self._related_page_cache[page_id]
+            except KeyError:
+                pass
+        
+        missing = [page_id for page_id in page_ids if page_id not in pages]
+        if missing:
+            for page_id, page in self.notion.get_pages(missing).items():
+                pages[page_id] = page
+                if page:
+                    self._related_page_cache[page_id] = page
+        return pages
     
-    def _get_mbid_from_related_page(self, page_id: str, database_type: str) -> Optional[str]:
-        """Get MusicBrainz ID from a related page.
+    def _get_page_title(self, page: Dict, database_type: str) -> Optional[str]:
+        """Get the plain-text title of an already-fetched related page."""
+        return _first_plain_text(page.get('properties', {}), getattr(self, f'{database_type}_keys').get('title'))
+    
+    def _get_mbid_from_page(self, page: Dict, database_type: str) -> Optional[str]:
+        """Get MusicBrainz ID from a page being synced or an already-fetched related page.
         
         Args:
-            page_id: The Notion page ID
+            page: The Notion page
             database_type: 'artists', 'albums', 'songs', or 'labels'
             
         Returns:
             The MusicBrainz ID if found, None otherwise
         """
         try:
-            page = self.notion.get_page(page_id)
-            if not page:
-                return None
-            
-            properties = page.get('properties', {})
-            
-            # Get the MBID property ID based on database type
-            mb_id_prop_id = None
-            if database_type == 'artists':
-                mb_id_prop_id = self.artists_properties.get('musicbrainz_id')
-            elif database_type == 'albums':
-                mb_id_prop_id = self.albums_properties.get('musicbrainz_id')
-            elif database_type == 'songs':
-                mb_id_prop_id = self.songs_properties.get('musicbrainz_id')
-            elif database_type == 'labels':
-                mb_id_prop_id = self.labels_properties.get('musicbrainz_id')
-            
-            if not mb_id_prop_id:
-                return None
-            
-            # Get the property key
-            prop_key = self._get_property_key(mb_id_prop_id, database_type)
-            if not prop_key:
-                return None
-            
+            prop_key = getattr(self, f'{database_type}_keys').get('musicbrainz_id')
             # Extract MBID from rich_text
-            mb_id_prop = properties.get(prop_key, {})
-            if mb_id_prop.get('rich_text') and mb_id_prop['rich_text']:
-                return mb_id_prop['rich_text'][0]['plain_text']
-            
-            return None
+            return _first_plain_text(page.get('properties', {}), prop_key, 'rich_text')
         except Exception as e:
-            logger.debug(f"Error getting MBID from related page {page_id}: {e}")
+            logger.debug(f"Error getting MBID from page {page.get('id')}: {e}")
             return None
     
-    def _recording_appears_on_album(self, recording_id: str, album_mbid: str) -> bool:
-        """Check if a recording appears on a specific album.
+    def _get_album_recording_ids(self, album_mbid: str) -> Dict[str, Optional[str]]:
+        """Get the recordings on a specific album, keyed by recording MBID.
         
         Args:
-            recording_id: The recording MBID
             album_mbid: The album (release) MBID
             
         Returns:
-            True if the recording appears on the album, False otherwise
+            The album's recording MBID -> track position map, or an empty dict if
+            the album could not be fetched
         """
         try:
-            # Get the album/release data
-            release_data = self.mb.get_release(album_mbid)
-            if not release_data:
-                return False
-            
-            # Check if any medium contains this recording
-            for medium in release_data.get('media', []):
-                for track in medium.get('tracks', []):
-                    if track.get('recording') and track['recording'].get('id') == recording_id:
-                        return True
-            
-            return False
+            try:
+                return self._release_track_positions[album_mbid]
+            except KeyError:
+                release_data = self.mb.get_release(album_mbid)
+                return self._get_track_positions(release_data) if release_data else {}
         except Exception as e:
-            logger.debug(f"Error checking if recording {recording_id} appears on album {album_mbid}: {e}")
-            return False
+            logger.debug(f"Error getting recordings for album {album_mbid}: {e}")
+            return {}
+    
+    def _get_track_positions(self, release_data: Dict) -> Dict[str, Optional[str]]:
+        """Map each recording MBID on a release to its (first) track position.
+        
+        Only complete track lists are cached, since releases embedded in other
+        entities may list just some of their tracks.
+        """
+        release_mbid = release_data.get('id')
+        try:
+            return self._release_track_positions[release_mbid]
+        except KeyError:
+            pass
+        
+        positions = {}
+        complete = True
+        for medium in release_data.get('media', []):
+            tracks = medium.get('tracks', [])
+            complete = complete and len(tracks) == medium.get('track-count', len(tracks))
+            for track in tracks:
+                recording_id = (track.get('recording') or {}).get('id')
+                if recording_id and not positions.get(recording_id):
+                    positions[recording_id] = track.get('position')
+        
+        if release_mbid and complete:
+            self._release_track_positions[release_mbid] = positions
+        return positions
     
     def _release_is_by_artist(self, release_data: Dict, artist_mbid: str) -> bool:
         """Check if a release is by a specific artist.
@@ -1475,64 +1626,52 @@ class NotionMusicBrainzSync:
             True if the release is by the artist, False otherwise
         """
         try:
-            # Check artist-credit
-            if release_data.get('artist-credit'):
-                for ac in release_data['artist-credit']:
-                    if ac.get('artist') and ac['artist'].get('id') == artist_mbid:
-                        return True
-            
-            # Check release-group artist-credit
-            if release_data.get('release-group') and release_data['release-group'].get('artist-credit'):
-                for ac in release_data['release-group']['artist-credit']:
-                    if ac.get('artist') and ac['artist'].get('id') == artist_mbid:
-                        return True
-            
-            return False
+            # Check the release's artist-credit, then the release group's
+            artist_credits = chain(
+                release_data.get('artist-credit') or (),
+                (release_data.get('release-group') or {}).get('artist-credit') or ()
+            )
+            return any((ac.get('artist') or {}).get('id') == artist_mbid for ac in artist_credits)
         except Exception as e:
             logger.debug(f"Error checking if release is by artist {artist_mbid}: {e}")
             return False
     
-    def _release_contains_recordings(self, release_data: Dict, recording_mbids: List[str], recording_titles: List[str] = None) -> bool:
+    def _release_contains_recordings(self, release_data: Dict, required_mbids: frozenset,
+                                     required_titles: frozenset = frozenset()) -> bool:
         """Check if a release contains all specified recordings.
         
         Args:
             release_data: The release data from MusicBrainz
-            recording_mbids: List of recording MBIDs that must appear on the release
-            recording_titles: Optional list of recording titles to check if MBIDs aren't available
+            required_mbids: Recording MBIDs that must appear on the release
+            required_titles: Normalized recording titles (see _normalize_title_for_matching)
+                to check if MBIDs aren't available
             
         Returns:
             True if the release contains all recordings, False otherwise
         """
-        if not recording_mbids and not recording_titles:
+        if not required_mbids and not required_titles:
             return True
         
         try:
-            # Collect all recording IDs and titles from the release
-            release_recording_ids = set()
-            release_recording_titles = set()
-            for medium in release_data.get('media', []):
-                for track in medium.get('tracks', []):
-                    recording = track.get('recording', {})
-                    if recording.get('id'):
-                        release_recording_ids.add(recording['id'])
-                    if recording.get('title'):
-                        # Normalize title for comparison
-                        normalized_title = ' '.join(self._normalize_title_for_matching(recording['title']))
-                        release_recording_titles.add(normalized_title)
-            
-            # Check by MBID first (most reliable)
-            if recording_mbids:
-                required_set = set(recording_mbids)
-                if not required_set.issubset(release_recording_ids):
-                    return False
+            media = release_data.get('media', [])
             
-            # Check by title if MBIDs weren't available or as additional verification
-            if recording_titles:
-                required_titles = {' '.join(self._normalize_title_for_matching(title)) for title in recording_titles}
-                if not required_titles.issubset(release_recording_titles):
-                    return False
+            # A release with fewer tracks than required recordings can't contain them all
+            if sum(len(medium.get('tracks', [])) for medium in media) < max(len(required_mbids), len(required_titles)):
+                return False
             
-            return True
+            # Walk the tracks in one flattened pass, stopping as soon as everything required has been seen
+            missing_mbids = set(required_mbids)
+            missing_titles = set(required_titles)
+            recordings = (track.get('recording', {}) for medium in media for track in medium.get('tracks', ()))
+            for recording in recordings:
+                if missing_mbids and recording.get('id'):
+                    missing_mbids.discard(recording['id'])
+                if missing_titles and recording.get('title'):
+                    missing_titles.discard(self._normalize_title_for_matching(recording['title']))
+                if not missing_mbids and not missing_titles:
+                    return True
+            
+            return False
         except Exception as e:
             logger.debug(f"Error checking if release contains recordings: {e}")
             return False
@@ -1552,52 +1691,43 @@ class NotionMusicBrainzSync:
             existing_properties = page.get('properties', {})
             merged_properties = new_properties.copy()
             
-            # Get relation property IDs for this database type
-            relation_property_ids = []
-            if database_type == 'artists':
-                # Artists don't typically have relations to other artists/albums/songs in our schema
-                # But we should preserve any relations they might have
-                pass
-            elif database_type == 'albums':
-                relation_property_ids = [
-                    ('artist', self.albums_properties.get('artist')),
-                    ('songs', self.albums_properties.get('songs')),
-                    ('label', self.albums_properties.get('label')),
-                ]
-            elif database_type == 'songs':
-                relation_property_ids = [
-                    ('artist', self.songs_properties.get('artist')),
-                    ('album', self.songs_properties.get('album')),
-                ]
+            # Relation properties for this database type. Artists don't typically have
+            # relations to other artists/albums/songs in our schema, so theirs are left alone
+            relation_names = {
+                'albums': ('artist', 'songs', 'label'),
+                'songs': ('artist', 'album'),
+            }.get(database_type, ())
+            keys = getattr(self, f'{database_type}_keys')
             
             # Merge each relation property
-            for relation_name, relation_prop_id in relation_property_ids:
-                if not relation_prop_id:
-                    continue
-                
-                # Get property keys
-                new_prop_key = self._get_property_key(relation_prop_id, database_type)
+            for relation_name in relation_names:
+                new_prop_key = keys.get(relation_name)
                 if not new_prop_key:
                     continue
                 
-                # Get existing relations
+                # Get existing relations (in page order)
                 existing_relation_prop = existing_properties.get(new_prop_key, {})
                 existing_relations = existing_relation_prop.get('relation', [])
-                existing_relation_ids = {rel.get('id') for rel in existing_relations if rel.get('id')}
+                existing_relation_ids = [rel_id for rel in existing_relations if (rel_id := rel.get('id'))]
                 
                 # Get new relations (if the property exists in new_properties)
                 new_relation_prop = new_properties.get(new_prop_key, {})
                 new_relations = new_relation_prop.get('relation', [])
-                new_relation_ids = {rel.get('id') for rel in new_relations if rel.get('id')}
+                new_relation_ids = [rel_id for rel in new_relations if (rel_id := rel.get('id'))]
                 
                 # If new_properties has this relation property, merge with existing
                 # If it doesn't have it, preserve existing relations by not updating
                 if new_prop_key in new_properties:
-                    # Merge: combine existing and new, avoiding duplicates
-                    merged_relation_ids = existing_relation_ids | new_relation_ids
+                    if set(new_relation_ids).issubset(existing_relation_ids):
+                        # Nothing to add - leave the property out so the update doesn't rewrite it
+                        del merged_properties[new_prop_key]
+                        logger.debug(f"{relation_name} relations unchanged ({len(existing_relation_ids)} existing)")
+                        continue
+                    
+                    # Merge: existing relations first, then new ones, avoiding duplicates
+                    merged_relation_ids = list(dict.fromkeys(existing_relation_ids + new_relation_ids))
                     merged_relations = [{'id': rel_id} for rel_id in merged_relation_ids]
                     
-                    # Always set the merged relations (even if empty, to preserve existing if new is empty)
                     merged_properties[new_prop_key] = {'relation': merged_relations}
                     logger.debug(f"Merged {relation_name} relations: {len(existing_relations)} existing + {len(new_relations)} new = {len(merged_relations)} total")
                 elif existing_relations:
@@ -1612,40 +1742,27 @@ class NotionMusicBrainzSync:
             # Return new properties if merge fails
             return new_properties
     
-    def _normalize_title_for_matching(self, title: str) -> List[str]:
+    @staticmethod
+    @functools.lru_cache(maxsize=8192)
+    def _normalize_title_for_matching(title: str) -> Tuple[str, ...]:
         """Normalize a title for exact word matching.
         
         Removes special characters, converts to lowercase, and splits into words.
-        Used to compare titles word-for-word (not fuzzy matching).
-        
-        Args:
-            title: The title to normalize
-            
-        Returns:
-            List of normalized words
-        """
-        if not title:
-            return []
-        
-        # Remove special characters, keep only alphanumeric and spaces
-        normalized = re.sub(r'[^a-zA-Z0-9\s]', ' ', title)
-        # Convert to lowercase and split into words
-        words = [word for word in normalized.lower().split() if word]
-        return words
-    
-    def _titles_match_exactly(self, title1: str, title2: str) -> bool:
-        """Check if two titles match exactly (word-for-word, case-insensitive, ignoring special chars).
+        Used to compare titles word-for-word (not fuzzy matching). Results are
+        memoized since the same track titles are compared across many releases.
         
         Args:
-            title1: First title
-            title2: Second title
+            title: The title to normalize
             
         Returns:
-            True if titles match word-for-word, False otherwise
+            Tuple of normalized words (hashable, so usable as a set member)
         """
-        words1 = self._normalize_title_for_matching(title1)
-        words2 = self._normalize_title_for_matching(title2)
-        return words1 == words2
+        if not title:
+            return ()
+        
+        # Replace special characters with spaces (keeping only ASCII alphanumerics and
+        # whitespace), convert to lowercase and split into words
+        return tuple(title.translate(TITLE_CHAR_TABLE).lower().split())
     
     def _normalize_date(self, date_str: str) -> Optional[str]:
         """Normalize a date string to YYYY-MM-DD format for comparison.
@@ -1655,25 +1772,12 @@ class NotionMusicBrainzSync:
         - YYYY-MM -> YYYY-MM-01
         - YYYY-MM-DD -> YYYY-MM-DD (unchanged)
         """
-        if not date_str or len(date_str) < 4:
+        match = PARTIAL_DATE_RE.match(date_str or '')
+        if not match:
             return None
         
-        try:
-            parts = date_str.split('-')
-            year = parts[0]
-            
-            if len(parts) == 1:
-                # Just YYYY
-                return f"{year}-01-01"
-            elif len(parts) == 2:
-                # YYYY-MM
-                month = parts[1]
-                return f"{year}-{month}-01"
-            else:
-                # YYYY-MM-DD (or more)
-                return date_str[:10]  # Take first 10 chars (YYYY-MM-DD)
-        except Exception:
-            return None
+        year, month, day = match.groups()
+        return f"{year}-{month or '01'}-{day or '01'}"
     
     def sync_album_page(self, page: Dict, force_all: bool = False) -> Optional[bool]:
         """Sync a single album page with MusicBrainz data."""
@@ -1681,97 +1785,77 @@ class NotionMusicBrainzSync:
             page_id = page['id']
             properties = page.get('properties', {})
             
-            # Extract title
-            title_prop_id = self.albums_properties.get('title')
-            if not title_prop_id:
-                logger.warning(f"Missing title property for Albums database")
-                return None
+            keys = self.albums_keys
             
-            title_key = self._get_property_key(title_prop_id, 'albums')
+            # Extract title
+            title_key = keys.get('title')
             if not title_key:
-                logger.warning(f"Could not find title property key")
+                logger.warning(f"Missing title property for Albums database")
                 return None
             
-            title_prop = properties.get(title_key, {})
-            if title_prop.get('type') != 'title' or not title_prop.get('title'):
+            title = _first_plain_text(properties, title_key)
+            if not title:
                 logger.warning(f"Missing title for page {page_id}")
                 return None
             
-            title = title_prop['title'][0]['plain_text']
             logger.info(f"Processing album: {title}")
             
             # Try to extract artist name and MBID from relation
             artist_name = None
             artist_mbid = None
-            artist_prop_id = self.albums_properties.get('artist')
-            if artist_prop_id:
-                artist_key = self._get_property_key(artist_prop_id, 'albums')
-                if artist_key:
-                    artist_prop = properties.get(artist_key, {})
-                    if artist_prop.get('relation'):
-                        # Get first related artist
-                        relation = artist_prop['relation']
-                        if relation:
-                            # Fetch the artist page to get the name and MBID
-                            artist_page_id = relation[0]['id']
-                            artist_page = self.notion.get_page(artist_page_id)
-                            if artist_page:
-                                artist_props = artist_page.get('properties', {})
-                                artist_title_key = self._get_property_key(self.artists_properties.get('title'), 'artists')
-                                if artist_title_key and artist_props.get(artist_title_key):
-                                    artist_title_prop = artist_props[artist_title_key]
-                                    if artist_title_prop.get('title') and artist_title_prop['title']:
-                                        artist_name = artist_title_prop['title'][0]['plain_text']
-                                        logger.debug(f"Found artist from relation: {artist_name}")
-                                
-                                # Get artist MBID for verification
-                                artist_mbid = self._get_mbid_from_related_page(artist_page_id, 'artists')
-                                if artist_mbid:
-                                    logger.debug(f"Found artist MBID from relation: {artist_mbid}")
+            artist_key = keys.get('artist')
+            if artist_key:
+                artist_prop = properties.get(artist_key, {})
+                if artist_prop.get('relation'):
+                    # Get first related artist
+                    relation = artist_prop['relation']
+                    if relation:
+                        # Fetch the artist page to get the name and MBID
+                        artist_page_id = relation[0]['id']
+                        artist_page = self._get_related_page(artist_page_id)
+                        if artist_page:
+                            artist_name = self._get_page_title(artist_page, 'artists')
+                            if artist_name:
+                                logger.debug(f"Found artist from relation: {artist_name}")
+                            
+                            # Get artist MBID for verification
+                            artist_mbid = self._get_mbid_from_page(artist_page, 'artists')
+                            if artist_mbid:
+                                logger.debug(f"Found artist MBID from relation: {artist_mbid}")
             
             # Try to extract related song MBIDs and titles from relation
             song_mbids = []
             song_titles = []
-            songs_prop_id = self.albums_properties.get('songs')
-            if songs_prop_id:
-                songs_key = self._get_property_key(songs_prop_id, 'albums')
-                if songs_key:
-                    songs_prop = properties.get(songs_key, {})
-                    if songs_prop.get('relation'):
-                        logger.info(f"Found {len(songs_prop['relation'])} related song(s) for album")
-                        # Get MBIDs and titles from all related song pages
-                        for song_relation in songs_prop['relation']:
-                            song_page_id = song_relation.get('id')
-                            if song_page_id:
-                                song_mbid = self._get_mbid_from_related_page(song_page_id, 'songs')
-                                if song_mbid:
-                                    song_mbids.append(song_mbid)
-                                    logger.debug(f"Found song MBID from relation: {song_mbid}")
-                                
-                                # Also get song title as fallback
-                                song_page = self.notion.get_page(song_page_id)
-                                if song_page:
-                                    song_props = song_page.get('properties', {})
-                                    song_title_key = self._get_property_key(self.songs_properties.get('title'), 'songs')
-                                    if song_title_key and song_props.get(song_title_key):
-                                        song_title_prop = song_props[song_title_key]
-                                        if song_title_prop.get('title') and song_title_prop['title']:
-                                            song_title = song_title_prop['title'][0]['plain_text']
-                                            song_titles.append(song_title)
-                                            logger.info(f"Found song title from relation: {song_title}")
-                                else:
-                                    logger.warning(f"Could not fetch song page {song_page_id} to get title")
+            songs_key = keys.get('songs')
+            if songs_key:
+                songs_prop = properties.get(songs_key, {})
+                if songs_prop.get('relation'):
+                    logger.info(f"Found {len(songs_prop['relation'])} related song(s) for album")
+                    # Fetch all related song pages at once, then read MBIDs and titles from them
+                    song_page_ids = [song_relation['id'] for song_relation in songs_prop['relation'] if song_relation.get('id')]
+                    song_pages = self._get_related_pages(song_page_ids)
+                    for song_page_id in song_page_ids:
+                        song_page = song_pages.get(song_page_id)
+                        if song_page:
+                            song_mbid = self._get_mbid_from_page(song_page, 'songs')
+                            if song_mbid:
+                                song_mbids.append(song_mbid)
+                                logger.debug(f"Found song MBID from relation: {song_mbid}")
+                            
+                            # Also get song title as fallback
+                            song_title = self._get_page_title(song_page, 'songs')
+                            if song_title:
+                                song_titles.append(song_title)
+                                logger.info(f"Found song title from relation: {song_title}")
+                        else:
+                            logger.warning(f"Could not fetch song page {song_page_id} to get title")
+            
+            # Build the sets candidate releases are checked against once, not per release
+            required_song_mbids = frozenset(song_mbids)
+            required_song_titles = frozenset(self._normalize_title_for_matching(song_title) for song_title in song_titles)
             
             # Check for existing MBID
-            mb_id_prop_id = self.albums_properties.get('musicbrainz_id')
-            existing_mbid = None
-            if mb_id_prop_id:
-                mb_id_key = self._get_property_key(mb_id_prop_id, 'albums')
-                if mb_id_key:
-                    mb_id_prop = properties.get(mb_id_key, {})
-                    # MBID is stored as rich_text (UUID string)
-                    if mb_id_prop.get('rich_text') and mb_id_prop['rich_text']:
-                        existing_mbid = mb_id_prop['rich_text'][0]['plain_text']
+            existing_mbid = self._get_mbid_from_page(page, 'albums')
             
             # Search or get release data
             release_data = None
@@ -1784,7 +1868,7 @@ class NotionMusicBrainzSync:
                     # Verify the existing release contains all related songs
                     if song_mbids or song_titles:
                         logger.info(f"Verifying existing release {existing_mbid} contains {len(song_mbids)} song MBIDs and {len(song_titles)} song titles")
-                        if not self._release_contains_recordings(release_data, song_mbids, song_titles):
+                        if not self._release_contains_recordings(release_data, required_song_mbids, required_song_titles):
                             logger.warning(f"Existing release {existing_mbid} does not contain all related songs, searching for a new match")
                             release_data = None
                             existing_mbid = None
@@ -1808,22 +1892,14 @@ class NotionMusicBrainzSync:
                 
                 if artist_mbid:
                     # Get all releases by this artist
-                    logger.info(f"Searching for releases by artist MBID: {artist_mbid}")
-                    url = f"{self.mb.base_url}/release"
-                    params = {
-                        'query': f'arid:{artist_mbid}',
-                        'limit': 100,  # Get up to 100 releases
-                        'fmt': 'json'
-                    }
-                    response = self.mb._make_api_request(url, params)
-                    data = response.json()
-                    search_results = data.get('releases', [])
+                    logger.info(f"Browsing releases by artist MBID: {artist_mbid}")
+                    search_results = self.mb.browse_releases_by_artist(artist_mbid)
                     logger.info(f"Found {len(search_results)} releases by artist")
                 
                 elif song_mbids:
                     # Get all releases containing this song
                     logger.info(f"Searching for releases containing song MBID: {song_mbids[0]}")
-                    search_results = self.mb.search_releases_by_recording(song_mbids[0], limit=100)
+                    search_results = self.mb.get_releases_for_recording(song_mbids[0], limit=100)
                     logger.info(f"Found {len(search_results)} releases containing song")
                 
                 elif song_titles:
@@ -1832,11 +1908,12 @@ class NotionMusicBrainzSync:
                     recording_search = self.mb.search_recordings(song_titles[0], limit=5)
                     if recording_search:
                         # Take the first exact match
+                        song_title_words = self._normalize_title_for_matching(song_titles[0])
                         for rec in recording_search:
-                            if self._titles_match_exactly(song_titles[0], rec.get('title', '')):
+                            if self._normalize_title_for_matching(rec.get('title', '')) == song_title_words:
                                 recording_id = rec.get('id')
                                 logger.info(f"Found song MBID: {recording_id}, searching for releases")
-                                search_results = self.mb.search_releases_by_recording(recording_id, limit=100)
+                                search_results = self.mb.get_releases_for_recording(recording_id, limit=100)
                                 logger.info(f"Found {len(search_results)} releases containing song")
                                 break
                 
@@ -1849,12 +1926,12 @@ class NotionMusicBrainzSync:
                     logger.warning(f"Could not find album: {title}")
                     return False
                 
-                # Filter releases by exact title match
-                matching_releases = []
-                for result in search_results:
-                    result_title = result.get('title', '')
-                    if self._titles_match_exactly(title, result_title):
-                        matching_releases.append(result)
+                # Filter releases by exact title match (word-for-word, see _normalize_title_for_matching)
+                title_words = self._normalize_title_for_matching(title)
+                matching_releases = [
+                    result for result in search_results
+                    if self._normalize_title_for_matching(result.get('title', '')) == title_words
+                ]
                 
                 if not matching_releases:
                     logger.warning(f"No releases found with exact title match for '{title}'")
@@ -1872,37 +1949,37 @@ class NotionMusicBrainzSync:
                     # Boost score if release contains all related songs (check with available data first)
                     contains_songs = False
                     if song_mbids or song_titles:
-                        contains_songs = self._release_contains_recordings(release, song_mbids, song_titles)
+                        contains_songs = self._release_contains_recordings(release, required_song_mbids, required_song_titles)
                         if contains_songs:
                             score += 1000  # Large boost for containing required songs
                     
                     scored_releases.append((score, date, release, contains_songs))
                 
-                # Sort by score (descending), then by date (ascending - earlier is better)
-                scored_releases.sort(key=lambda x: (-x[0], x[1]))
+                # Only consider the top 10 candidates by score (descending), then date
+                # (ascending - earlier is better); no need to sort the rest
+                top_candidates = heapq.nsmallest(10, scored_releases, key=lambda x: (-x[0], x[1]))
                 
-                # Only fetch full release data for top 10 candidates (or all if < 10)
-                top_candidates = min(10, len(scored_releases))
-                top_releases = []
+                # Browsed releases already carry full track lists and the detail get_release
+                # fetches; only search and recording results need fetching before final scoring
+                full_releases = self.mb.get_releases([
+                    release['id'] for _, _, release, _ in top_candidates
+                    if release.get('id') and not _has_full_track_list(release)
+                ])
                 
-                for i in range(top_candidates):
-                    score, date, release, contains_songs = scored_releases[i]
-                    release_mbid = release.get('id')
-                    
-                    # Fetch full release data for accurate final scoring
-                    if release_mbid:
-                        full_release = self.mb.get_release(release_mbid)
-                        if full_release:
-                            # Re-score with full data
-                            score, date = self._score_release_for_song(full_release)
-                            
-                            # Re-check if release contains all related songs with full data
-                            if song_mbids or song_titles:
-                                contains_songs = self._release_contains_recordings(full_release, song_mbids, song_titles)
-                                if contains_songs:
-                                    score += 1000
-                            
-                            release = full_release
+                top_releases = []
+                for score, date, release, contains_songs in top_candidates:
+                    full_release = full_releases.get(release.get('id'))
+                    if full_release:
+                        # Re-score with full data
+                        score, date = self._score_release_for_song(full_release)
+                        
+                        # Re-check if release contains all related songs with full data
+                        if song_mbids or song_titles:
+                            contains_songs = self._release_contains_recordings(full_release, required_song_mbids, required_song_titles)
+                            if contains_songs:
+                                score += 1000
+                        
+                        release = full_release
                     
                     top_releases.append((score, date, release, contains_songs))
                 
@@ -1939,16 +2016,22 @@ class NotionMusicBrainzSync:
                 logger.warning(f"Could not get album data for: {title}")
                 return False
             
-            # Format properties
-            notion_props = self._format_album_properties(release_data)
+            # Start the Cover Art Archive lookup so it overlaps with formatting
+            cover_future = None
+            if release_data.get('id'):
+                cover_future = self.mb.prefetch_cover_art_url(release_data['id'])
+            
+            # Format properties, reusing any listen link already on the page
+            existing_spotify_url = (properties.get(keys.get('listen')) or {}).get('url')
+            notion_props = self._format_album_properties(release_data, existing_spotify_url)
             
             # Preserve existing relations (merge instead of replace)
             notion_props = self._merge_relations(page, notion_props, 'albums')
             
             # Get cover art - try Cover Art Archive first, then Spotify as fallback
             cover_url = None
-            if release_data.get('id'):
-                cover_url = self.mb.get_cover_art_url(release_data['id'])
+            if cover_future:
+                cover_url = cover_future.result()
                 if not cover_url:
                     # Fallback to Spotify if Cover Art Archive doesn't have it
                     album_title = release_data.get('title', title)
@@ -1964,10 +2047,10 @@ class NotionMusicBrainzSync:
                             logger.info(f"Found album cover image from Spotify for {title}")
             
             # Set icon
-            icon = '💿'  # CD emoji for albums
+            icon = ALBUM_ICON
             
             # Update the page
-            if self.notion.update_page(page_id, notion_props, cover_url, icon):
+            if self._update_synced_page(page, notion_props, cover_url, icon):
                 logger.info(f"Successfully updated album: {title}")
                 return True
             else:
@@ -1978,200 +2061,143 @@ class NotionMusicBrainzSync:
             logger.error(f"Error syncing album page {page.get('id')}: {e}")
             return False
     
-    def _format_album_properties(self, release_data: Dict) -> Dict:
-        """Format MusicBrainz release data for Notion properties."""
+    def _format_album_properties(self, release_data: Dict, existing_spotify_url: Optional[str] = None) -> Dict:
+        """Format MusicBrainz release data for Notion properties.
+        
+        existing_spotify_url is the page's current listen link; it is kept instead of
+        searching Spotify again when MusicBrainz has no streaming relation.
+        """
+        if not release_data:
+            return {}
+        
         properties = {}
+        keys = self.albums_keys
         
         try:
             # Title
-            if release_data.get('title') and self.albums_properties.get('title'):
-                prop_key = self._get_property_key(self.albums_properties['title'], 'albums')
-                if prop_key:
-                    properties[prop_key] = {
-                        'title': [{'text': {'content': release_data['title']}}]
-                    }
+            prop_key = keys.get('title')
+            if prop_key and release_data.get('title'):
+                properties[prop_key] = {
+                    'title': [{'text': {'content': release_data['title']}}]
+                }
             
             # MusicBrainz ID (store as string in rich_text since MBIDs are UUIDs)
-            if release_data.get('id') and self.albums_properties.get('musicbrainz_id'):
-                prop_key = self._get_property_key(self.albums_properties['musicbrainz_id'], 'albums')
-                if prop_key:
-                    # Store MBID as string - it's a UUID, not a number
-                    properties[prop_key] = {
-                        'rich_text': [{'text': {'content': release_data['id']}}]
-                    }
+            prop_key = keys.get('musicbrainz_id')
+            if prop_key and release_data.get('id'):
+                # Store MBID as string - it's a UUID, not a number
+                properties[prop_key] = {
+                    'rich_text': [{'text': {'content': release_data['id']}}]
+                }
             
             # Release date
-            if release_data.get('date') and self.albums_properties.get('release_date'):
-                release_date = release_data['date']
-                prop_key = self._get_property_key(self.albums_properties['release_date'], 'albums')
-                if prop_key:
-                    properties[prop_key] = {'date': {'start': release_date[:10]}}
+            prop_key = keys.get('release_date')
+            if prop_key and release_data.get('date'):
+                properties[prop_key] = {'date': {'start': release_data['date'][:10]}}
             
             # Artists (as relations)
-            if release_data.get('artist-credit') and self.albums_properties.get('artist') and self.artists_db_id:
-                # Extract artist names and MBIDs from artist-credit
-                artist_names = []
-                artist_mbids = []
-                
-                for ac in release_data.get('artist-credit', []):
-                    if ac.get('artist'):
-                        artist = ac['artist']
-                        artist_name = artist.get('name')
-                        artist_mbid = artist.get('id')
-                        if artist_name:
-                            artist_names.append(artist_name)
-                            if artist_mbid:
-                                artist_mbids.append(artist_mbid)
-                            else:
-                                artist_mbids.append(None)
+            prop_key = keys.get('artist')
+            if prop_key and self.artists_db_id and release_data.get('artist-credit'):
+                # Extract (name, MBID) pairs from artist-credit
+                artists = [
+                    (ac['artist']['name'], ac['artist'].get('id'))
+                    for ac in release_data['artist-credit'] if (ac.get('artist') or {}).get('name')
+                ]
                 
-                if artist_names:
-                    # Find or create artist pages and get their IDs
-                    artist_page_ids = []
-                    for i, artist_name in enumerate(artist_names[:5]):  # Limit to 5 artists
-                        artist_mbid = artist_mbids[i] if i < len(artist_mbids) else None
-                        artist_page_id = self._find_or_create_artist_page(artist_name, artist_mbid)
-                        if artist_page_id:
-                            artist_page_ids.append(artist_page_id)
+                if artists:
+                    # Find or create artist pages and get their IDs (limit to 5 artists)
+                    artist_page_ids = self._find_or_create_pages(self._find_or_create_artist_page, artists[:5])
                     
                     if artist_page_ids:
-                        prop_key = self._get_property_key(self.albums_properties['artist'], 'albums')
-                        if prop_key:
-                            properties[prop_key] = {
-                                'relation': [{'id': page_id} for page_id in artist_page_ids]
-                            }
+                        properties[prop_key] = {
+                            'relation': [{'id': pid} for pid in artist_page_ids]
+                        }
             
             # Country
-            if release_data.get('country') and self.albums_properties.get('country'):
-                prop_key = self._get_property_key(self.albums_properties['country'], 'albums')
-                if prop_key:
-                    properties[prop_key] = {'select': {'name': release_data['country']}}
+            prop_key = keys.get('country')
+            if prop_key and release_data.get('country'):
+                properties[prop_key] = {'select': {'name': release_data['country']}}
             
             # Labels (as relations)
-            if release_data.get('label-info') and self.albums_properties.get('label') and self.labels_db_id:
-                label_names = [li['label']['name'] for li in release_data['label-info'] if li.get('label', {}).get('name')]
-                label_mbids = [li['label']['id'] for li in release_data['label-info'] if li.get('label', {}).get('id')]
+            prop_key = keys.get('label')
+            if prop_key and self.labels_db_id and release_data.get('label-info'):
+                labels = [(li['label']['name'], li['label'].get('id')) for li in release_data['label-info'] if li.get('label', {}).get('name')]
                 
-                if label_names:
-                    # Find or create label pages and get their IDs
-                    label_page_ids = []
-                    for i, label_name in enumerate(label_names[:5]):  # Limit to 5 labels
-                        label_mbid = label_mbids[i] if i < len(label_mbids) else None
-                        label_page_id = self._find_or_create_label_page(label_name, label_mbid)
-                        if label_page_id:
-                            label_page_ids.append(label_page_id)
+                if labels:
+                    # Find or create label pages and get their IDs (limit to 5 labels)
+                    label_page_ids = self._find_or_create_pages(self._find_or_create_label_page, labels[:5])
                     
                     if label_page_ids:
-                        prop_key = self._get_property_key(self.albums_properties['label'], 'albums')
-                        if prop_key:
-                            properties[prop_key] = {
-                                'relation': [{'id': page_id} for page_id in label_page_ids]
-                            }
+                        properties[prop_key] = {
+                            'relation': [{'id': pid} for pid in label_page_ids]
+                        }
             
             # Status
-            if release_data.get('status') and self.albums_properties.get('status'):
-                prop_key = self._get_property_key(self.albums_properties['status'], 'albums')
-                if prop_key:
-                    properties[prop_key] = {'select': {'name': release_data['status']}}
+            prop_key = keys.get('status')
+            if prop_key and release_data.get('status'):
+                properties[prop_key] = {'select': {'name': release_data['status']}}
             
             # Packaging
-            if release_data.get('packaging') and self.albums_properties.get('packaging'):
-                prop_key = self._get_property_key(self.albums_properties['packaging'], 'albums')
-                if prop_key:
-                    properties[prop_key] = {'select': {'name': release_data['packaging']}}
+            prop_key = keys.get('packaging')
+            if prop_key and release_data.get('packaging'):
+                properties[prop_key] = {'select': {'name': release_data['packaging']}}
             
             # Barcode
-            if release_data.get('barcode') and self.albums_properties.get('barcode'):
-                prop_key = self._get_property_key(self.albums_properties['barcode'], 'albums')
-                if prop_key:
-                    properties[prop_key] = {
-                        'rich_text': [{'text': {'content': release_data['barcode']}}]
-                    }
+            prop_key = keys.get('barcode')
+            if prop_key and release_data.get('barcode'):
+                properties[prop_key] = {
+                    'rich_text': [{'text': {'content': release_data['barcode']}}]
+                }
             
             # Format
-            if release_data.get('media') and self.albums_properties.get('format'):
-                formats = []
-                for medium in release_data['media']:
-                    if medium.get('format'):
-                        formats.append(medium['format'])
+            prop_key = keys.get('format')
+            if prop_key and release_data.get('media'):
+                # Ordered de-duplication keeps the option order stable between syncs
+                formats = dict.fromkeys(medium['format'] for medium in release_data['media'] if medium.get('format'))
                 if formats:
-                    prop_key = self._get_property_key(self.albums_properties['format'], 'albums')
-                    if prop_key:
-                        properties[prop_key] = {
-                            'multi_select': [{'name': fmt} for fmt in set(formats)]
-                        }
+                    properties[prop_key] = {
+                        'multi_select': [{'name': fmt} for fmt in formats]
+                    }
             
             # Track count
-            if release_data.get('media') and self.albums_properties.get('track_count'):
+            prop_key = keys.get('track_count')
+            if prop_key and release_data.get('media'):
                 total_tracks = sum(medium.get('track-count', 0) for medium in release_data['media'])
                 if total_tracks > 0:
-                    prop_key = self._get_property_key(self.albums_properties['track_count'], 'albums')
-                    if prop_key:
-                        properties[prop_key] = {'number': total_tracks}
+                    properties[prop_key] = {'number': total_tracks}
             
             # Genres - use only genres directly from the release-group (not aggregated)
             # This matches what MusicBrainz shows on the release page
-            if release_data.get('release-group') and release_data['release-group'].get('genres'):
-                genres = [genre['name'] for genre in release_data['release-group']['genres'] if genre.get('name')]
-                if genres and self.albums_properties.get('genres'):
-                    prop_key = self._get_property_key(self.albums_properties['genres'], 'albums')
-                    if prop_key:
-                        properties[prop_key] = {
-                            'multi_select': [{'name': genre} for genre in genres[:10]]  # Limit to 10 genres
-                        }
+            release_group_genres = (release_data.get('release-group') or {}).get('genres')
+            genre_names = _genre_names(release_group_genres)
+            prop_key = keys.get('genres')
+            if prop_key and release_group_genres:
+                genres = _multi_select(release_group_genres)  # Limit to 10 genres
+                if genres:
+                    properties[prop_key] = {'multi_select': genres}
             
             # Tags - these are separate from genres
             # Only include tags that are different from genres (genres have priority)
-            if release_data.get('tags') and self.albums_properties.get('tags'):
-                # Get genre names for comparison
-                genre_names = set()
-                if release_data.get('release-group') and release_data['release-group'].get('genres'):
-                    genre_names = {genre['name'] for genre in release_data['release-group']['genres'] if genre.get('name')}
-                
-                # Filter tags: exclude tags that match genres (genres have priority)
-                tags = []
-                for tag in release_data['tags']:
-                    tag_name = tag.get('name')
-                    # Only include tags that:
-                    # 1. Have a name
-                    # 2. Are different from genres (genres take priority)
-                    if tag_name and tag_name not in genre_names:
-                        tags.append(tag_name)
-                
+            prop_key = keys.get('tags')
+            if prop_key and release_data.get('tags'):
+                tags = _multi_select(release_data['tags'], exclude=genre_names)  # Limit to 10 tags
                 if tags:
-                    prop_key = self._get_property_key(self.albums_properties['tags'], 'albums')
-                    if prop_key:
-                        properties[prop_key] = {
-                            'multi_select': [{'name': tag} for tag in tags[:10]]  # Limit to 10 tags
-                        }
+                    properties[prop_key] = {'multi_select': tags}
             
             # Album Type (from release-group primary-type)
-            if release_data.get('release-group') and release_data['release-group'].get('primary-type') and self.albums_properties.get('type'):
-                album_type = release_data['release-group']['primary-type']
-                prop_key = self._get_property_key(self.albums_properties['type'], 'albums')
-                if prop_key:
-                    properties[prop_key] = {'select': {'name': album_type}}
+            prop_key = keys.get('type')
+            if prop_key and release_data.get('release-group') and release_data['release-group'].get('primary-type'):
+                properties[prop_key] = {'select': {'name': release_data['release-group']['primary-type']}}
             
             # Spotify link (from url-rels) - check for both "streaming" and "free streaming"
-            spotify_url = None
-            if release_data.get('relations') and self.albums_properties.get('listen'):
-                for relation in release_data.get('relations', []):
-                    relation_type = relation.get('type', '').lower()
-                    # Check for both "streaming" and "free streaming" relation types
-                    if relation_type in ['streaming', 'free streaming']:
-                        url_resource = relation.get('url', {})
-                        if isinstance(url_resource, dict):
-                            url_str = url_resource.get('resource', '')
-                        else:
-                            url_str = str(url_resource)
-                        
-                        # Check if it's a Spotify URL
-                        if url_str and 'spotify' in url_str.lower() and 'spotify.com' in url_str.lower():
-                            spotify_url = url_str
-                            break
+            listen_key = keys.get('listen')
+            spotify_url = _spotify_url_from_relations(release_data.get('relations')) if listen_key else None
+            
+            # Keep the page's current link rather than searching Spotify again
+            if listen_key and not spotify_url and existing_spotify_url:
+                spotify_url = existing_spotify_url
             
-            # If no Spotify link found in MusicBrainz, try searching Spotify directly
-            if not spotify_url and self.albums_properties.get('listen'):
+            # If no Spotify link found in MusicBrainz or on the page, try searching Spotify directly
+            if listen_key and not spotify_url:
                 album_title = release_data.get('title', '')
                 artist_name = None
                 # Get artist name from artist-credit
@@ -2185,28 +2211,66 @@ class NotionMusicBrainzSync:
                         logger.debug(f"Found Spotify URL via API search: {spotify_url}")
             
             if spotify_url:
-                prop_key = self._get_property_key(self.albums_properties['listen'], 'albums')
-                if prop_key:
-                    properties[prop_key] = {'url': spotify_url}
+                properties[listen_key] = {'url': spotify_url}
             
             # MusicBrainz URL
-            if release_data.get('id') and self.albums_properties.get('musicbrainz_url'):
-                mb_url = f"https://musicbrainz.org/release/{release_data['id']}"
-                prop_key = self._get_property_key(self.albums_properties['musicbrainz_url'], 'albums')
-                if prop_key:
-                    properties[prop_key] = {'url': mb_url}
+            prop_key = keys.get('musicbrainz_url')
+            if prop_key and release_data.get('id'):
+                properties[prop_key] = {'url': f"https://musicbrainz.org/release/{release_data['id']}"}
             
             # Last updated
-            if self.albums_properties.get('last_updated'):
-                prop_key = self._get_property_key(self.albums_properties['last_updated'], 'albums')
-                if prop_key:
-                    properties[prop_key] = {'date': {'start': datetime.now().isoformat()}}
+            prop_key = keys.get('last_updated')
+            if prop_key:
+                properties[prop_key] = {'date': {'start': self._last_updated_timestamp()}}
             
         except Exception as e:
             logger.error(f"Error formatting album properties: {e}")
         
         return properties
     
+    def _find_page_by_title(self, database: str, title: str) -> Optional[str]:
+        """Find a page in the Artists, Albums or Labels database by title (case-insensitive).
+        
+        An exact title 'equals' query runs first. Only if it misses does the
+        case-insensitive 'contains' query run, its candidates narrowed to an exact
+        case-insensitive match here. Hits are cached by lowercase title.
+        """
+        page_ids = self._page_id_cache.setdefault(database, {})
+        name_key = title.lower()
+        if name_key in page_ids:
+            return page_ids[name_key]
+        
+        database_id = getattr(self, f'{database}_db_id')
+        title_key = getattr(self, f'{database}_keys')['title']
+        
+        # Exact match: at most one result needed
+        exact_filter = {'property': title_key, 'title': {'equals': title}}
+        page_id = next((page['id'] for page in self.notion.iter_database(
+            database_id, exact_filter, page_size=1, filter_properties=[TITLE_PROPERTY_ID])), None)
+        
+        if page_id is None:
+            contains_filter = {'property': title_key, 'title': {'contains': title}}
+            for page in self.notion.iter_database(database_id, contains_filter,
+                                                  filter_properties=[TITLE_PROPERTY_ID]):
+                page_title = self._get_page_title(page, database)
+                if page_title and page_title.lower() == name_key:
+                    page_id = page['id']
+                    break
+        
+        if page_id:
+            page_ids[name_key] = page_id
+        return page_id
+    
+    def _find_or_create_pages(self, find_or_create, pairs: List[Tuple[str, Optional[str]]]) -> List[str]:
+        """Resolve (name, MBID) pairs to page IDs concurrently, keeping their order and dropping failures."""
+        if len(pairs) > 1:
+            with ThreadPoolExecutor(max_workers=len(pairs)) as executor:
+                page_ids = list(executor.map(lambda pair: find_or_create(*pair), pairs))
+        else:
+            page_ids = [find_or_create(name, mbid) for name, mbid in pairs]
+        return [page_id for page_id in page_ids if page_id]
+    
+    @_holding_create_lock
     def _find_or_create_artist_page(self, artist_name: str, artist_mbid: Optional[str] = None) -> Optional[str]:
         """Find or create an artist page in the Artists database and return its page ID."""
         if not self.artists_db_id:
@@ -2214,37 +2278,14 @@ class NotionMusicBrainzSync:
         
         try:
             # First, try to find existing artist by name
-            title_prop_id = self.artists_properties.get('title')
-            if not title_prop_id:
-                return None
-            
-            title_key = self._get_property_key(title_prop_id, 'artists')
+            title_key = self.artists_keys.get('title')
             if not title_key:
                 return None
             
-            # Search for existing artist page by title
-            filter_params = {
-                'property': title_key,
-                'title': {
-                    'equals': artist_name
-                }
-            }
-            
-            existing_pages = self.notion.query_database(self.artists_db_id, filter_params)
-            
-            if existing_pages:
-                # Found existing artist
-                return existing_pages[0]['id']
-            
-            # If no exact match, try searching all pages and match by name (case-insensitive)
-            all_pages = self.notion.query_database(self.artists_db_id)
-            for page in all_pages:
-                page_props = page.get('properties', {})
-                page_title_prop = page_props.get(title_key, {})
-                if page_title_prop.get('title') and page_title_prop['title']:
-                    page_title = page_title_prop['title'][0]['plain_text']
-                    if page_title.lower() == artist_name.lower():
-                        return page['id']
+            # Search for existing artist page by title (case-insensitive)
+            existing_page_id = self._find_page_by_title('artists', artist_name)
+            if existing_page_id:
+                return existing_page_id
             
             # Artist doesn't exist - create it
             logger.info(f"Creating new artist page: {artist_name}")
@@ -2261,23 +2302,23 @@ class NotionMusicBrainzSync:
             }
             
             # Add MusicBrainz ID if available
-            if artist_data and artist_data.get('id') and self.artists_properties.get('musicbrainz_id'):
-                mb_id_key = self._get_property_key(self.artists_properties['musicbrainz_id'], 'artists')
-                if mb_id_key:
-                    artist_props[mb_id_key] = {
-                        'rich_text': [{'text': {'content': artist_data['id']}}]
-                    }
+            mb_id_key = self.artists_keys.get('musicbrainz_id')
+            if mb_id_key and artist_data and artist_data.get('id'):
+                artist_props[mb_id_key] = {
+                    'rich_text': [{'text': {'content': artist_data['id']}}]
+                }
             
             # Create the artist page
             artist_page_id = self.notion.create_page(
                 self.artists_db_id,
                 artist_props,
                 None,
-                '🎤'  # Microphone emoji
+                ARTIST_ICON
             )
             
             if artist_page_id:
                 logger.info(f"Created artist page: {artist_name} (ID: {artist_page_id})")
+                self._page_id_cache['artists'][artist_name.lower()] = artist_page_id
                 # If we have full artist data, update the page with it
                 if artist_data:
                     full_props = self._format_artist_properties(artist_data)
@@ -2309,14 +2350,11 @@ class NotionMusicBrainzSync:
         release_group_type = release_group.get('type', '').lower() if release_group else ''
         
         # Get country - check release-events if not in release directly
-        country = release.get('country') or ''
-        country = country.upper() if country else ''
+        country = (release.get('country') or '').upper()
         if not country and release.get('release-events'):
             # Get country from first release event
             first_event = release['release-events'][0]
-            country = first_event.get('area', {}).get('iso-3166-1-codes', [''])[0] if first_event.get('area') else ''
-            if country:
-                country = country.upper()
+            country = (first_event.get('area', {}).get('iso-3166-1-codes', [''])[0] if first_event.get('area') else '').upper()
         
         # Get release date - check multiple sources
         date_str = release.get('date', '')
@@ -2335,31 +2373,7 @@ class NotionMusicBrainzSync:
         if date_str:
             # Normalize date to YYYY-MM-DD for comparison
             # Prefer full dates over partial dates (year-only or year-month)
-            try:
-                parts = date_str.split('-')
-                if len(parts) >= 1:
-                    year = parts[0]
-                    if len(parts) == 1:
-                        # Just year - set to end of year so it sorts after all full dates in that year
-                        month = '12'
-                        day = '31'
-                    elif len(parts) == 2:
-                        # Year and month - set to end of month so it sorts after all full dates in that month
-                        month = parts[1]
-                        # Get last day of month (approximate - use 28 to be safe, or 31 for most months)
-                        if month in ['01', '03', '05', '07', '08', '10', '12']:
-                            day = '31'
-                        elif month in ['04', '06', '09', '11']:
-                            day = '30'
-                        else:
-                            day = '28'  # February
-                    else:
-                        # Full date - use as is
-                        month = parts[1]
-                        day = parts[2]
-                    release_date = f"{year}-{month.zfill(2)}-{day.zfill(2)}"
-            except Exception:
-                pass
+            release_date = _release_sort_date(date_str)
         
         # Scoring:
         # 1. Country: US = 100 points, others = 0
@@ -2396,21 +2410,34 @@ class NotionMusicBrainzSync:
             score, date = self._score_release_for_song(release)
             scored_releases.append((score, date, release))
         
-        # Sort by score (descending), then by date (ascending - earlier is better)
-        scored_releases.sort(key=lambda x: (-x[0], x[1]))
-        
-        # Only fetch full release data for top 10 candidates (or all if < 10)
+        # Only fetch full release data for the top 10 candidates by score (descending),
+        # then date (ascending - earlier is better); no need to sort the rest.
         # This dramatically reduces API calls when there are many releases
-        top_candidates = min(10, len(scored_releases))
-        top_releases = []
+        candidates = heapq.nsmallest(10, scored_releases, key=lambda x: (-x[0], x[1]))
+        
+        # Fetch full release data for accurate final scoring. Candidates that share a
+        # release group come from one browse request; the rest are looked up together.
+        release_mbids = [release['id'] for _, _, release in candidates if release.get('id')]
+        group_mbids = {}
+        for _, _, release in candidates:
+            group_mbid = (release.get('release-group') or {}).get('id')
+            if group_mbid and release.get('id'):
+                group_mbids.setdefault(group_mbid, set()).add(release['id'])
+        
+        full_releases = {}
+        for group_mbid, group_release_mbids in group_mbids.items():
+            if len(group_release_mbids) > 1:
+                for browsed in self.mb.browse_releases_by_release_group(group_mbid):
+                    if browsed.get('id') in group_release_mbids:
+                        full_releases[browsed['id']] = browsed
+        full_releases.update(self.mb.get_releases([mbid for mbid in release_mbids if mbid not in full_releases]))
         
-        for i in range(top_candidates):
-            score, date, release = scored_releases[i]
+        top_releases = []
+        for score, date, release in candidates:
             release_mbid = release.get('id')
             
-            # Fetch full release data for accurate final scoring
             if release_mbid:
-                full_release = self.mb.get_release(release_mbid)
+                full_release = full_releases.get(release_mbid)
                 if full_release:
                     # Merge full release data with basic release data
                     release = {**release, **full_release}
@@ -2425,6 +2452,7 @@ class NotionMusicBrainzSync:
         # Return the best match
         return top_releases[0][2] if top_releases else None
     
+    @_holding_create_lock
     def _find_or_create_album_page(self, album_title: str, album_mbid: Optional[str] = None) -> Optional[str]:
         """Find or create an album page in the Albums database and return its page ID."""
         if not self.albums_db_id:
@@ -2432,37 +2460,14 @@ class NotionMusicBrainzSync:
         
         try:
             # First, try to find existing album by title
-            title_prop_id = self.albums_properties.get('title')
-            if not title_prop_id:
-                return None
-            
-            title_key = self._get_property_key(title_prop_id, 'albums')
+            title_key = self.albums_keys.get('title')
             if not title_key:
                 return None
             
-            # Search for existing album page by title
-            filter_params = {
-                'property': title_key,
-                'title': {
-                    'equals': album_title
-                }
-            }
-            
-            existing_pages = self.notion.query_database(self.albums_db_id, filter_params)
-            
-            if existing_pages:
-                # Found existing album
-                return existing_pages[0]['id']
-            
-            # If no exact match, try searching all pages and match by name (case-insensitive)
-            all_pages = self.notion.query_database(self.albums_db_id)
-            for page in all_pages:
-                page_props = page.get('properties', {})
-                page_title_prop = page_props.get(title_key, {})
-                if page_title_prop.get('title') and page_title_prop['title']:
-                    page_title = page_title_prop['title'][0]['plain_text']
-                    if page_title.lower() == album_title.lower():
-                        return page['id']
+            # Search for existing album page by title (case-insensitive)
+            existing_page_id = self._find_page_by_title('albums', album_title)
+            if existing_page_id:
+                return existing_page_id
             
             # Album doesn't exist - create it
             logger.info(f"Creating new album page: {album_title}")
@@ -2479,23 +2484,23 @@ class NotionMusicBrainzSync:
             }
             
             # Add MusicBrainz ID if available
-            if album_data and album_data.get('id') and self.albums_properties.get('musicbrainz_id'):
-                mb_id_key = self._get_property_key(self.albums_properties['musicbrainz_id'], 'albums')
-                if mb_id_key:
-                    album_props[mb_id_key] = {
-                        'rich_text': [{'text': {'content': album_data['id']}}]
-                    }
+            mb_id_key = self.albums_keys.get('musicbrainz_id')
+            if mb_id_key and album_data and album_data.get('id'):
+                album_props[mb_id_key] = {
+                    'rich_text': [{'text': {'content': album_data['id']}}]
+                }
             
             # Create the album page
             album_page_id = self.notion.create_page(
                 self.albums_db_id,
                 album_props,
                 None,
-                '💿'  # CD emoji
+                ALBUM_ICON
             )
             
             if album_page_id:
                 logger.info(f"Created album page: {album_title} (ID: {album_page_id})")
+                self._page_id_cache['albums'][album_title.lower()] = album_page_id
                 # If we have full album data, update the page with it
                 if album_data:
                     full_props = self._format_album_properties(album_data)
@@ -2507,6 +2512,7 @@ class NotionMusicBrainzSync:
             logger.error(f"Error finding/creating album page for '{album_title}': {e}")
             return None
     
+    @_holding_create_lock
     def _find_or_create_label_page(self, label_name: str, label_mbid: Optional[str] = None) -> Optional[str]:
         """Find or create a label page in the Labels database and return its page ID."""
         if not self.labels_db_id:
@@ -2514,37 +2520,14 @@ class NotionMusicBrainzSync:
         
         try:
             # First, try to find existing label by name
-            title_prop_id = self.labels_properties.get('title')
-            if not title_prop_id:
-                return None
-            
-            title_key = self._get_property_key(title_prop_id, 'labels')
+            title_key = self.labels_keys.get('title')
             if not title_key:
                 return None
             
-            # Search for existing label page by title
-            filter_params = {
-                'property': title_key,
-                'title': {
-                    'equals': label_name
-                }
-            }
-            
-            existing_pages = self.notion.query_database(self.labels_db_id, filter_params)
-            
-            if existing_pages:
-                # Found existing label
-                return existing_pages[0]['id']
-            
-            # If no exact match, try searching all pages and match by name (case-insensitive)
-            all_pages = self.notion.query_database(self.labels_db_id)
-            for page in all_pages:
-                page_props = page.get('properties', {})
-                page_title_prop = page_props.get(title_key, {})
-                if page_title_prop.get('title') and page_title_prop['title']:
-                    page_title = page_title_prop['title'][0]['plain_text']
-                    if page_title.lower() == label_name.lower():
-                        return page['id']
+            # Search for existing label page by title (case-insensitive)
+            existing_page_id = self._find_page_by_title('labels', label_name)
+            if existing_page_id:
+                return existing_page_id
             
             # Label doesn't exist - create it
             logger.info(f"Creating new label page: {label_name}")
@@ -2561,23 +2544,23 @@ class NotionMusicBrainzSync:
             }
             
             # Add MusicBrainz ID if available
-            if label_data and label_data.get('id') and self.labels_properties.get('musicbrainz_id'):
-                mb_id_key = self._get_property_key(self.labels_properties['musicbrainz_id'], 'labels')
-                if mb_id_key:
-                    label_props[mb_id_key] = {
-                        'rich_text': [{'text': {'content': label_data['id']}}]
-                    }
+            mb_id_key = self.labels_keys.get('musicbrainz_id')
+            if mb_id_key and label_data and label_data.get('id'):
+                label_props[mb_id_key] = {
+                    'rich_text': [{'text': {'content': label_data['id']}}]
+                }
             
             # Create the label page
             label_page_id = self.notion.create_page(
                 self.labels_db_id,
                 label_props,
                 None,
-                '🏷️'  # Label emoji
+                LABEL_ICON
             )
             
             if label_page_id:
                 logger.info(f"Created label page: {label_name} (ID: {label_page_id})")
+                self._page_id_cache['labels'][label_name.lower()] = label_page_id
                 # If we have full label data, update the page with it
                 if label_data:
                     full_props = self._format_label_properties(label_data)
@@ -2591,40 +2574,43 @@ class NotionMusicBrainzSync:
     
     def _load_locations_cache(self):
         """Load all locations into cache to avoid repeated database queries."""
-        if not self.locations_db_id or self._location_cache is not None:
-            return
-        
-        try:
-            # Query all location pages once
-            all_pages = self.notion.query_database(self.locations_db_id)
-            
-            # Find the title property key
-            if all_pages:
-                first_page_props = all_pages[0].get('properties', {})
-                for prop_key, prop_data in first_page_props.items():
-                    if prop_data.get('type') == 'title':
-                        self._locations_title_key = prop_key
-                        break
-            
-            if not self._locations_title_key:
-                logger.warning("Could not find title property in Locations database")
-                self._location_cache = {}  # Mark as loaded (empty)
+        # Held so a background load and a location lookup never both load the cache
+        with self._location_lock:
+            if not self.locations_db_id or self._location_cache is not None:
                 return
             
-            # Build cache: location name (lowercase) -> page_id
-            self._location_cache = {}
-            for page in all_pages:
-                page_props = page.get('properties', {})
-                page_title_prop = page_props.get(self._locations_title_key, {})
-                if page_title_prop.get('title') and page_title_prop['title']:
-                    page_title = page_title_prop['title'][0]['plain_text']
-                    self._location_cache[page_title.lower()] = page['id']
+            try:
+                # Take the title property key from the schema so it's known even when the database is empty
+                database = self.notion.get_database(self.locations_db_id)
+                if database:
+                    for prop_key, prop_data in database.get('properties', {}).items():
+                        if prop_data.get('type') == 'title':
+                            self._locations_title_key = prop_key
+                            break
             
-            logger.debug(f"Loaded {len(self._location_cache)} locations into cache")
+                if not self._locations_title_key:
+                    # Left unloaded so the next lookup retries rather than disabling locations for the run
+                    logger.warning("Could not find title property in Locations database")
+                    return
             
-        except Exception as e:
-            logger.error(f"Error loading locations cache: {e}")
-            self._location_cache = {}  # Mark as loaded (empty)
+                # Build cache: normalized location name -> page_id
+                locations = {}
+                for page in self.notion.iter_database(self.locations_db_id, filter_properties=[TITLE_PROPERTY_ID]):
+                    page_title = _first_plain_text(page.get('properties', {}), self._locations_title_key)
+                    if page_title:
+                        locations[self._normalize_location_name(page_title)] = page['id']
+                self._location_cache = locations
+            
+                logger.debug(f"Loaded {len(self._location_cache)} locations into cache")
+            
+            except Exception as e:
+                # Left unloaded so the next lookup retries
+                logger.error(f"Error loading locations cache: {e}")
+    
+    @staticmethod
+    def _normalize_location_name(location_name: str) -> str:
+        """Normalize a location name for cache lookups."""
+        return location_name.strip().casefold()
     
     def _find_or_create_location_page(self, location_name: str) -> Optional[str]:
         """Find or create a location page in the Locations database and return its page ID."""
@@ -2632,52 +2618,49 @@ class NotionMusicBrainzSync:
             return None
         
         try:
-            # Load cache if not already loaded
-            if self._location_cache is None:
-                self._load_locations_cache()
-            
-            # Check cache first
-            location_name_lower = location_name.lower()
-            if location_name_lower in self._location_cache:
-                return self._location_cache[location_name_lower]
-            
-            # Location doesn't exist - create it
-            if not self._locations_title_key:
-                # Need to get title key if we don't have it
-                all_pages = self.notion.query_database(self.locations_db_id)
-                if all_pages:
-                    first_page_props = all_pages[0].get('properties', {})
-                    for prop_key, prop_data in first_page_props.items():
-                        if prop_data.get('type') == 'title':
-                            self._locations_title_key = prop_key
-                            break
-            
-            if not self._locations_title_key:
-                logger.warning("Could not find title property in Locations database")
+            # Load cache if not already loaded (or if an earlier load failed)
+            with self._location_lock:
+                if self._location_cache is None:
+                    self._load_locations_cache()
+                location_cache = self._location_cache
+            if location_cache is None:
                 return None
             
-            logger.info(f"Creating new location page: {location_name}")
-            
-            # Format properties for new location
-            location_props = {}
-            location_props[self._locations_title_key] = {
-                'title': [{'text': {'content': location_name}}]
-            }
-            
-            # Create the location page
-            location_page_id = self.notion.create_page(
-                self.locations_db_id,
-                location_props,
-                None,
-                '📍'  # Location pin emoji
-            )
-            
+            # Check cache first; known locations never wait on another thread's create
+            location_key = self._normalize_location_name(location_name)
+            location_page_id = location_cache.get(location_key)
             if location_page_id:
-                logger.info(f"Created location page: {location_name} (ID: {location_page_id})")
-                # Add to cache
-                self._location_cache[location_name_lower] = location_page_id
+                return location_page_id
             
-            return location_page_id
+            # Held across re-check and create so concurrent syncs don't create the same location twice
+            with self._create_locks.setdefault(('location', location_key), threading.Lock()):
+                location_page_id = location_cache.get(location_key)
+                if location_page_id:
+                    return location_page_id
+                
+                # Location doesn't exist - create it
+                logger.info(f"Creating new location page: {location_name}")
+                
+                # Format properties for new location
+                location_props = {}
+                location_props[self._locations_title_key] = {
+                    'title': [{'text': {'content': location_name}}]
+                }
+                
+                # Create the location page
+                location_page_id = self.notion.create_page(
+                    self.locations_db_id,
+                    location_props,
+                    None,
+                    LOCATION_ICON
+                )
+                
+                if location_page_id:
+                    logger.info(f"Created location page: {location_name} (ID: {location_page_id})")
+                    # Add to cache
+                    location_cache[location_key] = location_page_id
+                
+                return location_page_id
             
         except Exception as e:
             logger.error(f"Error finding/creating location page for '{location_name}': {e}")
@@ -2689,83 +2672,60 @@ class NotionMusicBrainzSync:
             page_id = page['id']
             properties = page.get('properties', {})
             
-            # Extract title
-            title_prop_id = self.songs_properties.get('title')
-            if not title_prop_id:
-                logger.warning(f"Missing title property for Songs database")
-                return None
+            keys = self.songs_keys
             
-            title_key = self._get_property_key(title_prop_id, 'songs')
+            # Extract title
+            title_key = keys.get('title')
             if not title_key:
-                logger.warning(f"Could not find title property key")
+                logger.warning(f"Missing title property for Songs database")
                 return None
             
-            title_prop = properties.get(title_key, {})
-            if title_prop.get('type') != 'title' or not title_prop.get('title'):
+            title = _first_plain_text(properties, title_key)
+            if not title:
                 logger.warning(f"Missing title for page {page_id}")
                 return None
             
-            title = title_prop['title'][0]['plain_text']
             logger.info(f"Processing song: {title}")
             
+            # Check for existing MBID
+            existing_mbid = self._get_mbid_from_page(page, 'songs')
+            
+            if existing_mbid and not force_all:
+                # Skip pages with existing MBIDs unless force_all is True, before any Notion or MusicBrainz request
+                logger.info(f"Skipping song '{title}' - already has MBID {existing_mbid} (use --force-all to update)")
+                return None
+            
             # Try to extract artist name from relation
             artist_name = None
-            artist_prop_id = self.songs_properties.get('artist')
-            if artist_prop_id:
-                artist_key = self._get_property_key(artist_prop_id, 'songs')
-                if artist_key:
-                    artist_prop = properties.get(artist_key, {})
-                    if artist_prop.get('relation'):
-                        # Fetch the artist page to get the name
-                        artist_page_id = artist_prop['relation'][0]['id'] if artist_prop['relation'] else None
-                        if artist_page_id:
-                            artist_page = self.notion.get_page(artist_page_id)
-                            if artist_page:
-                                artist_props = artist_page.get('properties', {})
-                                artist_title_key = self._get_property_key(self.artists_properties.get('title'), 'artists')
-                                if artist_title_key and artist_props.get(artist_title_key):
-                                    artist_title_prop = artist_props[artist_title_key]
-                                    if artist_title_prop.get('title') and artist_title_prop['title']:
-                                        artist_name = artist_title_prop['title'][0]['plain_text']
-                                        logger.debug(f"Found artist from relation: {artist_name}")
+            artist_key = keys.get('artist')
+            if artist_key:
+                artist_prop = properties.get(artist_key, {})
+                if artist_prop.get('relation'):
+                    # Fetch the artist page to get the name
+                    artist_page = self._get_related_page(artist_prop['relation'][0]['id'])
+                    if artist_page:
+                        artist_name = self._get_page_title(artist_page, 'artists')
+                        if artist_name:
+                            logger.debug(f"Found artist from relation: {artist_name}")
             
             # Try to extract album name and MBID from relation
             album_name = None
             album_mbid = None
-            album_prop_id = self.songs_properties.get('album')
-            if album_prop_id:
-                album_key = self._get_property_key(album_prop_id, 'songs')
-                if album_key:
-                    album_prop = properties.get(album_key, {})
-                    if album_prop.get('relation'):
-                        # Fetch the album page to get the name and MBID
-                        album_page_id = album_prop['relation'][0]['id'] if album_prop['relation'] else None
-                        if album_page_id:
-                            album_page = self.notion.get_page(album_page_id)
-                            if album_page:
-                                album_props = album_page.get('properties', {})
-                                album_title_key = self._get_property_key(self.albums_properties.get('title'), 'albums')
-                                if album_title_key and album_props.get(album_title_key):
-                                    album_title_prop = album_props[album_title_key]
-                                    if album_title_prop.get('title') and album_title_prop['title']:
-                                        album_name = album_title_prop['title'][0]['plain_text']
-                                        logger.debug(f"Found album from relation: {album_name}")
-                                
-                                # Get album MBID for verification
-                                album_mbid = self._get_mbid_from_related_page(album_page_id, 'albums')
-                                if album_mbid:
-                                    logger.debug(f"Found album MBID from relation: {album_mbid}")
-            
-            # Check for existing MBID
-            mb_id_prop_id = self.songs_properties.get('musicbrainz_id')
-            existing_mbid = None
-            if mb_id_prop_id:
-                mb_id_key = self._get_property_key(mb_id_prop_id, 'songs')
-                if mb_id_key:
-                    mb_id_prop = properties.get(mb_id_key, {})
-                    # MBID is stored as rich_text (UUID string)
-                    if mb_id_prop.get('rich_text') and mb_id_prop['rich_text']:
-                        existing_mbid = mb_id_prop['rich_text'][0]['plain_text']
+            album_key = keys.get('album')
+            if album_key:
+                album_prop = properties.get(album_key, {})
+                if album_prop.get('relation'):
+                    # Fetch the album page to get the name and MBID
+                    album_page = self._get_related_page(album_prop['relation'][0]['id'])
+                    if album_page:
+                        album_name = self._get_page_title(album_page, 'albums')
+                        if album_name:
+                            logger.debug(f"Found album from relation: {album_name}")
+                        
+                        # Get album MBID for verification
+                        album_mbid = self._get_mbid_from_page(album_page, 'albums')
+                        if album_mbid:
+                            logger.debug(f"Found album MBID from relation: {album_mbid}")
             
             # Search or get recording data
             recording_data = None
@@ -2774,10 +2734,6 @@ class NotionMusicBrainzSync:
                 if not recording_data:
                     logger.warning(f"Could not find recording with MBID {existing_mbid}, searching by title")
                     existing_mbid = None
-                elif not force_all:
-                    # Skip pages with existing MBIDs unless force_all is True
-                    logger.info(f"Skipping song '{title}' - already has MBID {existing_mbid} (use --force-all to update)")
-                    return None
             
             if not recording_data:
                 search_results = self.mb.search_recordings(title, artist_name, album_name, limit=20)
@@ -2787,22 +2743,19 @@ class NotionMusicBrainzSync:
                 
                 # Find exact match (word-for-word, case-insensitive, ignoring special characters)
                 # Also verify it appears on the related album if album_mbid is provided
-                best_match = None
-                for result in search_results:
-                    result_title = result.get('title', '')
-                    if not self._titles_match_exactly(title, result_title):
-                        continue
-                    
-                    # If we have an album MBID, verify the recording appears on that album
-                    if album_mbid:
-                        recording_id = result.get('id')
-                        if recording_id and not self._recording_appears_on_album(recording_id, album_mbid):
-                            logger.debug(f"Recording '{result_title}' does not appear on album {album_mbid}, skipping")
-                            continue
-                    
-                    best_match = result
-                    logger.debug(f"Found exact match: '{result_title}' for '{title}'")
-                    break
+                title_words = self._normalize_title_for_matching(title)
+                matches = [result for result in search_results
+                           if self._normalize_title_for_matching(result.get('title', '')) == title_words]
+                if album_mbid and matches:
+                    # One album lookup, then a membership test per candidate
+                    album_recording_ids = self._get_album_recording_ids(album_mbid)
+                    best_match = next((result for result in matches if result.get('id') in album_recording_ids), None)
+                    if not best_match:
+                        logger.debug(f"No recording titled '{title}' appears on album {album_mbid}")
+                else:
+                    best_match = matches[0] if matches else None
+                if best_match:
+                    logger.debug(f"Found exact match: '{best_match.get('title', '')}' for '{title}'")
                 
                 # If no exact match found, warn and skip
                 if not best_match:
@@ -2815,17 +2768,18 @@ class NotionMusicBrainzSync:
                 logger.warning(f"Could not get song data for: {title}")
                 return False
             
-            # Format properties
-            notion_props = self._format_song_properties(recording_data)
+            # Format properties, reusing any listen link already on the page
+            existing_spotify_url = (properties.get(keys.get('listen')) or {}).get('url')
+            notion_props = self._format_song_properties(recording_data, existing_spotify_url)
             
             # Preserve existing relations (merge instead of replace)
             notion_props = self._merge_relations(page, notion_props, 'songs')
             
             # Set icon
-            icon = '🎵'  # Musical note emoji for songs
+            icon = SONG_ICON
             
             # Update the page
-            if self.notion.update_page(page_id, notion_props, None, icon):
+            if self._update_synced_page(page, notion_props, None, icon):
                 logger.info(f"Successfully updated song: {title}")
                 return True
             else:
@@ -2836,67 +2790,59 @@ class NotionMusicBrainzSync:
             logger.error(f"Error syncing song page {page.get('id')}: {e}")
             return False
     
-    def _format_song_properties(self, recording_data: Dict) -> Dict:
-        """Format MusicBrainz recording data for Notion properties."""
+    def _format_song_properties(self, recording_data: Dict, existing_spotify_url: Optional[str] = None) -> Dict:
+        """Format MusicBrainz recording data for Notion properties.
+        
+        existing_spotify_url is the page's current listen link; it is kept instead of
+        searching Spotify again when MusicBrainz has no streaming relation.
+        """
+        if not recording_data:
+            return {}
+        
         properties = {}
+        keys = self.songs_keys
         
         try:
             # Title
-            if recording_data.get('title') and self.songs_properties.get('title'):
-                prop_key = self._get_property_key(self.songs_properties['title'], 'songs')
-                if prop_key:
-                    properties[prop_key] = {
-                        'title': [{'text': {'content': recording_data['title']}}]
-                    }
+            prop_key = keys.get('title')
+            if prop_key and recording_data.get('title'):
+                properties[prop_key] = {
+                    'title': [{'text': {'content': recording_data['title']}}]
+                }
             
             # MusicBrainz ID (store as string in rich_text since MBIDs are UUIDs)
-            if recording_data.get('id') and self.songs_properties.get('musicbrainz_id'):
-                prop_key = self._get_property_key(self.songs_properties['musicbrainz_id'], 'songs')
-                if prop_key:
-                    # Store MBID as string - it's a UUID, not a number
-                    properties[prop_key] = {
-                        'rich_text': [{'text': {'content': recording_data['id']}}]
-                    }
+            prop_key = keys.get('musicbrainz_id')
+            if prop_key and recording_data.get('id'):
+                # Store MBID as string - it's a UUID, not a number
+                properties[prop_key] = {
+                    'rich_text': [{'text': {'content': recording_data['id']}}]
+                }
             
             # Artists (as relations)
-            if recording_data.get('artist-credit') and self.songs_properties.get('artist') and self.artists_db_id:
-                # Extract artist names and MBIDs from artist-credit
-                artist_names = []
-                artist_mbids = []
-                
-                for ac in recording_data.get('artist-credit', []):
-                    if ac.get('artist'):
-                        artist = ac['artist']
-                        artist_name = artist.get('name')
-                        artist_mbid = artist.get('id')
-                        if artist_name:
-                            artist_names.append(artist_name)
-                            if artist_mbid:
-                                artist_mbids.append(artist_mbid)
-                            else:
-                                artist_mbids.append(None)
+            prop_key = keys.get('artist')
+            if prop_key and self.artists_db_id and recording_data.get('artist-credit'):
+                # Extract (name, MBID) pairs from artist-credit
+                artists = [
+                    (ac['artist']['name'], ac['artist'].get('id'))
+                    for ac in recording_data['artist-credit'] if (ac.get('artist') or {}).get('name')
+                ]
                 
-                if artist_names:
-                    # Find or create artist pages and get their IDs
-                    artist_page_ids = []
-                    for i, artist_name in enumerate(artist_names[:5]):  # Limit to 5 artists
-                        artist_mbid = artist_mbids[i] if i < len(artist_mbids) else None
-                        artist_page_id = self._find_or_create_artist_page(artist_name, artist_mbid)
-                        if artist_page_id:
-                            artist_page_ids.append(artist_page_id)
+                if artists:
+                    # Find or create artist pages and get their IDs (limit to 5 artists)
+                    artist_page_ids = self._find_or_create_pages(self._find_or_create_artist_page, artists[:5])
                     
                     if artist_page_ids:
-                        prop_key = self._get_property_key(self.songs_properties['artist'], 'songs')
-                        if prop_key:
-                            properties[prop_key] = {
-                                'relation': [{'id': page_id} for page_id in artist_page_ids]
-                            }
+                        properties[prop_key] = {
+                            'relation': [{'id': pid} for pid in artist_page_ids]
+                        }
             
             # Album (as relation) - get best release based on criteria
             best_release = None  # Initialize for use in genres extraction
-            if recording_data.get('id') and self.songs_properties.get('album') and self.albums_db_id:
+            album_key = keys.get('album')
+            if album_key and self.albums_db_id and recording_data.get('id'):
                 # Get releases from recording data
-                releases = recording_data.get('releases', [])
+                # Copied so search results merged below don't grow the cached recording's list
+                releases = list(recording_data.get('releases', []))
                 
                 # If we have few releases or they don't have complete data, search for more releases
                 # by searching for releases with the same title as the song (and same artist)
@@ -2916,6 +2862,7 @@ class NotionMusicBrainzSync:
                             existing_ids = {r.get('id') for r in releases if r.get('id')}
                             for result in search_results:
                                 if result.get('id') and result['id'] not in existing_ids:
+                                    existing_ids.add(result['id'])
                                     releases.append(result)
                 
                 if releases:
@@ -2937,112 +2884,68 @@ class NotionMusicBrainzSync:
                             # Find or create album page
                             album_page_id = self._find_or_create_album_page(release_title, release_mbid)
                             if album_page_id:
-                                prop_key = self._get_property_key(self.songs_properties['album'], 'songs')
-                                if prop_key:
-                                    properties[prop_key] = {
-                                        'relation': [{'id': album_page_id}]
-                                    }
+                                properties[album_key] = {
+                                    'relation': [{'id': album_page_id}]
+                                }
                         
                         # Extract track number from the best release
                         # Track number is in media -> tracks -> position (for the matching recording)
                         recording_id = recording_data.get('id')
                         if recording_id and best_release.get('media'):
-                            track_number = None
-                            for medium in best_release.get('media', []):
-                                if medium.get('tracks'):
-                                    for track in medium.get('tracks', []):
-                                        if track.get('recording') and track['recording'].get('id') == recording_id:
-                                            # Found the track - get its position
-                                            track_number = track.get('position')
-                                            if track_number:
-                                                break
-                                    if track_number:
-                                        break
+                            track_number = self._get_track_positions(best_release).get(recording_id)
                             
-                            if track_number and self.songs_properties.get('track_number'):
-                                prop_key = self._get_property_key(self.songs_properties['track_number'], 'songs')
-                                if prop_key:
-                                    properties[prop_key] = {'number': int(track_number)}
+                            prop_key = keys.get('track_number')
+                            if prop_key and track_number:
+                                properties[prop_key] = {'number': int(track_number)}
             
             # Length
-            if recording_data.get('length') and self.songs_properties.get('length'):
+            prop_key = keys.get('length')
+            if prop_key and recording_data.get('length'):
                 length_seconds = recording_data['length'] / 1000  # Convert from milliseconds
-                prop_key = self._get_property_key(self.songs_properties['length'], 'songs')
-                if prop_key:
-                    properties[prop_key] = {'number': int(length_seconds)}
+                properties[prop_key] = {'number': int(length_seconds)}
             
             # ISRC
-            if recording_data.get('isrc-list') and self.songs_properties.get('isrc'):
-                isrc = recording_data['isrc-list'][0] if recording_data['isrc-list'] else None
+            prop_key = keys.get('isrc')
+            if prop_key and recording_data.get('isrc-list'):
+                isrc = recording_data['isrc-list'][0]
                 if isrc:
-                    prop_key = self._get_property_key(self.songs_properties['isrc'], 'songs')
-                    if prop_key:
-                        properties[prop_key] = {
-                            'rich_text': [{'text': {'content': isrc}}]
-                        }
-            
-            # Disambiguation
-            if recording_data.get('disambiguation') and self.songs_properties.get('disambiguation'):
-                prop_key = self._get_property_key(self.songs_properties['disambiguation'], 'songs')
-                if prop_key:
                     properties[prop_key] = {
-                        'rich_text': [{'text': {'content': recording_data['disambiguation']}}]
+                        'rich_text': [{'text': {'content': isrc}}]
                     }
             
+            # Disambiguation
+            prop_key = keys.get('disambiguation')
+            if prop_key and recording_data.get('disambiguation'):
+                properties[prop_key] = {
+                    'rich_text': [{'text': {'content': recording_data['disambiguation']}}]
+                }
+            
             # Genres - from the best release's release-group (same as albums)
-            if best_release and best_release.get('release-group') and best_release['release-group'].get('genres') and self.songs_properties.get('genres'):
-                genres = [genre['name'] for genre in best_release['release-group']['genres'] if genre.get('name')]
+            best_release_genres = ((best_release or {}).get('release-group') or {}).get('genres')
+            genre_names = _genre_names(best_release_genres)
+            prop_key = keys.get('genres')
+            if prop_key and best_release_genres:
+                genres = _multi_select(best_release_genres)  # Limit to 10 genres
                 if genres:
-                    prop_key = self._get_property_key(self.songs_properties['genres'], 'songs')
-                    if prop_key:
-                        properties[prop_key] = {
-                            'multi_select': [{'name': genre} for genre in genres[:10]]  # Limit to 10 genres
-                        }
+                    properties[prop_key] = {'multi_select': genres}
             
             # Tags - filter out tags that match genres (genres have priority)
-            if recording_data.get('tags') and self.songs_properties.get('tags'):
-                # Get genre names for comparison (from best_release if available)
-                genre_names = set()
-                if best_release and best_release.get('release-group') and best_release['release-group'].get('genres'):
-                    genre_names = {genre['name'] for genre in best_release['release-group']['genres'] if genre.get('name')}
-                
-                # Filter tags: exclude tags that match genres (genres have priority)
-                tags = []
-                for tag in recording_data['tags']:
-                    tag_name = tag.get('name')
-                    # Only include tags that:
-                    # 1. Have a name
-                    # 2. Are different from genres (genres take priority)
-                    if tag_name and tag_name not in genre_names:
-                        tags.append(tag_name)
-                
+            prop_key = keys.get('tags')
+            if prop_key and recording_data.get('tags'):
+                tags = _multi_select(recording_data['tags'], exclude=genre_names)
                 if tags:
-                    prop_key = self._get_property_key(self.songs_properties['tags'], 'songs')
-                    if prop_key:
-                        properties[prop_key] = {
-                            'multi_select': [{'name': tag} for tag in tags[:10]]
-                        }
+                    properties[prop_key] = {'multi_select': tags}
             
             # Spotify link (from url-rels) - check for both "streaming" and "free streaming"
-            spotify_url = None
-            if recording_data.get('relations') and self.songs_properties.get('listen'):
-                for relation in recording_data.get('relations', []):
-                    relation_type = relation.get('type', '').lower()
-                    # Check for both "streaming" and "free streaming" relation types
-                    if relation_type in ['streaming', 'free streaming']:
-                        url_resource = relation.get('url', {})
-                        if isinstance(url_resource, dict):
-                            url_str = url_resource.get('resource', '')
-                        else:
-                            url_str = str(url_resource)
-                        
-                        # Check if it's a Spotify URL
-                        if url_str and 'spotify' in url_str.lower() and 'spotify.com' in url_str.lower():
-                            spotify_url = url_str
-                            break
+            listen_key = keys.get('listen')
+            spotify_url = _spotify_url_from_relations(recording_data.get('relations')) if listen_key else None
             
-            # If no Spotify link found in MusicBrainz, try searching Spotify directly
-            if not spotify_url and self.songs_properties.get('listen'):
+            # Keep the page's current link rather than searching Spotify again
+            if listen_key and not spotify_url and existing_spotify_url:
+                spotify_url = existing_spotify_url
+            
+            # If no Spotify link found in MusicBrainz or on the page, try searching Spotify directly
+            if listen_key and not spotify_url:
                 song_title = recording_data.get('title', '')
                 artist_name = None
                 # Get artist name from artist-credit
@@ -3056,22 +2959,17 @@ class NotionMusicBrainzSync:
                         logger.debug(f"Found Spotify URL via API search: {spotify_url}")
             
             if spotify_url:
-                prop_key = self._get_property_key(self.songs_properties['listen'], 'songs')
-                if prop_key:
-                    properties[prop_key] = {'url': spotify_url}
+                properties[listen_key] = {'url': spotify_url}
             
             # MusicBrainz URL
-            if recording_data.get('id') and self.songs_properties.get('musicbrainz_url'):
-                mb_url = f"https://musicbrainz.org/recording/{recording_data['id']}"
-                prop_key = self._get_property_key(self.songs_properties['musicbrainz_url'], 'songs')
-                if prop_key:
-                    properties[prop_key] = {'url': mb_url}
+            prop_key = keys.get('musicbrainz_url')
+            if prop_key and recording_data.get('id'):
+                properties[prop_key] = {'url': f"https://musicbrainz.org/recording/{recording_data['id']}"}
             
             # Last updated
-            if self.songs_properties.get('last_updated'):
-                prop_key = self._get_property_key(self.songs_properties['last_updated'], 'songs')
-                if prop_key:
-                    properties[prop_key] = {'date': {'start': datetime.now().isoformat()}}
+            prop_key = keys.get('last_updated')
+            if prop_key:
+                properties[prop_key] = {'date': {'start': self._last_updated_timestamp()}}
             
         except Exception as e:
             logger.error(f"Error formatting song properties: {e}")
@@ -3085,46 +2983,33 @@ class NotionMusicBrainzSync:
             properties = page.get('properties', {})
             
             # Extract title
-            title_prop_id = self.labels_properties.get('title')
-            if not title_prop_id:
-                logger.warning(f"Missing title property for Labels database")
-                return None
-            
-            title_key = self._get_property_key(title_prop_id, 'labels')
+            title_key = self.labels_keys.get('title')
             if not title_key:
-                logger.warning(f"Could not find title property key")
+                logger.warning(f"Missing title property for Labels database")
                 return None
             
-            title_prop = properties.get(title_key, {})
-            if title_prop.get('type') != 'title' or not title_prop.get('title'):
+            title = _first_plain_text(properties, title_key)
+            if not title:
                 logger.warning(f"Missing title for page {page_id}")
                 return None
             
-            title = title_prop['title'][0]['plain_text']
             logger.info(f"Processing label: {title}")
             
             # Check for existing MBID
-            mb_id_prop_id = self.labels_properties.get('musicbrainz_id')
-            existing_mbid = None
-            if mb_id_prop_id:
-                mb_id_key = self._get_property_key(mb_id_prop_id, 'labels')
-                if mb_id_key:
-                    mb_id_prop = properties.get(mb_id_key, {})
-                    # MBID is stored as rich_text (UUID string)
-                    if mb_id_prop.get('rich_text') and mb_id_prop['rich_text']:
-                        existing_mbid = mb_id_prop['rich_text'][0]['plain_text']
+            existing_mbid = self._get_mbid_from_page(page, 'labels')
             
             # Search or get label data
             label_data = None
+            if existing_mbid and not force_all:
+                # Skip pages with existing MBIDs unless force_all is True, before any MusicBrainz request
+                logger.info(f"Skipping label '{title}' - already has MBID {existing_mbid} (use --force-all to update)")
+                return None
+            
             if existing_mbid:
                 label_data = self.mb.get_label(existing_mbid)
                 if not label_data:
                     logger.warning(f"Could not find label with MBID {existing_mbid}, searching by name")
                     existing_mbid = None
-                elif not force_all:
-                    # Skip pages with existing MBIDs unless force_all is True
-                    logger.info(f"Skipping label '{title}' - already has MBID {existing_mbid} (use --force-all to update)")
-                    return None
             
             if not label_data:
                 search_results = self.mb.search_labels(title, limit=5)
@@ -3144,10 +3029,10 @@ class NotionMusicBrainzSync:
             notion_props = self._format_label_properties(label_data)
             
             # Set icon
-            icon = '🏷️'  # Label emoji for labels
+            icon = LABEL_ICON
             
             # Update the page
-            if self.notion.update_page(page_id, notion_props, None, icon):
+            if self._update_synced_page(page, notion_props, None, icon):
                 logger.info(f"Successfully updated label: {title}")
                 return True
             else:
@@ -3160,176 +3045,193 @@ class NotionMusicBrainzSync:
     
     def _format_label_properties(self, label_data: Dict) -> Dict:
         """Format MusicBrainz label data for Notion properties."""
+        if not label_data:
+            return {}
+        
         properties = {}
+        keys = self.labels_keys
         
         try:
+            # Nested sections read by several properties below
+            area = label_data.get('area') or {}
+            life_span = label_data.get('life-span') or {}
+            begin_date = life_span.get('begin')
+            end_date = life_span.get('end')
+            
             # Title (name)
-            if label_data.get('name') and self.labels_properties.get('title'):
-                prop_key = self._get_property_key(self.labels_properties['title'], 'labels')
-                if prop_key:
-                    properties[prop_key] = {
-                        'title': [{'text': {'content': label_data['name']}}]
-                    }
+            prop_key = keys.get('title')
+            if prop_key and label_data.get('name'):
+                properties[prop_key] = {
+                    'title': [{'text': {'content': label_data['name']}}]
+                }
             
             # MusicBrainz ID (store as string in rich_text since MBIDs are UUIDs)
-            if label_data.get('id') and self.labels_properties.get('musicbrainz_id'):
-                prop_key = self._get_property_key(self.labels_properties['musicbrainz_id'], 'labels')
-                if prop_key:
-                    # Store MBID as string - it's a UUID, not a number
-                    properties[prop_key] = {
-                        'rich_text': [{'text': {'content': label_data['id']}}]
-                    }
+            prop_key = keys.get('musicbrainz_id')
+            if prop_key and label_data.get('id'):
+                # Store MBID as string - it's a UUID, not a number
+                properties[prop_key] = {
+                    'rich_text': [{'text': {'content': label_data['id']}}]
+                }
             
             # Type
-            if label_data.get('type') and self.labels_properties.get('type'):
-                prop_key = self._get_property_key(self.labels_properties['type'], 'labels')
-                if prop_key:
-                    properties[prop_key] = {'select': {'name': label_data['type']}}
+            prop_key = keys.get('type')
+            if prop_key and label_data.get('type'):
+                properties[prop_key] = {'select': {'name': label_data['type']}}
             
             # Country
-            if label_data.get('area') and label_data['area'].get('iso-3166-1-code-list'):
-                country_code = label_data['area']['iso-3166-1-code-list'][0]
-                if self.labels_properties.get('country'):
-                    prop_key = self._get_property_key(self.labels_properties['country'], 'labels')
-                    if prop_key:
-                        properties[prop_key] = {'select': {'name': country_code}}
+            prop_key = keys.get('country')
+            if prop_key and area.get('iso-3166-1-code-list'):
+                properties[prop_key] = {'select': {'name': area['iso-3166-1-code-list'][0]}}
             
             # Begin date
-            if label_data.get('life-span') and label_data['life-span'].get('begin'):
-                begin_date = label_data['life-span']['begin']
-                if self.labels_properties.get('begin_date'):
-                    prop_key = self._get_property_key(self.labels_properties['begin_date'], 'labels')
-                    if prop_key:
-                        properties[prop_key] = {'date': {'start': begin_date[:10]}}  # YYYY-MM-DD
+            prop_key = keys.get('begin_date')
+            if prop_key and begin_date:
+                properties[prop_key] = {'date': {'start': begin_date[:10]}}  # YYYY-MM-DD
             
             # End date
-            if label_data.get('life-span') and label_data['life-span'].get('end'):
-                end_date = label_data['life-span']['end']
-                if self.labels_properties.get('end_date'):
-                    prop_key = self._get_property_key(self.labels_properties['end_date'], 'labels')
-                    if prop_key:
-                        properties[prop_key] = {'date': {'start': end_date[:10]}}
+            prop_key = keys.get('end_date')
+            if prop_key and end_date:
+                properties[prop_key] = {'date': {'start': end_date[:10]}}
             
             # Disambiguation
-            if label_data.get('disambiguation') and self.labels_properties.get('disambiguation'):
-                prop_key = self._get_property_key(self.labels_properties['disambiguation'], 'labels')
-                if prop_key:
-                    properties[prop_key] = {
-                        'rich_text': [{'text': {'content': label_data['disambiguation']}}]
-                    }
+            prop_key = keys.get('disambiguation')
+            if prop_key and label_data.get('disambiguation'):
+                properties[prop_key] = {
+                    'rich_text': [{'text': {'content': label_data['disambiguation']}}]
+                }
             
             # Genres
-            if label_data.get('genres') and self.labels_properties.get('genres'):
-                genres = [genre['name'] for genre in label_data['genres'] if genre.get('name')]
+            genre_names = _genre_names(label_data.get('genres'))
+            prop_key = keys.get('genres')
+            if prop_key and label_data.get('genres'):
+                genres = _multi_select(label_data['genres'])  # Limit to 10 genres
                 if genres:
-                    prop_key = self._get_property_key(self.labels_properties['genres'], 'labels')
-                    if prop_key:
-                        properties[prop_key] = {
-                            'multi_select': [{'name': genre} for genre in genres[:10]]  # Limit to 10 genres
-                        }
+                    properties[prop_key] = {'multi_select': genres}
             
             # Tags - filter out tags that match genres (genres have priority)
-            if label_data.get('tags') and self.labels_properties.get('tags'):
-                # Get genre names for comparison
-                genre_names = set()
-                if label_data.get('genres'):
-                    genre_names = {genre['name'] for genre in label_data['genres'] if genre.get('name')}
-                
-                # Filter tags: exclude tags that match genres (genres have priority)
-                tags = []
-                for tag in label_data['tags']:
-                    tag_name = tag.get('name')
-                    # Only include tags that:
-                    # 1. Have a name
-                    # 2. Are different from genres (genres take priority)
-                    if tag_name and tag_name not in genre_names:
-                        tags.append(tag_name)
-                
+            prop_key = keys.get('tags')
+            if prop_key and label_data.get('tags'):
+                tags = _multi_select(label_data['tags'], exclude=genre_names)  # Limit to 10 tags
                 if tags:
-                    prop_key = self._get_property_key(self.labels_properties['tags'], 'labels')
-                    if prop_key:
-                        properties[prop_key] = {
-                            'multi_select': [{'name': tag} for tag in tags[:10]]  # Limit to 10 tags
-                        }
+                    properties[prop_key] = {'multi_select': tags}
             
             # MusicBrainz URL
-            if label_data.get('id') and self.labels_properties.get('musicbrainz_url'):
-                mb_url = f"https://musicbrainz.org/label/{label_data['id']}"
-                prop_key = self._get_property_key(self.labels_properties['musicbrainz_url'], 'labels')
-                if prop_key:
-                    properties[prop_key] = {'url': mb_url}
-            
-            # Extract URLs from url-rels
-            ig_url = None
-            website_url = None
-            bandcamp_url = None
-            
-            if label_data.get('relations'):
-                for relation in label_data['relations']:
-                    relation_type = relation.get('type', '').lower()
-                    url_resource = relation.get('url', {}).get('resource', '').lower()
-                    
-                    # Instagram
-                    if relation_type == 'instagram' or (relation_type == 'social network' and 'instagram' in url_resource):
-                        ig_url = relation.get('url', {}).get('resource')
-                    # Official homepage/website/site
-                    elif (relation_type == 'official homepage' or 
-                          relation_type == 'official website' or 
-                          relation_type == 'official site'):
-                        website_url = relation.get('url', {}).get('resource')
-                    # Bandcamp
-                    elif 'bandcamp' in url_resource:
-                        bandcamp_url = relation.get('url', {}).get('resource')
+            prop_key = keys.get('musicbrainz_url')
+            if prop_key and label_data.get('id'):
+                properties[prop_key] = {'url': f"https://musicbrainz.org/label/{label_data['id']}"}
+            
+            # Extract URLs from url-rels in one pass, keyed by link kind
+            relation_urls = {}
+            
+            for relation in label_data.get('relations') or ():
+                url_resource = relation.get('url', {}).get('resource')
+                if not url_resource:
+                    continue
+                relation_type = relation.get('type', '').lower()
+                
+                # Instagram and official homepage/website/site relations are identified by type
+                if relation_type == 'instagram':
+                    link_kind = 'instagram'
+                elif relation_type in LABEL_WEBSITE_RELATION_TYPES:
+                    link_kind = 'website'
+                else:
+                    url_lower = url_resource.lower()
+                    if relation_type == 'social network' and 'instagram' in url_lower:
+                        link_kind = 'instagram'
+                    elif 'bandcamp' in url_lower:
+                        link_kind = 'bandcamp'
+                    else:
+                        continue
+                
+                relation_urls[link_kind] = url_resource
+            
+            ig_url = relation_urls.get('instagram')
+            website_url = relation_urls.get('website')
+            bandcamp_url = relation_urls.get('bandcamp')
             
             # Official Website Link
-            if website_url and self.labels_properties.get('official_website'):
-                prop_key = self._get_property_key(self.labels_properties['official_website'], 'labels')
-                if prop_key:
-                    properties[prop_key] = {'url': website_url}
+            prop_key = keys.get('official_website')
+            if prop_key and website_url:
+                properties[prop_key] = {'url': website_url}
             
             # IG Link
-            if ig_url and self.labels_properties.get('ig'):
-                prop_key = self._get_property_key(self.labels_properties['ig'], 'labels')
-                if prop_key:
-                    properties[prop_key] = {'url': ig_url}
+            prop_key = keys.get('ig')
+            if prop_key and ig_url:
+                properties[prop_key] = {'url': ig_url}
             
             # Bandcamp Link
-            if bandcamp_url and self.labels_properties.get('bandcamp'):
-                prop_key = self._get_property_key(self.labels_properties['bandcamp'], 'labels')
-                if prop_key:
-                    properties[prop_key] = {'url': bandcamp_url}
+            prop_key = keys.get('bandcamp')
+            if prop_key and bandcamp_url:
+                properties[prop_key] = {'url': bandcamp_url}
             
             # Founded (date from begin date)
-            if label_data.get('life-span') and label_data['life-span'].get('begin') and self.labels_properties.get('founded'):
-                begin_date = label_data['life-span']['begin']
+            prop_key = keys.get('founded')
+            if prop_key and begin_date:
                 # Format as date (YYYY-MM-DD, truncate to 10 chars if longer)
-                prop_key = self._get_property_key(self.labels_properties['founded'], 'labels')
-                if prop_key:
-                    properties[prop_key] = {'date': {'start': begin_date[:10]}}  # YYYY-MM-DD
+                properties[prop_key] = {'date': {'start': begin_date[:10]}}  # YYYY-MM-DD
             
             # Area (relation to Locations database)
-            if label_data.get('area') and label_data['area'].get('name') and self.labels_properties.get('area') and self.locations_db_id:
-                area_name = label_data['area']['name']
-                location_page_id = self._find_or_create_location_page(area_name)
+            prop_key = keys.get('area')
+            if prop_key and self.locations_db_id and area.get('name'):
+                location_page_id = self._find_or_create_location_page(area['name'])
                 if location_page_id:
-                    prop_key = self._get_property_key(self.labels_properties['area'], 'labels')
-                    if prop_key:
-                        properties[prop_key] = {
-                            'relation': [{'id': location_page_id}]
-                        }
+                    properties[prop_key] = {
+                        'relation': [{'id': location_page_id}]
+                    }
             
             # Last updated
-            if self.labels_properties.get('last_updated'):
-                prop_key = self._get_property_key(self.labels_properties['last_updated'], 'labels')
-                if prop_key:
-                    properties[prop_key] = {'date': {'start': datetime.now().isoformat()}}
+            prop_key = keys.get('last_updated')
+            if prop_key:
+                properties[prop_key] = {'date': {'start': self._last_updated_timestamp()}}
             
         except Exception as e:
             logger.error(f"Error formatting label properties: {e}")
         
         return properties
     
-    def run_sync(self, database: str = 'all', force_all: bool = False, last_page: bool = False) -> Dict:
+    def _is_recently_synced(self, db_name: str, page: Dict, max_age_days: float) -> bool:
+        """Check whether a page's Last Updated date is within the last max_age_days days."""
+        last_updated_key = getattr(self, f'{db_name}_keys').get('last_updated')
+        if not last_updated_key:
+            return False
+        
+        date_value = (page.get('properties', {}).get(last_updated_key, {}).get('date') or {}).get('start')
+        if not date_value:
+            return False
+        
+        try:
+            last_updated = datetime.fromisoformat(date_value.replace('Z', '+00:00'))
+        except ValueError:
+            return False
+        if last_updated.tzinfo is None:
+            last_updated = last_updated.replace(tzinfo=timezone.utc)
+        
+        return datetime.now(timezone.utc) - last_updated < timedelta(days=max_age_days)
+    
+    def _sync_page(self, db_name: str, page: Dict, force_all: bool,
+                   max_age_days: Optional[float] = None) -> Optional[bool]:
+        """Sync one page from the named database."""
+        # Skip recently synced pages before any MusicBrainz, Spotify or Notion request
+        if max_age_days is not None and self._is_recently_synced(db_name, page, max_age_days):
+            logger.debug(f"Skipping {db_name} page {page.get('id')} - synced within the last {max_age_days:g} days")
+            return None
+        
+        try:
+            if db_name == 'artists':
+                return self.sync_artist_page(page, force_all)
+            elif db_name == 'albums':
+                return self.sync_album_page(page, force_all)
+            elif db_name == 'songs':
+                return self.sync_song_page(page, force_all)
+            elif db_name == 'labels':
+                return self.sync_label_page(page, force_all)
+            return None
+        finally:
+            # The page may have just been updated, so later pages must re-fetch it
+            self._related_page_cache.pop(page.get('id'), None)
+    
+    def run_sync(self, database: str = 'all', force_all: bool = False, last_page: bool = False,
+                 workers: int = 1, max_age_days: Optional[float] = None) -> Dict:
         """Run the synchronization process for specified database(s)."""
         logger.info(f"Starting Notion-MusicBrainz synchronization (database: {database})")
         
@@ -3337,7 +3239,8 @@ class NotionMusicBrainzSync:
             logger.error(f"Invalid database: {database}. Must be 'artists', 'albums', 'songs', 'labels', or 'all'")
             return {'success': False, 'message': f'Invalid database: {database}'}
         
-        start_time = time.time()
+        start_time = time.monotonic()
+        self._sync_timestamp = datetime.now(timezone.utc).isoformat(timespec='seconds')
         results = {
             'success': True,
             'total_pages': 0,
@@ -3369,23 +3272,34 @@ class NotionMusicBrainzSync:
             
             logger.info(f"Syncing {db_name} database...")
             
-            # Initialize location cache if needed (for artists and labels)
-            if db_name in ['artists', 'labels'] and self.locations_db_id:
-                self._load_locations_cache()
-            
             db_id = getattr(self, f'{db_name}_db_id')
-            pages = self.notion.query_database(db_id)
+            with ThreadPoolExecutor(max_workers=1) as loader:
+                # Initialize location cache if needed (for artists and labels) while the pages load
+                if db_name in ['artists', 'labels'] and self.locations_db_id:
+                    loader.submit(self._load_locations_cache)
+                
+                if last_page:
+                    # Let Notion sort by edit time and fetch just the first page
+                    logger.info(f"Last-page mode: Processing only the most recently edited page in {db_name}")
+                    newest_first = [{'timestamp': 'last_edited_time', 'direction': 'descending'}]
+                    try:
+                        pages = list(islice(self.notion.iter_database(db_id, page_size=1, sorts=newest_first), 1))
+                    except Exception as e:
+                        logger.error(f"Error querying database {db_id}: {e}")
+                        pages = []
+                else:
+                    # Artists, songs and labels that already have an MBID are skipped without
+                    # --force-all, so let Notion leave them out (albums re-check their songs first)
+                    filter_params = None
+                    mb_id_key = getattr(self, f'{db_name}_keys').get('musicbrainz_id')
+                    if mb_id_key and not force_all and db_name != 'albums':
+                        filter_params = {'property': mb_id_key, 'rich_text': {'is_empty': True}}
+                    pages = self.notion.query_database(db_id, filter_params)
             
             if not pages:
                 logger.warning(f"No pages found in {db_name} database")
                 continue
             
-            # Handle last-page mode
-            if last_page:
-                logger.info(f"Last-page mode: Processing only the most recently edited page in {db_name}")
-                pages.sort(key=lambda page: page.get('last_edited_time', ''), reverse=True)
-                pages = pages[:1]
-            
             logger.info(f"Found {len(pages)} pages to process in {db_name}")
             results['total_pages'] += len(pages)
             
@@ -3393,38 +3307,38 @@ class NotionMusicBrainzSync:
             failed = 0
             skipped = 0
             
-            # Process pages (single-threaded due to rate limiting)
-            for i, page in enumerate(pages, 1):
-                try:
-                    if db_name == 'artists':
-                        result = self.sync_artist_page(page, force_all)
-                    elif db_name == 'albums':
-                        result = self.sync_album_page(page, force_all)
-                    elif db_name == 'songs':
-                        result = self.sync_song_page(page, force_all)
-                    elif db_name == 'labels':
-                        result = self.sync_label_page(page, force_all)
-                    else:
-                        result = None
-                    
-                    if result is True:
-                        successful += 1
-                    elif result is False:
+            # Process pages concurrently; the API clients' rate limiters keep
+            # MusicBrainz at 1 request/second and Notion at 3 requests/second
+            with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+                futures = {
+                    executor.submit(self._sync_page, db_name, page, force_all, max_age_days): page
+                    for page in pages
+                }
+                total = len(pages)
+                for i, future in enumerate(as_completed(futures), 1):
+                    page = futures[future]
+                    try:
+                        result = future.result()
+                        
+                        if result is True:
+                            successful += 1
+                        elif result is False:
+                            failed += 1
+                        else:
+                            skipped += 1
+                        
+                        if i % PROGRESS_LOG_INTERVAL == 0 or i == total:
+                            logger.info(f"Completed {db_name} page {i}/{total}")
+                        
+                    except Exception as e:
+                        logger.error(f"Error processing {db_name} page {page.get('id')}: {e}")
                         failed += 1
-                    else:
-                        skipped += 1
-                    
-                    logger.info(f"Completed {db_name} page {i}/{len(pages)}")
-                    
-                except Exception as e:
-                    logger.error(f"Error processing {db_name} page {page.get('id')}: {e}")
-                    failed += 1
             
             results['successful_updates'] += successful
             results['failed_updates'] += failed
             results['skipped_updates'] += skipped
         
-        end_time = time.time()
+        end_time = time.monotonic()
         results['duration'] = end_time - start_time
         
         logger.info(f"Sync completed in {results['duration']:.2f} seconds")
@@ -3479,6 +3393,10 @@ def main():
                            help='Force update all pages, even if they already have an MBID (default: only update pages without MBIDs)')
         parser.add_argument('--last-page', action='store_true',
                            help='Sync only the most recently edited page')
+        parser.add_argument('--workers', type=int, default=4,
+                           help='Number of pages to sync concurrently (default: 4)')
+        parser.add_argument('--max-age', type=float, default=None, metavar='DAYS',
+                           help='Skip pages whose Last Updated date is within this many days, even with --force-all')
         args = parser.parse_args()
         
         logger.info("Starting Notion MusicBrainz Sync")
@@ -3505,7 +3423,9 @@ def main():
         result = sync.run_sync(
             database=args.database,
             force_all=args.force_all,
-            last_page=args.last_page
+            last_page=args.last_page,
+            workers=args.workers,
+            max_age_days=args.max_age
         )
         
         if result['success']: